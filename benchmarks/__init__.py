@@ -0,0 +1,3 @@
+"""
+Performance benchmarks of the game hot paths. Run with: python -m benchmarks.run_benchmarks
+"""
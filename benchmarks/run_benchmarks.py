@@ -0,0 +1,332 @@
+"""
+Benchmarks of the frame update, collision and rendering hot paths.
+
+Every resolution is measured in a separate worker process, because sizes in the settings are computed when the
+settings module is imported. Workers use the SDL dummy video and audio drivers, so no window is opened.
+
+Usage:
+    python -m benchmarks.run_benchmarks --output report.json
+    python -m benchmarks.run_benchmarks --baseline report.json
+    python -m benchmarks.run_benchmarks --scenarios stress --ball-physics vectorized
+
+The report maps '<resolution>/<scenario>/<metric>' to percentile timings in microseconds.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from pathlib import Path
+from typing import Callable
+
+METRICS = ('sprite_manager.update', 'ball.handle_collisions', 'sprite_manager.draw_all', 'game.draw_graphics')
+DEFAULT_RESOLUTIONS = ('1366x768', '2560x1440')
+# Scenarios are rebuilt after this many physics steps, so balls lost and blocks destroyed do not change
+# the measured workload too much.
+STEPS_PER_SCENARIO = 120
+# p50 slower than the baseline by more than this fraction is reported as a regression.
+DEFAULT_THRESHOLD = 0.15
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """
+    Get the percentile of the samples with linear interpolation between the closest ranks.
+
+    Args:
+        samples (list[float]): Sorted samples.
+        fraction (float): The percentile as a fraction in range [0, 1].
+
+    Returns:
+        float: The percentile.
+    """
+    position = (len(samples) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(samples) - 1)
+    return samples[lower] + (samples[upper] - samples[lower]) * (position - lower)
+
+
+def summarize(samples_ns: list[int]) -> dict:
+    """
+    Get the percentile timings of the samples.
+
+    Args:
+        samples_ns (list[int]): Timings in nanoseconds.
+
+    Returns:
+        dict: Number of samples and mean, min, p50, p90, p99 and max timings in microseconds.
+    """
+    samples = sorted(sample / 1000 for sample in samples_ns)
+    return {
+        'samples': len(samples),
+        'mean_us': sum(samples) / len(samples),
+        'min_us': samples[0],
+        'p50_us': percentile(samples, 0.5),
+        'p90_us': percentile(samples, 0.9),
+        'p99_us': percentile(samples, 0.99),
+        'max_us': samples[-1],
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """
+    Compare the p50 timings of the report with the baseline.
+
+    Args:
+        report (dict): The current report.
+        baseline (dict): The saved report.
+        threshold (float): Allowed slowdown as a fraction of the baseline. Defaults to DEFAULT_THRESHOLD.
+
+    Returns:
+        list[dict]: Comparison of every benchmark present in both reports, with the 'regression' flag set
+            if the benchmark is slower than allowed.
+    """
+    comparison = []
+    for name, result in report['results'].items():
+        baseline_result = baseline['results'].get(name)
+        if baseline_result is None:
+            continue
+        ratio = result['p50_us'] / baseline_result['p50_us'] if baseline_result['p50_us'] > 0 else 1.0
+        comparison.append({
+            'name': name,
+            'baseline_p50_us': baseline_result['p50_us'],
+            'p50_us': result['p50_us'],
+            'ratio': ratio,
+            'regression': ratio > 1 + threshold
+        })
+    return comparison
+
+
+def time_calls(function: Callable, samples_ns: list[int]) -> Callable:
+    """
+    Wrap the function, so the duration of every call is appended to the samples.
+
+    Args:
+        function (Callable): The function to time.
+        samples_ns (list[int]): List collecting timings in nanoseconds.
+
+    Returns:
+        Callable: The wrapped function.
+    """
+    def timed(*args, **kwargs):
+        start = time.perf_counter_ns()
+        result = function(*args, **kwargs)
+        samples_ns.append(time.perf_counter_ns() - start)
+        return result
+    return timed
+
+
+def run_worker(steps: int, warmup: int, scenarios: [None, list[str]] = None) -> dict:  # pylint: disable=R0914
+    """
+    Measure the scenarios at the resolution of the current process.
+
+    Args:
+        steps (int): Number of measured physics steps or frames per scenario and metric.
+        warmup (int): Number of steps done before measuring.
+        scenarios (None, list[str]): Names of the scenarios to measure. Defaults to None. If None, all SCENARIOS
+            are measured.
+
+    Returns:
+        dict: Results of the resolution.
+    """
+    # The game is imported here, so the resolution and SDL drivers are set before the settings are loaded.
+    import pygame  # pylint: disable=C0415
+    from unittest import mock  # pylint: disable=C0415
+
+    from benchmarks.scenarios import SCENARIOS, build_scenario, get_autopilot_inputs  # pylint: disable=C0415
+    from breakout_game.config import settings  # pylint: disable=C0415
+    from breakout_game.main import Game  # pylint: disable=C0415
+    from breakout_game.sprites.sprite import Ball  # pylint: disable=C0415
+
+    pygame.init()  # pylint: disable=E1101
+    game = Game()
+    game.main_menu.active = False
+    game.set_level_background()
+
+    def measure(scenario: str, metric: str, samples_ns: list[int]):
+        done = 0
+        while done < steps + warmup:
+            sprite_manager = build_scenario(scenario)
+            sprite_manager.set_background(game.background)
+            game.sprite_manager = sprite_manager
+            game.renderer.invalidate()
+            for _ in range(min(STEPS_PER_SCENARIO, steps + warmup - done)):
+                if done == warmup:
+                    # Timings of the wrapped Ball.handle_collisions collected during the warmup are dropped.
+                    samples_ns.clear()
+                inputs = get_autopilot_inputs(sprite_manager)
+                duration = 0
+                if metric == 'sprite_manager.update':
+                    start = time.perf_counter_ns()
+                    sprite_manager.update(settings.PHYSICS_TIME_STEP, inputs)
+                    duration = time.perf_counter_ns() - start
+                else:
+                    sprite_manager.update(settings.PHYSICS_TIME_STEP, inputs)
+                if metric == 'sprite_manager.draw_all':
+                    start = time.perf_counter_ns()
+                    sprite_manager.draw_all(game.display_surface)
+                    duration = time.perf_counter_ns() - start
+                elif metric == 'game.draw_graphics':
+                    start = time.perf_counter_ns()
+                    game.draw_graphics([])
+                    duration = time.perf_counter_ns() - start
+                if done >= warmup and metric != 'ball.handle_collisions':
+                    samples_ns.append(duration)
+                done += 1
+
+    results = {}
+    for scenario in scenarios or SCENARIOS:
+        for metric in METRICS:
+            samples_ns = []
+            if metric == 'ball.handle_collisions':
+                with mock.patch.object(Ball, 'handle_collisions', time_calls(Ball.handle_collisions, samples_ns)):
+                    measure(scenario, metric, samples_ns)
+            else:
+                measure(scenario, metric, samples_ns)
+            if len(samples_ns) > 0:
+                results[f'{settings.WINDOW_WIDTH}x{settings.WINDOW_HEIGHT}/{scenario}/{metric}'] = summarize(
+                    samples_ns
+                )
+    return results
+
+
+def run_resolution(resolution: str, steps: int, warmup: int, scenarios: [None, list[str]] = None,
+                   ball_physics: [None, str] = None) -> dict:
+    """
+    Run the worker process of the resolution.
+
+    Args:
+        resolution (str): Key of settings.RESOLUTIONS.
+        steps (int): Number of measured steps per scenario and metric.
+        warmup (int): Number of steps done before measuring.
+        scenarios (None, list[str]): Names of the scenarios to measure. Defaults to None. If None, all scenarios
+            are measured.
+        ball_physics (None, str): The ball physics of the worker, see settings.BALL_PHYSICS. Defaults to None.
+            If None, the default of the settings is used.
+
+    Returns:
+        dict: Results of the resolution.
+
+    Raises:
+        RuntimeError: If the worker fails or prints no results. The message contains the stderr of the worker.
+    """
+    environment = dict(
+        os.environ,
+        BREAKOUT_RESOLUTION=resolution,
+        SDL_VIDEODRIVER='dummy',
+        SDL_AUDIODRIVER='dummy',
+        PYGAME_HIDE_SUPPORT_PROMPT='1'
+    )
+    if ball_physics is not None:
+        environment['BREAKOUT_BALL_PHYSICS'] = ball_physics
+    arguments = ['--worker', '--steps', str(steps), '--warmup', str(warmup)]
+    if scenarios:
+        arguments += ['--scenarios', *scenarios]
+    completed = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.run_benchmarks', *arguments],
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=Path(__file__).resolve().parent.parent
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f'Benchmark worker of resolution {resolution} failed with exit code {completed.returncode}:\n'
+            f'{completed.stderr}'
+        )
+    lines = completed.stdout.splitlines()
+    if len(lines) == 0:
+        raise RuntimeError(f'Benchmark worker of resolution {resolution} printed no results:\n{completed.stderr}')
+    return json.loads(lines[-1])
+
+
+def print_report(report: dict, comparison: [None, list[dict]] = None):
+    """
+    Print the report as a table.
+
+    Args:
+        report (dict): The report.
+        comparison (None, list[dict]): Comparison with the baseline. Defaults to None.
+    """
+    ratios = {item['name']: item for item in comparison or []}
+    print(f'{"benchmark":<60}{"p50 us":>12}{"p90 us":>12}{"p99 us":>12}{"vs base":>10}')
+    for name, result in report['results'].items():
+        item = ratios.get(name)
+        change = f'{item["ratio"]:.2f}x' if item else '-'
+        if item and item['regression']:
+            change += ' !'
+        print(f'{name:<60}{result["p50_us"]:>12.1f}{result["p90_us"]:>12.1f}{result["p99_us"]:>12.1f}{change:>10}')
+
+
+def main(argv: [None, list[str]] = None) -> int:
+    """
+    Run the benchmarks.
+
+    Args:
+        argv (None, list[str]): Command line arguments. Defaults to None. If None, sys.argv is used.
+
+    Returns:
+        int: Exit code. 1 if a regression against the baseline was found, else 0.
+    """
+    parser = argparse.ArgumentParser(description='Breakout benchmarks')
+    parser.add_argument('--resolutions', nargs='+', default=list(DEFAULT_RESOLUTIONS),
+                        help='keys of settings.RESOLUTIONS to measure')
+    parser.add_argument('--steps', type=int, default=600, help='measured steps per scenario and metric')
+    parser.add_argument('--warmup', type=int, default=60, help='steps done before measuring')
+    parser.add_argument('--scenarios', nargs='+', help='names of the scenarios to measure, all by default')
+    parser.add_argument('--ball-physics', choices=('sprites', 'vectorized'),
+                        help='ball physics of the workers, see settings.BALL_PHYSICS')
+    parser.add_argument('--output', metavar='PATH', help='save the JSON report to the file')
+    parser.add_argument('--baseline', metavar='PATH', help='compare with the saved JSON report')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed p50 slowdown as a fraction of the baseline')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.steps, args.warmup, args.scenarios)))
+        return 0
+
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    import pygame  # pylint: disable=C0415
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'steps': args.steps,
+            'warmup': args.warmup,
+            'ball_physics': args.ball_physics or 'default',
+        },
+        'results': {}
+    }
+    for resolution in args.resolutions:
+        report['results'].update(
+            run_resolution(resolution, args.steps, args.warmup, args.scenarios, args.ball_physics)
+        )
+
+    comparison = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            comparison = compare(report, json.load(file), args.threshold)
+        report['comparison'] = comparison
+
+    print_report(report, comparison)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+
+    if comparison and any(item['regression'] for item in comparison):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
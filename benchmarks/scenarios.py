@@ -0,0 +1,145 @@
+"""
+Scripted scenarios of the benchmarks. Each scenario builds a SpriteManager in a reproducible state.
+"""
+from __future__ import annotations
+
+import math
+
+from unittest import mock
+
+import pygame
+
+from breakout_game.config import settings
+from breakout_game.simulation import InputState
+from breakout_game.sprites import SpriteManager
+from breakout_game.utils.game_clock import GameClock
+
+# Rows of the block map filled in the 'full-map' scenario. The rest of the window is left for balls and paddle.
+FULL_MAP_ROWS = 10
+FULL_MAP_LEVEL = settings.LAST_LEVEL
+# Number of times multiply-balls is activated. One ball gives 3, 9 and 27 balls.
+MULTIPLY_BALLS_TIMES = 3
+# Powerups activated in the 'all-powerups' scenario. Conflicting powerups replace each other,
+# so only one of each pair is activated.
+TIMED_POWERUPS = ('big-ball', 'fast-ball', 'super-ball', 'big-paddle')
+# Number of balls in the 'stress' scenario, far more than multiply-balls can create.
+STRESS_BALLS = 1024
+
+SCENARIOS = ('level', 'full-map', 'multi-ball', 'all-powerups', 'stress')
+
+
+def get_full_block_map() -> list[str]:
+    """
+    Get the block map with the first FULL_MAP_ROWS rows filled.
+
+    Returns:
+        list[str]: The block map of the same size as settings.BLOCK_MAP.
+    """
+    columns = len(settings.BLOCK_MAP[0])
+    return [
+        '1' * columns if row_index < FULL_MAP_ROWS else ' ' * columns
+        for row_index in range(len(settings.BLOCK_MAP))
+    ]
+
+
+def launch_balls(sprite_manager: SpriteManager):
+    """
+    Launch all balls upwards with a spread of angles, so they do not move along the same path.
+
+    Args:
+        sprite_manager (SpriteManager): The sprite manager of the scenario.
+    """
+    balls = sprite_manager.ball_sprites_group.sprites()
+    for index, ball in enumerate(balls):
+        angle = math.radians(-150 + 120 * (index + 0.5) / len(balls))
+        ball.set_direction_from_angle(angle)
+        ball.active = True
+
+
+def create_stress_balls(sprite_manager: SpriteManager):
+    """
+    Create STRESS_BALLS balls on a grid between the blocks and the paddle.
+
+    Args:
+        sprite_manager (SpriteManager): The sprite manager of the scenario.
+    """
+    columns = 64
+    rows = math.ceil(STRESS_BALLS / columns)
+    top = FULL_MAP_ROWS * (settings.BLOCK_HEIGHT + settings.GAP_SIZE) + settings.WINDOW_WIDTH / 40
+    bottom = sprite_manager.player.rect.top - settings.WINDOW_WIDTH / 40
+    for index in range(STRESS_BALLS):
+        row, column = divmod(index, columns)
+        midbottom = (
+            round((column + 0.5) * settings.GAME_WINDOW_WIDTH / columns),
+            round(top + (row + 1) * (bottom - top) / rows)
+        )
+        sprite_manager.create_ball(midbottom=midbottom)
+
+
+def build_scenario(name: str, seed: int = 0) -> SpriteManager:
+    """
+    Build the sprite manager of the scenario.
+
+    Scenarios:
+        'level' - the first level with one ball.
+        'full-map' - the full block map of the last level with one ball.
+        'multi-ball' - the full block map with 27 balls after multiply-balls.
+        'all-powerups' - 'multi-ball' with all timed powerups active and one falling powerup of each kind.
+        'stress' - the full block map with STRESS_BALLS balls, see settings.BALL_PHYSICS.
+
+    Args:
+        name (str): Name of the scenario. Must be one of SCENARIOS.
+        seed (int): Seed of the random generator of the sprite manager. Defaults to 0.
+
+    Returns:
+        SpriteManager: The sprite manager with the level initialized and balls launched.
+    """
+    if name not in SCENARIOS:
+        raise ValueError(f'Unknown scenario {name}.')
+
+    sprite_manager = SpriteManager(clock=GameClock(), seed=seed)
+    if name == 'level':
+        sprite_manager.init_level()
+    else:
+        with mock.patch.object(settings, 'BLOCK_MAP', get_full_block_map()):
+            sprite_manager.init_level(level_number=FULL_MAP_LEVEL)
+
+    if name in ('multi-ball', 'all-powerups'):
+        for _ in range(MULTIPLY_BALLS_TIMES):
+            sprite_manager.powerup_manager.activate_powerup('multiply-balls')
+
+    if name == 'all-powerups':
+        for power in TIMED_POWERUPS:
+            sprite_manager.powerup_manager.activate_powerup(power)
+            sprite_manager.create_powerup_timer_info(power, settings.POWERS[power]['time'])
+        for index, power in enumerate(settings.POWERS):
+            center = ((index + 1) * settings.GAME_WINDOW_WIDTH // (len(settings.POWERS) + 1), 0)
+            sprite_manager.create_powerup(center, power)
+
+    if name == 'stress':
+        create_stress_balls(sprite_manager)
+
+    launch_balls(sprite_manager)
+    return sprite_manager
+
+
+def get_autopilot_inputs(sprite_manager: SpriteManager) -> InputState:
+    """
+    Get the keys which move the paddle under the lowest ball, so balls stay in the game longer.
+
+    Args:
+        sprite_manager (SpriteManager): The sprite manager of the scenario.
+
+    Returns:
+        InputState: Keys pressed.
+    """
+    balls = sprite_manager.ball_sprites_group.sprites()
+    if len(balls) == 0:
+        return InputState()
+    target_x = max(balls, key=lambda ball: ball.rect.bottom).rect.centerx
+    player_x = sprite_manager.player.rect.centerx
+    if target_x < player_x - sprite_manager.player.rect.width // 4:
+        return InputState([pygame.K_LEFT])  # pylint: disable=E1101
+    if target_x > player_x + sprite_manager.player.rect.width // 4:
+        return InputState([pygame.K_RIGHT])  # pylint: disable=E1101
+    return InputState()
@@ -2,5 +2,5 @@
 Breakout game package
 
 """
-from breakout_game import log, sprites, screens, utils
+from breakout_game import log, sprites, screens, utils, simulation
 from breakout_game.main import start
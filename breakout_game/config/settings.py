@@ -1,6 +1,7 @@
 """
 Settings file. Edit with caution.
 """
+import os
 
 from breakout_game.utils import path_utils
 
@@ -52,9 +53,32 @@ RESOLUTIONS = {
     },
 }
 
-# Change this if needed:
-SELECTED_RESOLUTION = RESOLUTIONS['1366x768']
+# Change this if needed. Can be overridden with the BREAKOUT_RESOLUTION environment variable, e.g. '2560x1440'.
+SELECTED_RESOLUTION = RESOLUTIONS[os.environ.get('BREAKOUT_RESOLUTION', '1366x768')]
 FPS = 60
+# Static menus are drawn with IDLE_FPS after they did not change for IDLE_DELAY seconds, so the fade-in of menus
+# is finished at full rate. Input wakes the game loop immediately.
+IDLE_FPS = 10
+IDLE_DELAY = 1.0
+# Backgrounds scaled to the window are cached in this directory as raw pixels, keyed by the hash of the source image,
+# the resolution and the transform. Can be overridden with the BREAKOUT_CACHE_DIR environment variable, an empty value
+# disables the cache.
+DERIVED_CACHE_DIR = os.environ.get('BREAKOUT_CACHE_DIR', str(path_utils.base_path / 'cache')) or None
+
+# The frame pacer sleeps until this time in seconds before the end of the frame and spins for the rest.
+FRAME_SPIN_TIME = 0.002
+
+# Physics runs with a fixed time step independent of FPS. Drawing interpolates between physics steps.
+PHYSICS_TICK_RATE = 120
+PHYSICS_TIME_STEP = 1 / PHYSICS_TICK_RATE
+# Longer frames (e.g. after the window was dragged) are cut to this time in seconds, so the physics catches up.
+MAX_FRAME_TIME = 0.25
+
+# How the game screen is drawn:
+# 'dirty' - only regions changed since the previous frame are redrawn and passed to pygame.display.update.
+# 'full' - the background and all sprites are drawn and the whole display is updated every frame.
+# Menus are always drawn in full.
+RENDER_MODE = 'dirty'
 
 WINDOW_WIDTH = SELECTED_RESOLUTION['window-width']
 WINDOW_HEIGHT = SELECTED_RESOLUTION['window-height']
@@ -85,6 +109,21 @@ DEFAULT_PADDLE_SPEED = DEFAULT_PADDLE_SPEED_BASE * SPEED_COEFFICIENT
 DEFAULT_BALL_SPEED = DEFAULT_BALL_SPEED_PER_BASE * SPEED_COEFFICIENT
 DEFAULT_POWERUP_SPEED = DEFAULT_POWERUP_SPEED_PER_BASE * SPEED_COEFFICIENT
 
+# COLLISIONS
+
+# How collisions of balls are detected:
+# 'discrete' - the ball is moved by the whole frame step and then checked for overlapping.
+# 'swept' - the earliest time of impact along the movement is found, so fast balls do not pass through objects.
+BALL_COLLISION_MODE = 'discrete'
+# Maximum amount of bounces of a ball resolved in one frame in the 'swept' mode.
+MAX_BOUNCES_PER_FRAME = 8
+# How balls are updated:
+# 'sprites' - every ball sprite is updated on its own.
+# 'vectorized' - balls are moved and checked in batch with NumPy, only balls which may hit something are updated
+# on their own. Falls back to 'sprites' if NumPy is not installed.
+# Can be overridden with the BREAKOUT_BALL_PHYSICS environment variable.
+BALL_PHYSICS = os.environ.get('BREAKOUT_BALL_PHYSICS', 'sprites')
+
 # BLOCKS
 
 # Each number represent the health of a block.
@@ -131,6 +170,13 @@ BALL_SIZE_DURATION = 15
 BALL_STRENGTH_DURATION = 20
 PADDLE_SIZE_DURATION = 15
 
+# multiply-balls does not create more than MAX_BALLS balls.
+MAX_BALLS = 4096
+# Share of time the update of balls may take. multiply-balls does not create more balls than fit into the budget
+# according to the measured update time per ball. Recorded and replayed sessions use only MAX_BALLS, so replays
+# stay frame-exact.
+BALL_FRAME_BUDGET = 0.25
+
 POWERS = {
     'add-life': {
         'probability': 0.1,
@@ -188,5 +234,32 @@ POWERS = {
     },
 }
 
+# SOUNDS
+# Sound effects played through the sound bank: path and volume by name. None keeps the volume of the file.
+SOUND_EFFECTS = {
+    'hit-block': (path_utils.get_asset_path('sounds/hit blocks.mp3'), 0.25),
+    'break-block': (path_utils.get_asset_path('sounds/break blocks.mp3'), 0.75),
+    'hit-paddle': (path_utils.get_asset_path('sounds/hit paddle.mp3'), None),
+    'get-powerup': (path_utils.get_asset_path('sounds/get powerup.mp3'), 0.3),
+    'lost-hp': (path_utils.get_asset_path('sounds/lost_hp.mp3'), None),
+}
+# Number of mixer channels reserved for sound effects. A new effect stops the oldest one if all are busy.
+SOUND_CHANNELS = 4
+# Maximum number of different effects started per frame, the rest is dropped.
+SOUND_PLAYS_PER_FRAME = 4
+
 # HEALTH
 MAX_PLAYER_HEALTH = 3
+
+# LOGGING
+# Level of the game logger. Can be overridden with the BREAKOUT_LOG_LEVEL environment variable, e.g. 'WARNING'.
+LOG_LEVEL = os.environ.get('BREAKOUT_LOG_LEVEL', 'DEBUG')
+# The log file is rotated when it exceeds this size in bytes. LOG_BACKUP_COUNT old files are kept.
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# LEVELS
+# The number of the last level. The backgrounds images/background/level-N.jpg for levels 0 to LAST_LEVEL must be
+# present in assets. Game also loads the music sounds/level-N.mp3 when a level starts. It is not shipped for every
+# level and must be added before Game can play those levels.
+LAST_LEVEL = 6
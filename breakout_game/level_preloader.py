@@ -0,0 +1,208 @@
+"""
+Loading of level assets on a worker thread while a menu is shown.
+
+The background and the music of the next level are prepared in the background and handed over to the game at once
+when the level starts. If they are not ready, the game waits for the worker or loads them on the main thread.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+from pathlib import Path
+from typing import Callable
+
+import pygame
+
+from breakout_game import log
+from breakout_game.config import settings
+from breakout_game.utils import path_utils
+from breakout_game.utils.asset_cache import AssetCache
+from breakout_game.utils.derived_cache import derived_cache
+
+game_logger = log.game_logger
+
+
+class LevelAssets:
+    """
+    Assets of a level prepared for the start of the level.
+
+    Attributes:
+        level (int): The level of the assets.
+        background (pygame.Surface): The background scaled to cover the window and darkened. Not converted to the
+            display format, as the display must only be used by the main thread.
+        music (bytes): Content of the music file of the level.
+
+    Args:
+        level (int): The level of the assets.
+        background (pygame.Surface): The prepared background.
+        music (bytes): Content of the music file.
+    """
+    def __init__(self, level: int, background: pygame.Surface, music: bytes):
+        self.level: int = level
+        self.background: pygame.Surface = background
+        self.music: bytes = music
+
+
+def build_level_background(image: pygame.Surface) -> pygame.Surface:
+    """
+    Scale the image to cover the window and subtract RGB(125, 125, 125) color to make it darker for a better gaming
+    experience.
+
+    Note:
+        The color is subtracted after scaling. The scaling is not smoothed, so the result is the same as if the color
+        was subtracted first.
+
+    Args:
+        image (pygame.Surface): The background image of the level. Left untouched.
+
+    Returns:
+        pygame.Surface: The background.
+    """
+    scale_factor = max([
+        settings.WINDOW_HEIGHT / image.get_height(),
+        settings.WINDOW_WIDTH / image.get_width()
+    ])
+    scaled_size = (image.get_width() * scale_factor, image.get_height() * scale_factor)
+    background = pygame.transform.scale(image, scaled_size)
+    background.fill((125, 125, 125), special_flags=pygame.BLEND_RGB_SUB)  # pylint: disable=E1101
+    return background
+
+
+def load_level_assets(level: int, report_progress: [None, Callable[[float], None]] = None) -> LevelAssets:
+    """
+    Load and prepare the assets of the level. The background is taken from the derived cache if it was built for
+    the resolution before.
+
+    Note:
+        Safe to call from a worker thread: assets are loaded through a private asset cache and nothing is converted
+        to the display format.
+
+    Args:
+        level (int): The level. Backgrounds and music of the level must be present in assets.
+        report_progress (None, Callable[[float], None]): Called with the share of work done after every step.
+            Defaults to None.
+
+    Returns:
+        LevelAssets: The prepared assets.
+    """
+    cache = AssetCache()
+
+    background_path = path_utils.get_asset_path(f'images/background/level-{level}.jpg')
+    background = derived_cache.get_surface(
+        background_path,
+        (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT),
+        'cover-darken',
+        lambda: build_level_background(cache.load_image(background_path, convert_mode=None))
+    )
+    if report_progress is not None:
+        report_progress(1 / 2)
+
+    music = Path(path_utils.get_asset_path(f'sounds/level-{level}.mp3')).read_bytes()
+    if report_progress is not None:
+        report_progress(1)
+    return LevelAssets(level, background, music)
+
+
+class LevelPreloader:
+    """
+    Loader of the assets of the next level on a worker thread.
+
+    The worker stores the assets only when all of them are ready, and take() hands them over under a lock, so the
+    game never sees half-loaded assets. Only one worker runs at a time. Failures of the worker are logged once and
+    the level is not loaded again until take() is called for it, which loads the assets on the main thread instead.
+
+    Attributes:
+        level (None, int): The level being loaded or loaded last. Defaults to None.
+        failed_level (None, int): The level whose loading failed last. Defaults to None.
+        progress (float): Share of the assets of the level loaded by the worker, in range [0, 1]. Defaults to 0.
+
+    version: 1
+    """
+    def __init__(self):
+        self.level: [None, int] = None
+        self.failed_level: [None, int] = None
+        self.progress: float = 0
+
+        self._lock: threading.Lock = threading.Lock()
+        self._thread: [None, threading.Thread] = None
+        self._assets: [None, LevelAssets] = None
+
+    def start(self, level: int):
+        """
+        Start loading the assets of the level on a worker thread. Does nothing if the level is already loaded or
+        being loaded, if its loading failed, or if a worker for another level is still running.
+
+        Args:
+            level (int): The level to load.
+        """
+        if self.level == level or self.failed_level == level or self.is_loading():
+            return
+        with self._lock:
+            self._assets = None
+            self.level = level
+            self.progress = 0
+        self._thread = threading.Thread(target=self._load, args=(level,), name=f'level-{level}-preloader', daemon=True)
+        self._thread.start()
+        game_logger.debug('Preloading assets of level %s', level)
+
+    def is_loading(self) -> bool:
+        """
+        Check whether the worker is running.
+
+        Returns:
+            bool: True if the worker is running.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def _load(self, level: int):
+        """
+        Load the assets of the level. Runs on the worker thread.
+
+        Args:
+            level (int): The level to load.
+        """
+        start_time = time.perf_counter()
+        try:
+            assets = load_level_assets(level, self._set_progress)
+        except Exception:  # pylint: disable=W0718
+            game_logger.exception('Preloading assets of level %s failed', level)
+            with self._lock:
+                self.level = None
+                self.failed_level = level
+            return
+        with self._lock:
+            self._assets = assets
+        game_logger.debug('Assets of level %s preloaded in %.1f ms', level, (time.perf_counter() - start_time) * 1000)
+
+    def _set_progress(self, progress: float):
+        """
+        Store the progress of the worker.
+
+        Args:
+            progress (float): Share of the assets loaded.
+        """
+        self.progress = progress
+
+    def take(self, level: int) -> LevelAssets:
+        """
+        Hand over the assets of the level. Waits for the worker if it is loading the level. The assets are loaded
+        on the calling thread if they were not preloaded.
+
+        Args:
+            level (int): The level to start.
+
+        Returns:
+            LevelAssets: The assets of the level. Each preloaded result is handed over only once.
+        """
+        if self.level == level and self.is_loading():
+            self._thread.join()
+        with self._lock:
+            assets, self._assets = self._assets, None
+            self.level = None
+            self.failed_level = None
+            self.progress = 0
+        if assets is not None and assets.level == level:
+            return assets
+        game_logger.debug('Assets of level %s were not preloaded, loading them synchronously', level)
+        return load_level_assets(level)
@@ -1,24 +1,45 @@
 """
 Logging configuration
+
+Records are put into a queue by the handler of the root logger, so logging never blocks the game loop.
+A background thread takes the records from the queue in batches and passes them to the file and stream handlers.
+The log file is kept open, rotated when it gets too big and flushed once per batch.
 """
+import atexit
 import logging
 import logging.config
+import logging.handlers
+import queue
+import threading
 
 from logging import LogRecord
 
+from breakout_game.config import settings
 from breakout_game.utils.path_utils import base_path
 
 
 logging.config.dictConfig({'version': 1, 'disable_existing_loggers': True})
 _log_file_path = base_path.joinpath('log', 'breakout_game.log')
+_log_queue = queue.SimpleQueue()
 
 
-class _FileHandler(logging.Handler):
+class _FileHandler(logging.handlers.RotatingFileHandler):
     """
-    Log to file handler
+    Log to file handler. The file is kept open and rotated when it exceeds settings.LOG_MAX_BYTES.
+    Records are not flushed one by one, _BatchQueueListener flushes the file after every batch.
+
+    Args:
+        path (str, Path): Path of the log file. Defaults to breakout_game/log/breakout_game.log.
     """
-    def __init__(self):
-        logging.Handler.__init__(self)
+    def __init__(self, path=_log_file_path):
+        logging.handlers.RotatingFileHandler.__init__(
+            self,
+            path,
+            maxBytes=settings.LOG_MAX_BYTES,
+            backupCount=settings.LOG_BACKUP_COUNT,
+            encoding='utf-8',
+            delay=True
+        )
 
     def emit(self, record: LogRecord):
         """
@@ -27,53 +48,108 @@ class _FileHandler(logging.Handler):
         Args:
             record (LogRecord): message to log
         """
-        message = self.format(record)
-        with open(_log_file_path, 'a', encoding='utf-8') as file:
-            file.write(message + '\n')
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:  # pylint: disable=W0718
+            self.handleError(record)
+
+
+class _BatchQueueListener:
+    """
+    Background thread passing queued records to the handlers. All records waiting in the queue are handled as one
+    batch, then the handlers are flushed.
+
+    Args:
+        log_queue (queue.SimpleQueue): Queue filled by the QueueHandler of the root logger.
+        handlers (logging.Handler): Handlers to pass records to.
+        batch_size (int): Maximum number of records handled before flushing. Defaults to 256.
+    """
+    _STOP = None
+
+    def __init__(self, log_queue: queue.SimpleQueue, *handlers: logging.Handler, batch_size: int = 256):
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self._thread = None
+
+    def start(self):
+        """
+        Start the background thread.
+        """
+        self._thread = threading.Thread(target=self._run, name='log-writer', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Handle the remaining records and stop the background thread.
+        """
+        if self._thread is not None:
+            self.queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
 
+    def _run(self):
+        stopped = False
+        while not stopped:
+            records = [self.queue.get()]
+            while len(records) < self.batch_size:
+                try:
+                    records.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for record in records:
+                if record is self._STOP:
+                    stopped = True
+                    continue
+                for handler in self.handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+            for handler in self.handlers:
+                # The same as logging.shutdown, e.g. the stream may be already closed at exit
+                try:
+                    handler.flush()
+                except (OSError, ValueError):
+                    pass
+
+
+_file_handler = _FileHandler()
+_file_handler.setFormatter(logging.Formatter(
+    '{asctime} | {levelname} | {name} | {module}:{funcName} line:{lineno} | {message}',
+    style='{'
+))
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter(
+    '{asctime:23} | {levelname:7} | {name:12} | {module:15}: {funcName:20} | line:{lineno:4} | {message}',
+    style='{'
+))
+_listener = _BatchQueueListener(_log_queue, _file_handler, _stream_handler)
 
 _logger_config = {
     'version': 1,
     'disable_existing_loggers': False,
-    'formatters': {
-        'stream_formatter': {
-            'format': '{asctime:23} | {levelname:7} | {name:12} | '
-                      '{module:15}: {funcName:20} | line:{lineno:4} | {message}',
-            'style': '{',
-            'log_colors': {
-                'DEBUG': 'cyan',
-                'INFO': 'bold_white',
-                'WARNING': 'bold_yellow',
-                'ERROR': 'bold_red',
-                'CRITICAL': 'bold_red,bg_white'
-            },
-        },
-        'file_formatter': {
-            'format': '{asctime} | {levelname} | {name} | {module}:{funcName} line:{lineno} | {message}',
-            'style': '{'
-        },
-    },
     'handlers': {
-        'file_handler': {
-            '()': _FileHandler,
-            'level': 'DEBUG',
-            'formatter': 'file_formatter'
-        },
-        'stream_handler': {
-            '()': logging.StreamHandler,
-            'level': 'DEBUG',
-            'formatter': 'stream_formatter'
+        'queue_handler': {
+            '()': logging.handlers.QueueHandler,
+            'queue': _log_queue,
+            'level': settings.LOG_LEVEL
         }
     },
     'loggers': {
         '': {
-            'level': 'DEBUG',
-            'handlers': ['file_handler', 'stream_handler']
+            'level': settings.LOG_LEVEL,
+            'handlers': ['queue_handler']
         }
     }
 }
 
 logging.config.dictConfig(_logger_config)
+_listener.start()
+atexit.register(_listener.stop)
 
 game_logger = logging.getLogger('')
 game_logger.info('Game logger configured')
@@ -1,6 +1,8 @@
 """
 Main module to start the program
 """
+import argparse
+import io
 import os
 import sys
 import time
@@ -11,14 +13,26 @@ import pygame
 
 from breakout_game import log
 from breakout_game.utils import path_utils
+from breakout_game.utils.asset_cache import asset_cache
+from breakout_game.utils.text_cache import text_cache
+from breakout_game.utils.surface_cache import surface_cache
+from breakout_game.utils.derived_cache import derived_cache
+from breakout_game.utils.texture_atlas import build_atlas, ATLAS_IMAGE_PATH
+from breakout_game.utils.surface_factory import surface_factory
+from breakout_game.utils.mixer_wrapper import sound_bank
+from breakout_game.utils.profiler import profiler
+from breakout_game.utils.frame_pacer import FramePacer
+from breakout_game.utils.game_clock import GameClock
 from breakout_game.config import settings
 from breakout_game.sprites import SpriteManager
-from breakout_game.screens import MainMenu, LevelMenu, EndGameMenu, PauseMenu
+from breakout_game.screens import MainMenu, LevelMenu, EndGameMenu, PauseMenu, DirtyRectRenderer
+from breakout_game.replay import Replay, play_headless
+from breakout_game.level_preloader import LevelPreloader, LevelAssets, load_level_assets
 
 game_logger = log.game_logger
 
 
-class Game:
+class Game:  # pylint: disable=R0902,R0904
     """
     The main game class.
 
@@ -27,31 +41,54 @@ class Game:
     Attributes:
         display_surface (pygame.Surface): Main screen surface on which everything is displayed.
         title (str): The name displayed at the top of the screen. Defaults to "Breakout Game"
-        clock (pygame.time.Clock): Timer to run the game at persistent time rate.
+        frame_pacer (FramePacer): Frame limiter to run the game at persistent time rate without a busy CPU.
+        game_clock (GameClock): The clock driving all game timers. Runs only while the game is active.
         main_menu (MainMenu): Main menu object.
         pause_menu (PauseMenu): Pause menu object.
         level_menu (LevelMenu): Level menu object.
         end_game_menu (EndGameMenu): End game menu object.
         background (pygame.Surface): The background of the game.
+        renderer (DirtyRectRenderer): Renderer of the game screen used in the 'dirty' render mode.
+        level_preloader (LevelPreloader): Loader of the assets of the next level while the main or level menu
+            is shown.
+        level_music (None, io.BytesIO): The music of the level streamed by pygame.mixer.music. Defaults to None.
         sprite_manager (SpriteManager):
             The sprite manager object handling the behaviour of all sprites in the game.
         game_active (bool): Whether the game is active or not. Defaults to False.
-        start_pause_time (int, float): The time when the game was set on pause. Defaults to 0.
-        time_in_pause (int, float): The amount of time spent in pause. Defaults to 0.
+        accumulator (float): Frame time not yet consumed by physics steps. Defaults to 0.
+        interpolation_alpha (float): Fraction of the physics step left in the accumulator, used to interpolate
+            positions of moving sprites when drawing. Defaults to 1.
         level (int):
             The level of the game. Defaults to 0. Must be a number from 0 to 6.
         level_difficulty (int): The difficulty of the game. Defaults to 0. Must be a number from 0 to 2.
         keys_pressed (pygame.key.ScancodeWrapper): The keys pressed during the game.
-
-    version: 1
+        events_count (int): Number of events handled in the current frame. Defaults to 0.
+        idle (bool): Whether a static menu is shown and the game runs with settings.IDLE_FPS. Defaults to False.
+        menu_objects (list[tuple[pygame.Surface, tuple]]): Menu objects of the previous frame, used to detect
+            changes of menus.
+        menu_static_since (float): time.perf_counter value when the shown menu changed the last time.
+        record_path (None, str, Path): Path to save the recording of the session to. Defaults to None.
+        recording (None, Replay): The session being recorded. Started with the first level. Defaults to None.
+        replay (None, Replay): The replay driving the physics steps instead of the keyboard. Defaults to None.
+        replay_step (int): Index of the next physics step of the replay. Defaults to 0.
+
+    Args:
+        record_path (None, str, Path): Path to save the recording of the session to. Defaults to None.
+            If None, the session is not recorded.
+        replay (None, Replay): The replay to play. Defaults to None. If provided, menus are skipped and the keys
+            of the physics steps are taken from the replay.
+
+    version: 4
     """
 
-    def __init__(self):
+    def __init__(self, record_path: [None, str, Path] = None, replay: [None, Replay] = None):
         # General Setup
         pygame.init()  # pylint: disable=E1101
+        derived_cache.cache_dir = Path(settings.DERIVED_CACHE_DIR) if settings.DERIVED_CACHE_DIR else None
         self.display_surface: pygame.Surface = pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
         self.title: str = 'Breakout Game'
-        self.clock: pygame.time.Clock = pygame.time.Clock()
+        self.frame_pacer: FramePacer = FramePacer(spin_time=settings.FRAME_SPIN_TIME)
+        self.game_clock: GameClock = GameClock()
 
         # Menu
         self.main_menu: MainMenu = MainMenu()
@@ -68,20 +105,49 @@ class Game:
 
         # Background
         self.background: pygame.Surface = self.main_menu.background
+        self.renderer: DirtyRectRenderer = DirtyRectRenderer()
+
+        # Assets of the next level
+        self.level_preloader: LevelPreloader = LevelPreloader()
+        self.level_music: [None, io.BytesIO] = None
+
+        # Replays
+        self.record_path: [None, str, Path] = record_path
+        self.recording: [None, Replay] = None
+        self.replay: [None, Replay] = replay
+        self.replay_step: int = 0
 
         # Sprites
-        self.sprite_manager: SpriteManager = SpriteManager()
+        self.sprite_manager: SpriteManager = SpriteManager(
+            clock=self.game_clock,
+            seed=replay.seed if replay is not None else None
+        )
 
         # Pause
         self.game_active: bool = False
-        self.start_pause_time: [int, float] = 0
-        self.time_in_pause: [int, float] = 0
+
+        # Fixed time step
+        self.accumulator: float = 0
+        self.interpolation_alpha: float = 1.0
 
         # Game stage
         self.level: int = 0
         self.level_difficulty: int = 0
 
         self.keys_pressed: pygame.key.ScancodeWrapper = pygame.key.get_pressed()
+        self.events_count: int = 0
+
+        # Idle rate of static menus
+        self.idle: bool = False
+        self.menu_objects: list[tuple[pygame.Surface, tuple]] = []
+        self.menu_static_since: float = time.perf_counter()
+
+        if self.replay is not None:
+            if self.replay.tick_rate != settings.PHYSICS_TICK_RATE:
+                raise ValueError(f'The replay was recorded with {self.replay.tick_rate} physics steps per second.')
+            self.main_menu.active = False
+            self.level = self.replay.level
+            self.level_difficulty = self.replay.level_difficulty
         game_logger.debug('Game Initialised')
 
     def restart_game(self):
@@ -103,53 +169,59 @@ class Game:
 
         # Game Stage
         self.game_active = False
-        self.start_pause_time = 0
-        self.time_in_pause = 0
+        self.accumulator = 0
+        self.interpolation_alpha = 1.0
         self.level = 0
         self.level_difficulty = 0
         self.keys_pressed = None
+        self.replay = None
 
-        self.sprite_manager = SpriteManager()
+        self.game_clock = GameClock()
+        self.sprite_manager = SpriteManager(clock=self.game_clock)
         game_logger.info('Game restarted')
 
-    def set_level_background(self):
+    def set_level_background(self, background: [None, pygame.Surface] = None):
         """
-        Set the background of the game. RGB(125, 125, 125) color is subtracted from the image to make it darker for
-        a better gaming experience.
+        Set the background of the game and convert it to the display format.
+
+        Args:
+            background (None, pygame.Surface): The background prepared by load_level_assets. Defaults to None.
+                If None, the background of the level is loaded and prepared.
         """
-        background_path = path_utils.get_asset_path(f'images/background/level-{self.level}.jpg')
-        self.background = pygame.image.load(background_path).convert()
-        self.background.fill((125, 125, 125), special_flags=pygame.BLEND_RGB_SUB)  # pylint: disable=E1101
-        scale_factor = max([
-            settings.WINDOW_HEIGHT / self.background.get_height(),
-            settings.WINDOW_WIDTH / self.background.get_width()
-        ])
-        scaled_width = self.background.get_width() * scale_factor
-        scaled_height = self.background.get_height() * scale_factor
-        self.background = pygame.transform.scale(self.background, (scaled_width, scaled_height))
-        game_logger.info('Background %(background_path)s of level %(level)s is set',
-                         {"background_path": background_path, "level": self.level})
+        if background is None:
+            background = load_level_assets(self.level).background
+        self.background = background.convert()
+        self.sprite_manager.set_background(self.background)
+        game_logger.info('Background of level %s is set', self.level)
 
-    def load_level_music(self):
+    def load_level_music(self, music: [None, bytes] = None):
         """
         Load the music into the pygame.mixer and plays it.
+
+        Args:
+            music (None, bytes): Content of the music file of the level. Defaults to None.
+                If None, the music is loaded from the file.
         """
         pygame.mixer.music.unload()
-        level_music_path = path_utils.get_asset_path(f'sounds/level-{self.level}.mp3')
-        pygame.mixer.music.load(level_music_path)
+        if music is None:
+            level_music_path = path_utils.get_asset_path(f'sounds/level-{self.level}.mp3')
+            pygame.mixer.music.load(level_music_path)
+            self.level_music = None
+        else:
+            self.level_music = io.BytesIO(music)
+            pygame.mixer.music.load(self.level_music, 'mp3')
         pygame.mixer.music.play(fade_ms=1000)
-        game_logger.debug('Music %s of level %s started', level_music_path, self.level)
+        game_logger.debug('Music of level %s started', self.level)
 
     def check_level_finish(self):
         """
         Checks if payer has finished the level based on the amount of blocks in the game.
         """
-        if len(self.sprite_manager.block_sprites_group.sprites()) == 0:
-            self.sprite_manager.ball_sprites_group.empty()
-            self.sprite_manager.power_up_sprites_group.empty()
+        if len(self.sprite_manager.block_field) == 0:
+            self.sprite_manager.clear_moving_sprites()
 
             self.game_active = False
-            self.level_menu.active = True
+            self.level_menu.active = self.replay is None
             self.level += 1
             game_logger.info('The level %s is finished', self.level)
 
@@ -157,11 +229,59 @@ class Game:
         """
         Checks player has finished the game or lost based on health and level number.
         """
-        if self.sprite_manager.player.health <= 0 or self.level > 6:
+        if self.sprite_manager.player.health <= 0 or self.level > settings.LAST_LEVEL:
             self.game_active = False
             self.end_game_menu.active = True
+            self.save_recording()
             game_logger.debug('The game has ended')
 
+    def save_recording(self):
+        """
+        Save the recording of the session, if any. Only one session is recorded.
+        """
+        if self.recording is not None:
+            self.recording.save(self.record_path)
+            self.recording = None
+            self.record_path = None
+
+    def quit(self):
+        """
+        Save the recording and the profiler statistics, if any, log the surface statistics in the debug mode and end
+        the program.
+        """
+        self.save_recording()
+        game_logger.info('Frame pacing: %s', self.frame_pacer.format_stats())
+        if surface_factory.debug:
+            game_logger.info('Surface factory: %s', surface_factory.stats())
+        if profiler.dump_path is not None:
+            profiler.dump()
+        pygame.quit()  # pylint: disable=E1101
+        sys.exit()
+
+    def draw_profiler_overlay(self) -> list[pygame.Rect]:
+        """
+        Draw the profiler overlay at the bottom of the scoreboard if it is visible.
+
+        Returns:
+            list[pygame.Rect]: The rectangle of the overlay, or an empty list if the overlay is hidden.
+        """
+        if not profiler.overlay_visible:
+            return []
+        font = asset_cache.load_font(settings.GAME_FONT, settings.POWERUP_FONT_SIZE)
+        overlay = profiler.get_overlay(font, settings.SCOREBOARD_WIDTH,
+                                       lambda: [self.frame_pacer.format_stats()])
+        overlay_rect = overlay.get_rect(bottomleft=(settings.GAME_WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+        self.display_surface.blit(overlay, overlay_rect)
+        return [overlay_rect]
+
+    def finish_replay(self):
+        """
+        End the game after the last step of the replay.
+        """
+        game_logger.info('Replay finished after %s steps', self.replay_step)
+        self.game_active = False
+        self.end_game_menu.active = True
+
     def check_events(self):
         """
         Handles the events based on key pressed during the game.
@@ -171,23 +291,26 @@ class Game:
 
             1. The game window is closed -> ends the program.
             2. The [q] key is pressed -> ends the program.
-            3. The [escape] key is pressed -> activates menu and starts timer to prevent powerup timers from counting.
+            3. The [escape] key is pressed -> activates menu. The game clock stops, so powerup timers stop counting.
+            4. The [F3] key is pressed -> shows or hides the profiler overlay.
         """
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        self.events_count = len(events)
+        for event in events:
             if event.type == pygame.QUIT:  # pylint: disable=E1101
                 game_logger.info('The game window is closed. Exiting...')
-                pygame.quit()  # pylint: disable=E1101
-                sys.exit()
+                self.quit()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:  # pylint: disable=E1101
+                profiler.toggle_overlay()
+                self.renderer.invalidate()
 
         self.keys_pressed = pygame.key.get_pressed()
         if self.keys_pressed[pygame.K_ESCAPE] and self.game_active:  # pylint: disable=E1101
             self.pause_menu.active = True
-            self.start_pause_time = time.time()
             game_logger.info('Pause activated')
         elif self.keys_pressed[pygame.K_q]:  # pylint: disable=E1101
             game_logger.info('The [q] button is pressed. Exiting...')
-            pygame.quit()  # pylint: disable=E1101
-            sys.exit()  # pylint: disable=E1101
+            self.quit()
 
     def get_last_blit_main_menu(self) -> list[list]:
         """
@@ -244,13 +367,64 @@ class Game:
         objects_to_blit = [[self.pause_menu.text_surface, self.pause_menu.text_rect]]
         return objects_to_blit
 
+    def update_idle(self, menu_objects_to_blit: list[list[pygame.Surface, pygame.Rect]]):
+        """
+        Check whether a static menu is shown. The game runs with settings.IDLE_FPS when a menu is shown and neither
+        the menu objects nor the input changed for settings.IDLE_DELAY.
+
+        Args:
+            menu_objects_to_blit (list[list[pygame.Surface, pygame.Rect]]): Objects of the menu drawn in this frame.
+                Empty during the game.
+        """
+        now = time.perf_counter()
+        menu_objects = [
+            (menu_object[0], tuple(menu_object[1])) for menu_object in menu_objects_to_blit if len(menu_object) > 0
+        ]
+        # Surfaces of menus are rendered once and reused, so they are compared by identity
+        if (len(menu_objects) == 0 or menu_objects != self.menu_objects or self.events_count > 0
+                or any(self.keys_pressed)):
+            self.menu_static_since = now
+        self.menu_objects = menu_objects
+
+        idle = now - self.menu_static_since >= settings.IDLE_DELAY
+        if idle != self.idle:
+            game_logger.debug('Idle frame rate %s', 'started' if idle else 'stopped')
+        self.idle = idle
+
+    def preload_level(self):
+        """
+        Start loading the assets of the next level in the background. Called every frame while the main or level
+        menu is shown.
+        """
+        if self.level <= settings.LAST_LEVEL:
+            self.level_preloader.start(self.level)
+
     def init_game_stage(self):
         """
-        Initialize the stage of level and start the game.
+        Initialize the stage of level and start the game. Assets, surface variants and text of the previous level
+        are purged from the caches. The background and music are taken from the level preloader, which loads them
+        synchronously if they were not preloaded. The number of balls is limited by the frame budget unless the
+        session is recorded or replayed.
         """
-        self.set_level_background()
+        assets: LevelAssets = self.level_preloader.take(self.level)
+        asset_cache.purge()
+        surface_cache.purge()
+        surface_factory.purge()
+        text_cache.clear()
+        self.set_level_background(assets.background)
         self.sprite_manager.init_level(self.level, self.level_difficulty)
-        self.load_level_music()
+        if self.record_path is None and self.replay is None:
+            self.sprite_manager.ball_frame_budget = settings.BALL_FRAME_BUDGET
+        self.renderer.invalidate()
+        self.load_level_music(assets.music)
+        if self.record_path is not None and self.recording is None:
+            self.recording = Replay(
+                seed=self.sprite_manager.seed,
+                level_difficulty=self.level_difficulty,
+                level=self.level
+            )
+        self.accumulator = 0
+        self.interpolation_alpha = 1.0
         self.game_active = True
         game_logger.info('Stage of level %s initialized', self.level)
 
@@ -263,9 +437,36 @@ class Game:
         """
         self.check_level_finish()
         self.check_end_game()
-        self.sprite_manager.update(delta_time, self.keys_pressed, self.time_in_pause)
-        self.time_in_pause = 0
-        self.start_pause_time = 0
+        self.sprite_manager.update(delta_time, self.keys_pressed)
+
+    def run_physics(self, frame_time: float):
+        """
+        Runs the game with a fixed time step. The frame time is accumulated and consumed by physics steps of
+        settings.PHYSICS_TIME_STEP. The rest is used to interpolate moving sprites when drawing.
+
+        Note:
+            The keys of every physics step are recorded, or taken from the replay if a replay is played.
+
+        Args:
+            frame_time (float): Time passed since the last frame.
+        """
+        self.accumulator += min(frame_time, settings.MAX_FRAME_TIME)
+        while self.accumulator >= settings.PHYSICS_TIME_STEP:
+            if self.replay is not None:
+                if self.replay_step >= len(self.replay):
+                    self.finish_replay()
+                    break
+                self.keys_pressed = self.replay.get_inputs(self.replay_step)
+                self.replay_step += 1
+            if self.recording is not None:
+                self.recording.record(self.keys_pressed)
+
+            self.run_game(settings.PHYSICS_TIME_STEP)
+            self.accumulator -= settings.PHYSICS_TIME_STEP
+            if not self.game_active:
+                self.accumulator = 0
+                break
+        self.interpolation_alpha = self.accumulator / settings.PHYSICS_TIME_STEP
 
     def draw_graphics(
             self,
@@ -277,55 +478,125 @@ class Game:
         Checks if there are any objects returned from menu. If true, renders them, if false,
         updates the game objects.
 
+        Note:
+            The background and blocks of the game are drawn with the cached playfield layer of the sprite manager.
+            In the 'dirty' render mode the game objects are drawn by the renderer, which updates only the changed
+            regions of the display. Menus are drawn in full and the next game frame is redrawn in full.
+
         Args:
             menu_objects_to_blit (list[list[pygame.Surface, pygame.Rect]]): Objects passed to blit method.
         """
-        self.display_surface.blit(source=self.background, dest=(0, 0))
-        if len(menu_objects_to_blit) > 0:
-            for menu_object_to_blit in menu_objects_to_blit:
-                if len(menu_object_to_blit) > 0:
-                    self.display_surface.blit(*menu_object_to_blit)
-        else:
-            self.sprite_manager.draw_all(self.display_surface)
+        if len(menu_objects_to_blit) == 0 and settings.RENDER_MODE == 'dirty':
+            with profiler.section('draw'):
+                playfield_surface = self.sprite_manager.get_playfield_surface()
+                dirty_rects = self.renderer.draw(
+                    self.display_surface,
+                    playfield_surface if playfield_surface is not None else self.background,
+                    self.sprite_manager.get_draw_list(self.interpolation_alpha),
+                    self.sprite_manager.playfield_layer.pop_changed_rects()
+                )
+            dirty_rects += self.draw_profiler_overlay()
+            with profiler.section('display.update'):
+                pygame.display.update(dirty_rects)
+            return
+
+        self.renderer.invalidate()
+        with profiler.section('draw'):
+            if len(menu_objects_to_blit) > 0:
+                self.display_surface.blit(source=self.background, dest=(0, 0))
+                for menu_object_to_blit in menu_objects_to_blit:
+                    if len(menu_object_to_blit) > 0:
+                        self.display_surface.blit(*menu_object_to_blit)
+            else:
+                if self.sprite_manager.playfield_layer.background is None:
+                    self.display_surface.blit(source=self.background, dest=(0, 0))
+                self.sprite_manager.draw_all(self.display_surface, self.interpolation_alpha)
+        self.draw_profiler_overlay()
 
-        pygame.display.update()
+        with profiler.section('display.update'):
+            pygame.display.update()
 
     def run(self):
         """
         The main event loop.
         """
         while True:
-            delta_time = self.clock.tick_busy_loop(settings.FPS) / 1000
+            if self.idle:
+                frame_time = self.frame_pacer.tick(settings.IDLE_FPS, wake_on_event=True)
+            else:
+                frame_time = self.frame_pacer.tick(settings.FPS)
+            frame_start = time.perf_counter_ns()
 
-            self.check_events()
+            with profiler.section('check_events'):
+                self.check_events()
 
             # Handle Menus
             menu_objects_to_blit = []
             if self.main_menu.active:
+                self.preload_level()
                 menu_objects_to_blit = self.get_last_blit_main_menu()
             elif self.level_menu.active:
+                self.preload_level()
                 menu_objects_to_blit = self.get_last_level_menu()
             elif self.end_game_menu.active:
                 menu_objects_to_blit = self.get_last_end_game_menu()
             elif self.pause_menu.active:
-                self.time_in_pause = time.time() - self.start_pause_time
                 menu_objects_to_blit = self.get_last_blit_pause_menu()
             else:
                 if not self.game_active:
                     self.init_game_stage()
                 else:
                     if not self.pause_menu.active:
-                        self.run_game(delta_time)
+                        with profiler.section('physics'):
+                            self.run_physics(frame_time)
+                            sound_bank.flush()
 
             # Graphics
             self.draw_graphics(menu_objects_to_blit)
+            self.update_idle(menu_objects_to_blit)
+            if profiler.enabled:
+                profiler.record('frame', time.perf_counter_ns() - frame_start)
 
 
-def start():
+def start(argv: [None, list[str]] = None):
     """
     Start the game
+
+    Args:
+        argv (None, list[str]): Command line arguments. Defaults to None. If None, sys.argv is used.
     """
-    game = Game()
+    parser = argparse.ArgumentParser(description='Breakout game')
+    parser.add_argument('--record', metavar='PATH', help='record the session to the replay file')
+    parser.add_argument('--replay', metavar='PATH', help='play the session from the replay file')
+    parser.add_argument('--headless', action='store_true',
+                        help='play the replay without window and sound as fast as possible')
+    parser.add_argument('--profile', metavar='PATH',
+                        help='profile the game loop and save the statistics to the CSV or JSON file on exit')
+    parser.add_argument('--debug-surfaces', action='store_true',
+                        help='count blits from surfaces not in the display format and log them on exit')
+    parser.add_argument('--build-atlas', action='store_true',
+                        help='pack the block, powerup, heart and ball images into the texture atlas and exit')
+    args = parser.parse_args(argv)
+
+    if args.build_atlas:
+        manifest = build_atlas()
+        game_logger.info('Packed %s images into the texture atlas %s', len(manifest['regions']), ATLAS_IMAGE_PATH)
+        return
+
+    if args.profile:
+        profiler.enabled = True
+        profiler.dump_path = args.profile
+    surface_factory.debug = args.debug_surfaces
+
+    if args.headless:
+        if args.replay is None:
+            parser.error('--headless requires --replay')
+        simulation = play_headless(Replay.load(args.replay))
+        game_logger.info('Headless replay finished: level %s, score %s, game over %s',
+                         simulation.level, simulation.sprite_manager.score.score, simulation.game_over)
+        return
+
+    game = Game(record_path=args.record, replay=Replay.load(args.replay) if args.replay else None)
     game.run()
 
 
@@ -0,0 +1,187 @@
+"""
+Recording of game sessions and frame-exact replays.
+
+A replay stores the seed of the sprite manager, the difficulty, the starting level and the keys pressed during
+every physics step. The file is binary: a header followed by run-length encoded key masks.
+"""
+from __future__ import annotations
+
+import struct
+
+from pathlib import Path
+
+import pygame
+
+from breakout_game import log
+from breakout_game.config import settings
+from breakout_game.simulation import Simulation, InputState
+
+game_logger = log.game_logger
+
+# Bits of the key mask. Only keys affecting the physics are recorded. [escape] is not: it pauses the game before
+# the physics steps of the frame and the game clock stops in the pause, so it has no effect on playback. Bit 8 was
+# used for it and is ignored when decoding.
+KEY_BITS = {
+    pygame.K_LEFT: 1,  # pylint: disable=E1101
+    pygame.K_RIGHT: 2,  # pylint: disable=E1101
+    pygame.K_SPACE: 4  # pylint: disable=E1101
+}
+
+_MAGIC = b'BRKR'
+_VERSION = 1
+# Magic, version, seed, difficulty, level, tick rate, number of runs
+_HEADER = struct.Struct('<4sBIBBHI')
+# Key mask, number of steps with this mask
+_RUN = struct.Struct('<BH')
+_MAX_RUN_LENGTH = 2 ** 16 - 1
+
+
+def encode_keys(keys_pressed: [InputState, pygame.key.ScancodeWrapper]) -> int:
+    """
+    Encode the recorded keys into a key mask.
+
+    Args:
+        keys_pressed (InputState, pygame.key.ScancodeWrapper): Keys pressed.
+
+    Returns:
+        int: Key mask.
+    """
+    mask = 0
+    for key, bit in KEY_BITS.items():
+        if keys_pressed[key]:
+            mask |= bit
+    return mask
+
+
+def decode_keys(mask: int) -> InputState:
+    """
+    Decode the key mask.
+
+    Args:
+        mask (int): Key mask.
+
+    Returns:
+        InputState: Keys pressed.
+    """
+    return InputState(key for key, bit in KEY_BITS.items() if mask & bit)
+
+
+class Replay:
+    """
+    Recorded game session.
+
+    Attributes:
+        seed (int): Seed of the random generator of the sprite manager.
+        level_difficulty (int): The difficulty of the game.
+        level (int): The level the session started from.
+        tick_rate (int): Physics steps per second.
+        masks (list[int]): Key mask of every physics step.
+
+    Args:
+        seed (int): Seed of the random generator of the sprite manager.
+        level_difficulty (int): The difficulty of the game.
+        level (int): The level the session started from. Defaults to 0.
+        tick_rate (int): Physics steps per second. Defaults to settings.PHYSICS_TICK_RATE.
+
+    version: 1
+    """
+    def __init__(
+            self,
+            seed: int,
+            level_difficulty: int,
+            level: int = 0,
+            tick_rate: int = settings.PHYSICS_TICK_RATE
+    ):
+        self.seed: int = seed
+        self.level_difficulty: int = level_difficulty
+        self.level: int = level
+        self.tick_rate: int = tick_rate
+        self.masks: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def record(self, keys_pressed: [InputState, pygame.key.ScancodeWrapper]):
+        """
+        Record the keys pressed during a physics step.
+
+        Args:
+            keys_pressed (InputState, pygame.key.ScancodeWrapper): Keys pressed.
+        """
+        self.masks.append(encode_keys(keys_pressed))
+
+    def get_inputs(self, step: int) -> InputState:
+        """
+        Get the keys pressed during the physics step.
+
+        Args:
+            step (int): Index of the physics step.
+
+        Returns:
+            InputState: Keys pressed.
+        """
+        return decode_keys(self.masks[step])
+
+    def save(self, path: [str, Path]):
+        """
+        Save the replay to a binary file.
+
+        Args:
+            path (str, Path): Path of the file.
+        """
+        runs = []
+        for mask in self.masks:
+            if runs and runs[-1][0] == mask and runs[-1][1] < _MAX_RUN_LENGTH:
+                runs[-1][1] += 1
+            else:
+                runs.append([mask, 1])
+
+        with open(path, 'wb') as file:
+            file.write(_HEADER.pack(
+                _MAGIC, _VERSION, self.seed, self.level_difficulty, self.level, self.tick_rate, len(runs)
+            ))
+            for mask, length in runs:
+                file.write(_RUN.pack(mask, length))
+        game_logger.info('Replay of %s steps saved to %s', len(self.masks), path)
+
+    @classmethod
+    def load(cls, path: [str, Path]) -> Replay:
+        """
+        Load the replay from a binary file.
+
+        Args:
+            path (str, Path): Path of the file.
+
+        Returns:
+            Replay: The loaded replay.
+        """
+        with open(path, 'rb') as file:
+            data = file.read()
+
+        magic, version, seed, level_difficulty, level, tick_rate, runs_count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f'{path} is not a replay file of version {_VERSION}.')
+
+        replay = cls(seed=seed, level_difficulty=level_difficulty, level=level, tick_rate=tick_rate)
+        for mask, length in _RUN.iter_unpack(data[_HEADER.size:_HEADER.size + runs_count * _RUN.size]):
+            replay.masks.extend([mask] * length)
+        game_logger.info('Replay of %s steps loaded from %s', len(replay.masks), path)
+        return replay
+
+
+def play_headless(replay: Replay) -> Simulation:
+    """
+    Play the replay in a headless simulation as fast as possible.
+
+    Args:
+        replay (Replay): The replay to play.
+
+    Returns:
+        Simulation: The closed simulation after the last recorded step. The headless mode of the asset cache is
+            restored.
+    """
+    with Simulation(level=replay.level, level_difficulty=replay.level_difficulty, seed=replay.seed) as simulation:
+        time_step = 1 / replay.tick_rate
+        for step in range(len(replay)):
+            simulation.step(replay.get_inputs(step), time_step)
+    return simulation
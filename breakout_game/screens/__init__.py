@@ -1,4 +1,5 @@
 """
-Package responsible for all screens in the game. Right now only menus are supported.
+Package responsible for all screens in the game: menus and the renderer of the game screen.
 """
 from breakout_game.screens.menus import PauseMenu, LevelMenu, EndGameMenu, MainMenu
+from breakout_game.screens.renderer import DirtyRectRenderer
@@ -5,6 +5,9 @@ import time
 import pygame
 
 from breakout_game.utils.path_utils import get_asset_path
+from breakout_game.utils.asset_cache import asset_cache
+from breakout_game.utils.derived_cache import derived_cache
+from breakout_game.utils.text_cache import text_cache
 from breakout_game.config import settings
 
 
@@ -22,19 +25,33 @@ class MainMenu:
         selected_option (int): Index of the selected menu option. Defaults to 1.
         title_surface (pygame.Surface): Title of the menu.
         title_rect (pygame.Rect): Rectangle of the title of the menu.
+        option_surfaces (list[tuple[pygame.Surface, pygame.Surface]]): Pre-rendered options, each as a tuple of
+            the unselected and the selected surface.
+        option_rects (list[pygame.Rect]): Rectangles of the options.
         objects_to_blit (list[pygame.Surface, pygame.Rect]): List of pygame objects to pass later to blit method.
+            Composed from the pre-rendered options when the selected option changes.
         active (bool): If the menu is active. Defaults to True.
         last_pressed (float): When was the last time the options changed. Used for smooth selection.
+
+    version: 2
     """
     def __init__(self):
         # Load and scale the background image
         background_image_path = get_asset_path('images/background/menu.png')
-        self.background = pygame.image.load(background_image_path).convert()
-        self.background = pygame.transform.scale(self.background, (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+        self.background = derived_cache.get_surface(
+            background_image_path,
+            (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT),
+            'scale',
+            lambda: asset_cache.load_image(
+                background_image_path,
+                size=(settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT),
+                convert_mode='opaque'
+            )
+        ).convert()
         self.background.set_alpha(20)
 
         # Setup font and text rendering
-        self.font = pygame.font.Font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
+        self.font = asset_cache.load_font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
         self.options = ['EASY', 'NORMAL', 'HARD']
         self.selected_option = 1  # Index of the currently selected option
 
@@ -44,6 +61,16 @@ class MainMenu:
             True,
             (255, 255, 255))
         self.title_rect = self.title_surface.get_rect(center=(settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT // 4))
+        self.option_surfaces = [
+            (self.font.render(option, True, (255, 255, 255)), self.font.render(option, True, (255, 0, 0)))
+            for option in self.options
+        ]
+        self.option_rects = [
+            surfaces[0].get_rect(
+                center=(settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT // 2 + i * settings.WINDOW_WIDTH // 15)
+            )
+            for i, surfaces in enumerate(self.option_surfaces)
+        ]
         self.objects_to_blit = []
 
         self.active = True
@@ -54,25 +81,22 @@ class MainMenu:
 
     def update_objects_to_blit(self):
         """
-        Update the objects to pass later to blit method.
+        Compose the objects to pass later to blit method from the pre-rendered options. The selected option is red.
         """
-        for i, option in enumerate(self.options):
-            position = (settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT // 2 + i * settings.WINDOW_WIDTH // 15)
-            if self.selected_option == i:
-                color = (255, 0, 0)
-            else:
-                color = (255, 255, 255)
-            surface_to_blit = self.font.render(option, True, color)
-            rect_to_blit = surface_to_blit.get_rect(center=position)
-            self.objects_to_blit.append([surface_to_blit, rect_to_blit])
+        self.objects_to_blit = [
+            [surfaces[self.selected_option == i], rect]
+            for i, (surfaces, rect) in enumerate(zip(self.option_surfaces, self.option_rects))
+        ]
 
     def update(self, keys_pressed: pygame.key.ScancodeWrapper):
         """
-        Update the menu objects and selection based on pressed keys.
+        Update the menu objects and selection based on pressed keys. The objects are composed again only if the
+        selected option changed.
 
         Args:
             keys_pressed (pygame.key.ScancodeWrapper): Keys pressed.
         """
+        previous_option = self.selected_option
         if time.time() - self.last_pressed >= 0.2:
             if keys_pressed[pygame.K_UP]:  # pylint: disable=E1101
                 self.selected_option = max(0, self.selected_option - 1)
@@ -83,6 +107,7 @@ class MainMenu:
             elif keys_pressed[pygame.K_RETURN]:  # pylint: disable=E1101
                 if self.selected_option in [0, 1, 2]:
                     self.active = False
+        if self.selected_option != previous_option:
             self.update_objects_to_blit()
 
 
@@ -101,7 +126,7 @@ class LevelMenu:
         active (bool): If the menu is active. Defaults to True.
     """
     def __init__(self):
-        self.font = pygame.font.Font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
+        self.font = asset_cache.load_font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
         self.text = 'CONGRATULATIONS! PRESS [ENTER] TO CONTINUE.'
 
         self.text_surface = self.font.render(self.text, True, (255, 255, 255))
@@ -137,7 +162,7 @@ class EndGameMenu:
         restart_needed (bool): If the player decided to restart the game.
     """
     def __init__(self):
-        self.font = pygame.font.Font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
+        self.font = asset_cache.load_font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
         self.text = 'END GAME. PRESS [ENTER] TO RESTART'
 
         self.text_surface = self.font.render(self.text, True, (255, 255, 255))
@@ -150,16 +175,19 @@ class EndGameMenu:
     def update(self, keys_pressed: pygame.key.ScancodeWrapper, score: int):
         """
         Update the state of the Menu. Checks if the player has pressed the restart game button.
+        The text is rendered again only if the score changed.
 
         Args:
             keys_pressed (pygame.key.ScancodeWrapper): Keys pressed.
             score (int): Current game score.
         """
-        self.text = f'YOUR FINAL SCORE: {score}. PRESS [ENTER] TO RESTART'
-        self.text_surface = self.font.render(self.text, True, (255, 255, 255))
-        self.text_rect = self.text_surface.get_rect(
-            center=(settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT // 2)
-        )
+        text = f'YOUR FINAL SCORE: {score}. PRESS [ENTER] TO RESTART'
+        if text != self.text:
+            self.text = text
+            self.text_surface = text_cache.render(self.font, self.text, (255, 255, 255))
+            self.text_rect = self.text_surface.get_rect(
+                center=(settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT // 2)
+            )
         if self.active:
             if keys_pressed[pygame.K_RETURN]:
                 self.active = False
@@ -181,7 +209,7 @@ class PauseMenu:
         active (bool): If the menu is active. Defaults to True.
     """
     def __init__(self):
-        self.font = pygame.font.Font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
+        self.font = asset_cache.load_font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
         self.text = 'PAUSE. PRESS [SPACE] TO CONTINUE.'
 
         self.text_surface = self.font.render(self.text, True, (255, 255, 255))
@@ -0,0 +1,133 @@
+"""
+Dirty rectangle rendering of the game screen.
+"""
+from __future__ import annotations
+
+import pygame
+
+from breakout_game import log
+
+game_logger = log.game_logger
+
+
+def merge_rects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+    """
+    Merge overlapping rectangles into their unions, so no area is redrawn twice.
+
+    Args:
+        rects (list[pygame.Rect]): Rectangles to merge.
+
+    Returns:
+        list[pygame.Rect]: Rectangles which do not overlap each other.
+    """
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRectRenderer:
+    """
+    Renderer redrawing only the regions of the screen which changed since the previous frame.
+
+    A region is dirty if a sprite moved, changed its image, appeared or disappeared there, or if the background
+    changed there (e.g. a block on the playfield layer was hit). The background is restored in dirty regions and
+    all sprites overlapping them are drawn again in their drawing order. Only the dirty rectangles have to be
+    passed to pygame.display.update.
+
+    Note:
+        Changes of images are detected by identity, so images of sprites must not be modified in place.
+        The background must be opaque and drawn at (0, 0).
+
+    Attributes:
+        full_redraw (bool): Whether the whole screen is redrawn in the next frame. Defaults to True.
+            Set by invalidate, e.g. when the background changes or a menu was drawn over the game.
+        drawn (dict[pygame.sprite.Sprite, tuple[pygame.Surface, pygame.Rect]]): The image and the rectangle
+            every sprite was drawn with in the previous frame.
+
+    version: 1
+    """
+    def __init__(self):
+        self.full_redraw: bool = True
+        self.drawn: dict[pygame.sprite.Sprite, tuple[pygame.Surface, pygame.Rect]] = {}
+
+    def invalidate(self):
+        """
+        Redraw the whole screen in the next frame.
+        """
+        self.full_redraw = True
+
+    def get_dirty_rects(self, draw_list: list[tuple[pygame.sprite.Sprite, pygame.Surface, pygame.Rect]]
+                        ) -> list[pygame.Rect]:
+        """
+        Get the rectangles changed since the previous frame.
+
+        Args:
+            draw_list (list[tuple[pygame.sprite.Sprite, pygame.Surface, pygame.Rect]]): Sprites of the frame with
+                the image and the rectangle to draw them with.
+
+        Returns:
+            list[pygame.Rect]: The previous and the current rectangles of changed sprites.
+        """
+        dirty_rects = []
+        remaining = dict(self.drawn)
+        for sprite, image, rect in draw_list:
+            previous = remaining.pop(sprite, None)
+            if previous is None:
+                dirty_rects.append(rect)
+            elif previous[0] is not image or previous[1] != rect:
+                dirty_rects.append(previous[1])
+                dirty_rects.append(rect)
+        dirty_rects.extend(rect for _, rect in remaining.values())
+        return dirty_rects
+
+    def draw(
+            self,
+            display_surface: pygame.Surface,
+            background: pygame.Surface,
+            draw_list: list[tuple[pygame.sprite.Sprite, pygame.Surface, pygame.Rect]],
+            changed_rects: [None, list[pygame.Rect]] = None
+    ) -> list[pygame.Rect]:
+        """
+        Draw the frame.
+
+        Args:
+            display_surface (pygame.Surface): The surface to draw on.
+            background (pygame.Surface): The background of the game.
+            draw_list (list[tuple[pygame.sprite.Sprite, pygame.Surface, pygame.Rect]]): Sprites of the frame in
+                their drawing order with the image and the rectangle to draw them with.
+            changed_rects (None, list[pygame.Rect]): Rectangles of the background changed since the previous
+                frame. Defaults to None.
+
+        Returns:
+            list[pygame.Rect]: Rectangles of the display which changed.
+        """
+        screen_rect = display_surface.get_rect()
+        if self.full_redraw:
+            display_surface.blit(background, (0, 0))
+            for _, image, rect in draw_list:
+                display_surface.blit(image, rect)
+            dirty_rects = [screen_rect]
+            self.full_redraw = False
+        else:
+            dirty_rects = self.get_dirty_rects(draw_list) + (changed_rects or [])
+            dirty_rects = [
+                rect for rect in (rect.clip(screen_rect) for rect in merge_rects(dirty_rects))
+                if rect.width > 0 and rect.height > 0
+            ]
+            if len(dirty_rects) > 0:
+                rects = [rect for _, _, rect in draw_list]
+                for dirty_rect in dirty_rects:
+                    display_surface.set_clip(dirty_rect)
+                    display_surface.blit(background, dirty_rect, area=dirty_rect)
+                    for index in dirty_rect.collidelistall(rects):
+                        display_surface.blit(draw_list[index][1], rects[index])
+                display_surface.set_clip(None)
+
+        self.drawn = {sprite: (image, rect) for sprite, image, rect in draw_list}
+        return dirty_rects
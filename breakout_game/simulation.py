@@ -0,0 +1,147 @@
+"""
+Headless simulation of the game. Steps the game state without a window, audio and surface conversions.
+"""
+from __future__ import annotations
+
+from typing import Iterable
+
+import pygame
+
+from breakout_game import log
+from breakout_game.config import settings
+from breakout_game.sprites import SpriteManager
+from breakout_game.utils.asset_cache import asset_cache
+from breakout_game.utils.mixer_wrapper import sound_bank
+
+game_logger = log.game_logger
+
+
+class InputState:
+    """
+    Keys pressed during a simulation step. Can be indexed with pygame key constants the same way as
+    pygame.key.ScancodeWrapper.
+
+    Attributes:
+        keys (frozenset[int]): pygame key constants of the pressed keys.
+
+    Args:
+        keys (Iterable[int]): pygame key constants of the pressed keys. Defaults to no keys.
+    """
+    def __init__(self, keys: Iterable[int] = ()):
+        self.keys: frozenset[int] = frozenset(keys)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.keys
+
+
+class Simulation:
+    """
+    Game simulation without display and mixer.
+
+    Handles the same game state as the Game class: levels, the end of the game and all sprites through the
+    SpriteManager and PowerUpManager. Menus are skipped, the next level starts at the step after the previous
+    one is finished, the same as in the game when [ENTER] is pressed in the level menu right away. The asset
+    cache is switched to the headless mode for the lifetime of the simulation, so images are not converted and
+    sounds do nothing. close() restores the previous mode. The simulation can be used as a context manager which
+    closes it on exit.
+
+    Attributes:
+        sprite_manager (SpriteManager): The sprite manager object handling the behaviour of all sprites.
+        level (int): The level of the game. Must be a number from 0 to settings.LAST_LEVEL.
+        level_difficulty (int): The difficulty of the game. Must be a number from 0 to 2.
+        frame (int): Number of steps done. Defaults to 0.
+        elapsed_time (float): Simulated time in seconds. Defaults to 0.
+        game_over (bool): Whether the player has lost or completed all levels. Defaults to False.
+        level_finished (bool): Whether the level is finished and the next one starts at the next step.
+            Defaults to False.
+
+    Args:
+        level (int): The level to start from. Defaults to 0.
+        level_difficulty (int): The difficulty of the game. Defaults to 0.
+        seed (None, int): Seed of the random generator of the sprite manager. Defaults to None.
+
+    version: 1
+    """
+    def __init__(self, level: int = 0, level_difficulty: int = 0, seed: [None, int] = None):
+        pygame.font.init()  # pylint: disable=E1101
+        self._previous_headless: [None, bool] = asset_cache.headless
+        asset_cache.set_headless(True)
+
+        try:
+            self.sprite_manager: SpriteManager = SpriteManager(seed=seed)
+        except Exception:
+            self.close()
+            raise
+        self.level: int = level
+        self.level_difficulty: int = level_difficulty
+
+        self.frame: int = 0
+        self.elapsed_time: float = 0
+        self.game_over: bool = False
+        self.level_finished: bool = False
+
+        self.sprite_manager.init_level(self.level, self.level_difficulty)
+        game_logger.debug('Simulation initialised')
+
+    def __enter__(self) -> Simulation:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Restore the mode of the asset cache from before the simulation. The game state can still be read, but
+        the simulation must not be stepped any more. Closing it again does nothing.
+        """
+        if self._previous_headless is not None:
+            asset_cache.set_headless(self._previous_headless)
+            self._previous_headless = None
+            game_logger.debug('Simulation closed')
+
+    def check_level_finish(self):
+        """
+        Checks if the level is finished based on the amount of blocks in the game.
+        """
+        if len(self.sprite_manager.block_field) == 0:
+            self.sprite_manager.clear_moving_sprites()
+
+            self.level_finished = True
+            self.level += 1
+            game_logger.info('The level %s is finished', self.level)
+
+    def check_end_game(self):
+        """
+        Checks player has finished the game or lost based on health and level number.
+        """
+        if self.sprite_manager.player.health <= 0 or self.level > settings.LAST_LEVEL:
+            self.game_over = True
+            game_logger.debug('The simulated game has ended')
+
+    def step(self, inputs: [InputState, pygame.key.ScancodeWrapper, Iterable[int]], delta_time: float):
+        """
+        Advance the simulation by one step. Does nothing if the game is over.
+
+        Note:
+            The order of checks and updates is the same as in Game.run_game, so the same inputs give the same game.
+
+        Args:
+            inputs (InputState, pygame.key.ScancodeWrapper, Iterable[int]): Keys pressed during the step.
+                Either an object indexed with pygame key constants or the pygame key constants of pressed keys.
+            delta_time (float): Time passed since the last step in seconds.
+        """
+        if self.game_over:
+            return
+        if not isinstance(inputs, (InputState, pygame.key.ScancodeWrapper)):
+            inputs = InputState(inputs)
+
+        if self.level_finished:
+            self.sprite_manager.init_level(self.level, self.level_difficulty)
+            self.level_finished = False
+
+        self.check_level_finish()
+        self.check_end_game()
+        self.sprite_manager.update(delta_time, inputs)
+        sound_bank.flush()
+        self.frame += 1
+        self.elapsed_time += delta_time
@@ -0,0 +1,205 @@
+"""
+Module describing the vectorized update of balls. Requires NumPy.
+"""
+from __future__ import annotations
+
+import logging
+
+from typing import TYPE_CHECKING
+
+import pygame
+
+from breakout_game.config import settings
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+if TYPE_CHECKING:
+    from breakout_game.sprites.sprite_manager import SpriteManager
+
+game_logger = logging.getLogger('')
+
+# Columns of the state array gathered from ball sprites
+_X, _Y, _DX, _DY, _SPEED, _LEFT, _TOP, _WIDTH, _HEIGHT, _ACTIVE = range(10)
+
+
+def create_ball_system(sprite_manager: SpriteManager) -> [None, BallSystem]:
+    """
+    Create the ball system if the 'vectorized' ball physics is selected in settings.BALL_PHYSICS.
+
+    Args:
+        sprite_manager (SpriteManager): The sprite manager.
+
+    Returns:
+        None, BallSystem: The ball system, or None if balls are updated one by one, also when NumPy is not
+            installed.
+    """
+    if settings.BALL_PHYSICS != 'vectorized':
+        return None
+    if numpy is None:
+        game_logger.warning('NumPy is not installed, balls are updated one by one')
+        return None
+    return BallSystem(sprite_manager)
+
+
+class BallSystem:
+    """
+    Vectorized update of all balls for large numbers of balls.
+
+    Positions, directions, speeds and sizes of all balls are gathered into NumPy arrays. Directions are normalized,
+    balls are moved, bounced off the game window and checked against the paddle and the cells of living blocks in
+    batch. Balls in free flight only get their new state written back. Balls which may hit the paddle or a block,
+    lost balls and inactive balls are updated by Ball.update, so the results are the same as when updating balls
+    one by one.
+
+    Note:
+        Balls in free flight cannot be affected by other balls in the same step. Blocks only disappear during
+        the step and balls do not collide with each other, so the order of updates does not change the result.
+
+    Attributes:
+        sprite_manager (SpriteManager): The sprite manager.
+        free_count (int): Number of balls moved in batch in the last update. Defaults to 0.
+
+    Args:
+        sprite_manager (SpriteManager): The sprite manager.
+
+    version: 1
+    """
+    def __init__(self, sprite_manager: SpriteManager):
+        self.sprite_manager: SpriteManager = sprite_manager
+        self.free_count: int = 0
+
+    def get_block_counts(self, left, top, right, bottom):
+        """
+        Count living blocks in the cells overlapped by the rectangles. Uses the summed-area table of the block field,
+        so every rectangle costs four lookups.
+
+        Args:
+            left (numpy.ndarray): Left sides of the rectangles.
+            top (numpy.ndarray): Top sides of the rectangles.
+            right (numpy.ndarray): Right sides of the rectangles.
+            bottom (numpy.ndarray): Bottom sides of the rectangles.
+
+        Returns:
+            numpy.ndarray: Number of living blocks in the cells overlapped by every rectangle.
+        """
+        block_field = self.sprite_manager.block_field
+        if block_field.alive_count == 0:
+            return numpy.zeros(len(left), dtype=numpy.int64)
+        alive = numpy.frombuffer(block_field.alive, dtype=numpy.uint8).reshape(block_field.rows, block_field.cols)
+        table = numpy.zeros((block_field.rows + 1, block_field.cols + 1), dtype=numpy.int64)
+        table[1:, 1:] = alive.cumsum(axis=0).cumsum(axis=1)
+
+        first_col = numpy.clip(numpy.floor_divide(left, block_field.cell_width), 0, block_field.cols).astype(int)
+        last_col = numpy.clip(numpy.floor_divide(right - 1, block_field.cell_width) + 1, 0, block_field.cols)
+        first_row = numpy.clip(numpy.floor_divide(top, block_field.cell_height), 0, block_field.rows).astype(int)
+        last_row = numpy.clip(numpy.floor_divide(bottom - 1, block_field.cell_height) + 1, 0, block_field.rows)
+        last_col = numpy.maximum(last_col.astype(int), first_col)
+        last_row = numpy.maximum(last_row.astype(int), first_row)
+        return (table[last_row, last_col] - table[first_row, last_col]
+                - table[last_row, first_col] + table[first_row, first_col])
+
+    def get_free(self, state, delta_time: float):  # pylint: disable=R0914
+        """
+        Move all balls in batch and find the balls which do not hit anything in the step. In the 'discrete' mode
+        balls bounce off the sides and the top of the game window in batch too.
+
+        Args:
+            state (numpy.ndarray): State of the balls, one row per ball.
+            delta_time (float): Time of the step.
+
+        Returns:
+            tuple[numpy.ndarray, ...]: Mask of balls in free flight, their normalized directions, new positions and
+                new rectangle positions.
+        """
+        x, y, dx, dy, speed = state[:, _X], state[:, _Y], state[:, _DX], state[:, _DY], state[:, _SPEED]
+        left, top, width, height = state[:, _LEFT], state[:, _TOP], state[:, _WIDTH], state[:, _HEIGHT]
+
+        # The same operations as Vector2.normalize and the movement of Ball, so the results are equal
+        length = numpy.sqrt(dx * dx + dy * dy)
+        moving = length != 0
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            dx = numpy.where(moving, dx / length, dx)
+            dy = numpy.where(moving, dy / length, dy)
+            if settings.BALL_COLLISION_MODE == 'swept':
+                distance = speed * delta_time
+                move_x, move_y = dx * distance, dy * distance
+            else:
+                move_x, move_y = dx * speed * delta_time, dy * speed * delta_time
+            new_x, new_y = x + move_x, y + move_y
+            new_left, new_top = numpy.rint(new_x), numpy.rint(new_y)
+
+            if settings.BALL_COLLISION_MODE == 'swept':
+                # Bounding box of the whole path, see Ball.swept_movement
+                moved_left, moved_top = left + numpy.rint(move_x), top + numpy.rint(move_y)
+                test_left = numpy.minimum(left, moved_left) - 1
+                test_top = numpy.minimum(top, moved_top) - 1
+                test_right = numpy.maximum(left, moved_left) + width + 1
+                test_bottom = numpy.maximum(top, moved_top) + height + 1
+                # The same as get_frame_time_of_impact
+                impact_x = numpy.where(
+                    move_x < 0, (0 - x) / move_x,
+                    numpy.where(move_x > 0, (settings.GAME_WINDOW_WIDTH - width - x) / move_x, numpy.nan)
+                )
+                impact_y = numpy.where(move_y < 0, (0 - y) / move_y, numpy.nan)
+                frame_hit = ((impact_x >= 0) & (impact_x <= 1)) | ((impact_y >= 0) & (impact_y <= 1))
+                # Balls which would be changed by Ball.frame_collision
+                frame_hit |= ((new_left < 0) | (new_left + width > settings.GAME_WINDOW_WIDTH)
+                              | (new_top < 0) | (new_top > settings.GAME_WINDOW_HEIGHT))
+            else:
+                # The same as Ball.frame_collision, balls leaving the bottom are lost by Ball.update
+                hit_left = new_left < 0
+                hit_right = ~hit_left & (new_left + width > settings.GAME_WINDOW_WIDTH)
+                hit_top = new_top < 0
+                new_left = numpy.where(hit_right, settings.GAME_WINDOW_WIDTH - width, new_left)
+                new_left = numpy.where(hit_left, 0, new_left)
+                new_x = numpy.where(hit_left | hit_right, new_left, new_x)
+                dx = numpy.where(hit_left | hit_right, -dx, dx)
+                new_top = numpy.where(hit_top, 0, new_top)
+                new_y = numpy.where(hit_top, 0, new_y)
+                dy = numpy.where(hit_top, -dy, dy)
+                test_left, test_top = new_left, new_top
+                test_right, test_bottom = new_left + width, new_top + height
+                frame_hit = new_top > settings.GAME_WINDOW_HEIGHT
+
+        player_rect = self.sprite_manager.player.rect
+        paddle_hit = ((test_left < player_rect.right) & (player_rect.left < test_right)
+                      & (test_top < player_rect.bottom) & (player_rect.top < test_bottom))
+        block_hit = self.get_block_counts(test_left, test_top, test_right, test_bottom) > 0
+
+        free = (state[:, _ACTIVE] != 0) & ~frame_hit & ~paddle_hit & ~block_hit
+        return free, dx, dy, new_x, new_y, new_left.astype(int), new_top.astype(int)
+
+    def update(self, delta_time: float, keys_pressed: pygame.key.ScancodeWrapper):  # pylint: disable=R0914
+        """
+        Update all balls.
+
+        Args:
+            delta_time (float): Time of the step.
+            keys_pressed (pygame.key.ScancodeWrapper): Keys pressed.
+        """
+        balls = self.sprite_manager.ball_sprites_group.sprites()
+        if len(balls) == 0:
+            self.free_count = 0
+            return
+        state = numpy.array([
+            (ball.position.x, ball.position.y, ball.direction.x, ball.direction.y, ball.speed,
+             ball.rect.left, ball.rect.top, ball.rect.width, ball.rect.height, ball.active)
+            for ball in balls
+        ], dtype=numpy.float64)
+        free, dx, dy, new_x, new_y, new_left, new_top = self.get_free(state, delta_time)
+        self.free_count = int(free.sum())
+
+        for ball, is_free, *ball_state in zip(
+                balls, free.tolist(), dx.tolist(), dy.tolist(), new_x.tolist(), new_y.tolist(),
+                new_left.tolist(), new_top.tolist()
+        ):
+            if is_free:
+                ball_dx, ball_dy, ball_x, ball_y, ball_left, ball_top = ball_state
+                ball.direction.update(ball_dx, ball_dy)
+                ball.position.update(ball_x, ball_y)
+                ball.rect.topleft = (ball_left, ball_top)
+            else:
+                ball.update(delta_time, keys_pressed)
@@ -0,0 +1,288 @@
+"""
+Module describing the field of blocks stored in compact arrays.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Iterator
+
+import pygame
+
+from breakout_game.config import settings
+from breakout_game.utils.mixer_wrapper import sound_bank
+
+if TYPE_CHECKING:
+    from breakout_game.sprites.sprite_manager import SpriteManager
+
+
+class Block:
+    """
+    Lightweight view of one block of the field. Has the interface of a block sprite used by collisions, powerups
+    and drawing, the state itself is kept in the arrays of the field.
+
+    Views are created on demand and compare equal if they refer to the same cell of the same field, so they can be
+    used as keys, e.g. by the dirty rectangle renderer.
+
+    Attributes:
+        field (BlockField): The field of the block.
+        index (int): Index of the block in the arrays of the field, row * cols + col.
+        rect (pygame.Rect): Rectangle of the block.
+
+    Args:
+        field (BlockField): The field of the block.
+        index (int): Index of the block in the arrays of the field.
+
+    version: 1
+    """
+    __slots__ = ('field', 'index', 'rect')
+
+    def __init__(self, field: BlockField, index: int):
+        self.field: BlockField = field
+        self.index: int = index
+        self.rect: pygame.Rect = field.get_rect(index)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Block):
+            return NotImplemented
+        return self.field is other.field and self.index == other.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.field), self.index))
+
+    @property
+    def health(self) -> int:
+        """
+        int: Health of the block.
+        """
+        return self.field.health[self.index]
+
+    @property
+    def image(self) -> pygame.Surface:
+        """
+        pygame.Surface: The shared image of the block, see BlockField.get_image.
+        """
+        return self.field.get_image(self.index)
+
+    def alive(self) -> bool:
+        """
+        Check whether the block was not destroyed.
+
+        Returns:
+            bool: True if the block is alive.
+        """
+        return bool(self.field.alive[self.index])
+
+    def get_damage(self, amount: int):
+        """
+        Get damage based on the amount of damage specified.
+
+        Args:
+            amount (int): The amount of damage.
+        """
+        self.field.damage(self.index, amount)
+
+    def kill(self):
+        """
+        Remove the block without scoring, sounds or powerups.
+        """
+        self.field.remove(self.index)
+
+
+class BlockField:
+    """
+    Blocks of the level stored as a structure of arrays indexed by BLOCK_MAP row and column.
+
+    The health, the image and the position of every cell are kept in compact arrays and living cells are flagged,
+    so a block costs a few bytes instead of a sprite with its own rectangle, vectors and image copies. Images are
+    taken from the shared table of the sprite manager, keyed by health. The cells match the grid of BLOCK_MAP, so
+    the field is also the broadphase for collisions with blocks.
+
+    Attributes:
+        sprite_manager (SpriteManager): The sprite manager, used for the score, powerups and block images.
+        rows (int): Number of rows. Defaults to 0. Set by reset.
+        cols (int): Number of columns. Defaults to 0. Set by reset.
+        cell_width (int, float): Width of a cell, BLOCK_WIDTH + GAP_SIZE.
+        cell_height (int, float): Height of a cell, BLOCK_HEIGHT + GAP_SIZE.
+        block_width (int): Width of every block. Defaults to BLOCK_WIDTH.
+        block_height (int): Height of every block. Defaults to BLOCK_HEIGHT.
+        health (array): Health of every cell.
+        image_health (array): Key of the image of every cell in the block image table. Not every health has an
+            image, the previous image is kept then.
+        left (array): Left coordinate of every cell.
+        top (array): Top coordinate of every cell.
+        alive (bytearray): 1 for every cell with a living block.
+        alive_count (int): Number of living blocks. Defaults to 0.
+
+    Args:
+        sprite_manager (SpriteManager): The sprite manager.
+
+    version: 1
+    """
+    def __init__(self, sprite_manager: SpriteManager):
+        self.sprite_manager: SpriteManager = sprite_manager
+        self.rows: int = 0
+        self.cols: int = 0
+        self.cell_width: [int, float] = settings.BLOCK_WIDTH + settings.GAP_SIZE
+        self.cell_height: [int, float] = settings.BLOCK_HEIGHT + settings.GAP_SIZE
+        self.block_width: int = settings.BLOCK_WIDTH
+        self.block_height: int = settings.BLOCK_HEIGHT
+
+        self.health: array = array('h')
+        self.image_health: array = array('h')
+        self.left: array = array('i')
+        self.top: array = array('i')
+        self.alive: bytearray = bytearray()
+        self.alive_count: int = 0
+
+    def __len__(self) -> int:
+        return self.alive_count
+
+    def __iter__(self) -> Iterator[Block]:
+        """
+        Iterate over living blocks in row by row order, the order they were created in by init_level.
+        """
+        for index, alive in enumerate(self.alive):
+            if alive:
+                yield Block(self, index)
+
+    def reset(self, rows: int, cols: int):
+        """
+        Remove all blocks and resize the field.
+
+        Args:
+            rows (int): Number of rows, e.g. len(BLOCK_MAP).
+            cols (int): Number of columns, e.g. len(BLOCK_MAP[0]).
+        """
+        size = rows * cols
+        self.rows, self.cols = rows, cols
+        self.health = array('h', bytes(2 * size))
+        self.image_health = array('h', bytes(2 * size))
+        self.left = array('i', bytes(4 * size))
+        self.top = array('i', bytes(4 * size))
+        self.alive = bytearray(size)
+        self.alive_count = 0
+
+    def add(self, health: int, row: int, col: int) -> Block:
+        """
+        Create the block in the cell. The block is placed in the cell with half of the gap around it.
+
+        Args:
+            health (int): The health of the block. Must have an image in the block image table.
+            row (int): Row of the cell.
+            col (int): Column of the cell.
+
+        Returns:
+            Block: View of the new block.
+        """
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise IndexError(f'Cell ({row}, {col}) is outside of the field of {self.rows}x{self.cols} blocks.')
+        index = row * self.cols + col
+        # Assigned coordinates are rounded the same as in image.get_rect(topleft=...) of block sprites
+        rect = pygame.Rect(0, 0, self.block_width, self.block_height)
+        rect.topleft = (settings.GAP_SIZE / 2 + col * self.cell_width, settings.GAP_SIZE / 2 + row * self.cell_height)
+        if not self.alive[index]:
+            self.alive_count += 1
+        self.alive[index] = 1
+        self.health[index] = health
+        self.image_health[index] = health
+        self.left[index] = rect.left
+        self.top[index] = rect.top
+        return Block(self, index)
+
+    def remove(self, index: int):
+        """
+        Remove the block. Its rectangle is patched on the playfield layer.
+
+        Args:
+            index (int): Index of the block.
+        """
+        if self.alive[index]:
+            self.alive[index] = 0
+            self.alive_count -= 1
+            self.sprite_manager.playfield_layer.invalidate(self.get_rect(index))
+
+    def get_rect(self, index: int) -> pygame.Rect:
+        """
+        Get the rectangle of the block.
+
+        Args:
+            index (int): Index of the block.
+
+        Returns:
+            pygame.Rect: New rectangle of the block.
+        """
+        return pygame.Rect(self.left[index], self.top[index], self.block_width, self.block_height)
+
+    def get_image(self, index: int) -> pygame.Surface:
+        """
+        Get the shared image of the block from the block image table of the sprite manager.
+
+        Args:
+            index (int): Index of the block.
+
+        Returns:
+            pygame.Surface: The image. Must not be modified in place.
+        """
+        return self.sprite_manager.get_block_images()[self.image_health[index]]
+
+    def get_blits(self) -> list[tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Get the images and rectangles of all living blocks to pass to pygame.Surface.blits.
+
+        Returns:
+            list[tuple[pygame.Surface, pygame.Rect]]: Images and rectangles in row by row order.
+        """
+        block_images = self.sprite_manager.get_block_images()
+        return [
+            (block_images[self.image_health[index]], self.get_rect(index))
+            for index, alive in enumerate(self.alive) if alive
+        ]
+
+    def collide(self, rect: pygame.Rect) -> list[Block]:
+        """
+        Get the blocks colliding with the rectangle. Only the cells overlapped by the rectangle are checked.
+
+        Args:
+            rect (pygame.Rect): The rectangle to check.
+
+        Returns:
+            list[Block]: Colliding blocks in row by row order.
+        """
+        if rect.width <= 0 or rect.height <= 0 or self.alive_count == 0:
+            return []
+        first_col = max(0, int(rect.left // self.cell_width))
+        last_col = min(self.cols - 1, int((rect.right - 1) // self.cell_width))
+        first_row = max(0, int(rect.top // self.cell_height))
+        last_row = min(self.rows - 1, int((rect.bottom - 1) // self.cell_height))
+
+        colliding_blocks = []
+        for row in range(first_row, last_row + 1):
+            for index in range(row * self.cols + first_col, row * self.cols + last_col + 1):
+                if (self.alive[index]
+                        and self.left[index] < rect.right and rect.left < self.left[index] + self.block_width
+                        and self.top[index] < rect.bottom and rect.top < self.top[index] + self.block_height):
+                    colliding_blocks.append(Block(self, index))
+        return colliding_blocks
+
+    def damage(self, index: int, amount: int):
+        """
+        Deal damage to the block. A destroyed block gives 30 points per difficulty level and may drop a powerup,
+        a damaged block gives 10 points per difficulty level and shows the image of its new health.
+
+        Args:
+            index (int): Index of the block.
+            amount (int): The amount of damage.
+        """
+        self.health[index] -= amount
+        score = self.sprite_manager.score_sprites_group.sprites()[0]
+        if self.health[index] <= 0:
+            score.add_score(30 * (self.sprite_manager.level_difficulty + 1))
+            sound_bank.play('break-block')
+            self.remove(index)
+            self.sprite_manager.drop_powerup(Block(self, index))
+        else:
+            score.add_score(10 * (self.sprite_manager.level_difficulty + 1))
+            sound_bank.play('hit-block')
+            if self.health[index] in self.sprite_manager.get_block_images():
+                self.image_health[index] = self.health[index]
+            self.sprite_manager.playfield_layer.invalidate(self.get_rect(index))
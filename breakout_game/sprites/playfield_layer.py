@@ -0,0 +1,98 @@
+"""
+Module describing the cached layer of the background and all living blocks.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pygame
+
+if TYPE_CHECKING:
+    from breakout_game.sprites.block_field import BlockField
+
+
+class PlayfieldLayer:
+    """
+    Surface with the background and all living blocks composited once. Blocks change only when they are hit, so
+    the layer is patched only in the rectangles of changed blocks and the playfield is drawn with one blit.
+
+    Attributes:
+        block_field (BlockField): Living blocks, used to find the blocks to redraw in a patched rectangle.
+        background (None, pygame.Surface): The background drawn under the blocks. Defaults to None.
+            If None, the layer is not used and blocks are drawn as sprites.
+        surface (None, pygame.Surface): The composited layer. Defaults to None. Built by get_surface.
+        pending_rects (list[pygame.Rect]): Rectangles to patch in the next get_surface call.
+        changed_rects (list[pygame.Rect]): Rectangles of the layer changed since the last pop_changed_rects call.
+
+    Args:
+        block_field (BlockField): Living blocks.
+
+    version: 2
+    """
+    def __init__(self, block_field: BlockField):
+        self.block_field: BlockField = block_field
+        self.background: [None, pygame.Surface] = None
+        self.surface: [None, pygame.Surface] = None
+        self.pending_rects: list[pygame.Rect] = []
+        self.changed_rects: list[pygame.Rect] = []
+
+    def set_background(self, background: pygame.Surface):
+        """
+        Set the background. The layer is rebuilt in the next get_surface call.
+
+        Args:
+            background (pygame.Surface): The background. Must be opaque.
+        """
+        self.background = background
+        self.invalidate_all()
+
+    def invalidate(self, rect: pygame.Rect):
+        """
+        Patch the rectangle in the next get_surface call, e.g. when a block in it changed or was destroyed.
+
+        Args:
+            rect (pygame.Rect): The rectangle to redraw.
+        """
+        if self.surface is not None:
+            self.pending_rects.append(rect.copy())
+
+    def invalidate_all(self):
+        """
+        Rebuild the whole layer in the next get_surface call, e.g. when a new level was created.
+        """
+        self.surface = None
+        self.pending_rects.clear()
+
+    def get_surface(self) -> pygame.Surface:
+        """
+        Get the layer, building or patching it if needed.
+
+        Returns:
+            pygame.Surface: The layer with the background and blocks.
+        """
+        if self.surface is None:
+            self.surface = self.background.copy()
+            self.surface.blits(self.block_field.get_blits(), doreturn=False)
+            self.changed_rects = [self.surface.get_rect()]
+            return self.surface
+
+        for rect in self.pending_rects:
+            self.surface.set_clip(rect)
+            self.surface.blit(self.background, rect, area=rect)
+            for block in self.block_field.collide(rect):
+                self.surface.blit(block.image, block.rect)
+            self.changed_rects.append(rect)
+        self.surface.set_clip(None)
+        self.pending_rects.clear()
+        return self.surface
+
+    def pop_changed_rects(self) -> list[pygame.Rect]:
+        """
+        Get and forget the rectangles of the layer changed since the previous call.
+
+        Returns:
+            list[pygame.Rect]: The changed rectangles.
+        """
+        changed_rects = self.changed_rects
+        self.changed_rects = []
+        return changed_rects
@@ -3,14 +3,14 @@ Module describing Powerup Manager and Timer.
 """
 from __future__ import annotations
 
-import time
+import itertools
 import math
 import logging
 
 from typing import TYPE_CHECKING
 
-import pygame
 from breakout_game.config import settings
+from breakout_game.utils.game_clock import GameClock
 
 if TYPE_CHECKING:
     from breakout_game.sprites.sprite_manager import SpriteManager
@@ -23,15 +23,20 @@ class PowerUpTimer:
     Simple timer. Stores and updates time passed since the activation
 
     Attributes:
+        clock (GameClock): The game clock to measure time with.
         start_time (None, float, int): The starting time of the timer. Defaults to None.
         current_time (None, float, int): The current time of the timer. Defaults to None.
         duration (None, float, int): Duration of timer set. Defaults to None.
         active (bool): If the timer is active. Defaults to False.
 
-    version: 1
+    Args:
+        clock (GameClock): The game clock to measure time with.
+
+    version: 2
     """
 
-    def __init__(self):
+    def __init__(self, clock: GameClock):
+        self.clock: GameClock = clock
         self.start_time: [None, float, int] = None
         self.current_time: [None, float, int] = None
 
@@ -45,22 +50,19 @@ class PowerUpTimer:
         Args:
             duration (int): The amount of seconds for a powerup to be active.
         """
-        current_time = time.time()
+        current_time = self.clock.now()
 
         self.start_time, self.current_time = current_time, current_time
         self.duration = duration
         self.active = True
 
-    def update(self, time_in_pause: float = 0):
+    def update(self):
         """
-        Update timer with time passed since the activation.
-
-        Args:
-            time_in_pause (float): The amount of time during which the program was on pause. Default is 0.
+        Update timer with time passed since the activation. The game clock does not run during the pause, so the
+        pause is not counted.
         """
         if self.active:
-            self.start_time += time_in_pause
-            self.current_time = time.time()
+            self.current_time = self.clock.now()
 
             if self.current_time - self.start_time > self.duration:
                 self.active = False
@@ -75,6 +77,11 @@ class PowerUpManager:
     Args:
         sprite_manager
     """
+    # Scales of the original size of balls
+    BALL_SCALES = {'big-ball': 1.5, 'small-ball': 0.5}
+    # Color added to the images of balls by super-ball
+    SUPER_BALL_TINT = (125, 0, 0)
+
     def __init__(self, sprite_manager: SpriteManager):
         self.sprite_manager = sprite_manager
 
@@ -92,10 +99,10 @@ class PowerUpManager:
 
         self.active_powerups = []
 
-        self.ball_size_timer = PowerUpTimer()
-        self.ball_speed_timer = PowerUpTimer()
-        self.ball_strength_timer = PowerUpTimer()
-        self.paddle_size_timer = PowerUpTimer()
+        self.ball_size_timer = PowerUpTimer(sprite_manager.clock)
+        self.ball_speed_timer = PowerUpTimer(sprite_manager.clock)
+        self.ball_strength_timer = PowerUpTimer(sprite_manager.clock)
+        self.paddle_size_timer = PowerUpTimer(sprite_manager.clock)
 
     def activate_powerup(self, power: str):
         """
@@ -119,6 +126,31 @@ class PowerUpManager:
         game_logger.info('Activating add-life powerup')
         self.sprite_manager.player_sprites_group.sprites()[0].add_health()
 
+    def get_ball_scale(self) -> float:
+        """
+        Get the scale of the original size of balls according to the last active size powerup.
+
+        Returns:
+            float: 1.5 for big-ball, 0.5 for small-ball, else 1.
+        """
+        for power in reversed(self.active_powerups):
+            if power in self.BALL_SCALES:
+                return self.BALL_SCALES[power]
+        return 1
+
+    def update_ball_images(self, scale: float, tinted: bool):
+        """
+        Set the images of all balls in game to the variant of their original image. Variants come from the surface
+        cache, so balls with the same original image share one variant and it is made only once.
+
+        Args:
+            scale (float): The scale of the original size.
+            tinted (bool): Whether SUPER_BALL_TINT is added to the images.
+        """
+        tint = self.SUPER_BALL_TINT if tinted else None
+        for ball in self.sprite_manager.ball_sprites_group.sprites():
+            ball.change_size(round(ball.original_width * scale), round(ball.original_height * scale), tint=tint)
+
     def activate_big_ball(self, start_timer: bool = True):
         """
         Increase the size of all balls in game by a factor of 1.5 to the original size
@@ -127,15 +159,7 @@ class PowerUpManager:
             start_timer (bool): if true, start timer. Defaults to True.
         """
         game_logger.info('Activating big-ball powerup')
-        for ball in self.sprite_manager.ball_sprites_group.sprites():
-
-            new_width = round(ball.original_width * 1.5)
-            new_height = round(ball.original_width * 1.5)
-            ball.change_size(new_width, new_height)
-
-            # To restore the original look.
-            if 'super-ball' in self.active_powerups:
-                self.activate_super_ball(start_timer=False)
+        self.update_ball_images(self.BALL_SCALES['big-ball'], 'super-ball' in self.active_powerups)
 
         if start_timer:
             self.ball_size_timer.start(settings.BALL_SIZE_DURATION)
@@ -148,15 +172,7 @@ class PowerUpManager:
             start_timer (bool): if true, start timer. Defaults to True.
         """
         game_logger.info('Activating small-ball powerup')
-        for ball in self.sprite_manager.ball_sprites_group.sprites():
-
-            new_width = round(ball.original_width * 0.5)
-            new_height = round(ball.original_height * 0.5)
-            ball.change_size(new_width, new_height)
-
-            # To restore the original look.
-            if 'super-ball' in self.active_powerups:
-                self.activate_super_ball(start_timer=False)
+        self.update_ball_images(self.BALL_SCALES['small-ball'], 'super-ball' in self.active_powerups)
 
         if start_timer:
             self.ball_size_timer.start(settings.BALL_SIZE_DURATION)
@@ -196,51 +212,53 @@ class PowerUpManager:
         The first ball created has a direction of -135 degrees to the x-axis
         The second ball created has a direction of -45 degrees to the x-axis
 
-        All necessary attributes of the original ball are passed to new ones.
+        All necessary attributes of the original ball are passed to new ones. No more balls are created than
+        allowed by SpriteManager.get_ball_limit. Active size powerups are applied to all balls once at the end.
         """
         game_logger.info('Activating multiply-balls powerup')
         balls_in_game = self.sprite_manager.ball_sprites_group.sprites()
-
-        if len(balls_in_game) <= 20:
-            for ball in balls_in_game:
-
-                left_angle = math.radians(-135)
-                right_angle = math.radians(-45)
-
-                ball_kwargs = {
-                    'speed': ball.speed,
-                    'original_speed': ball.original_speed,
-                    'original_width': ball.original_width,
-                    'original_height': ball.original_height,
-                    'strength': ball.strength,
-                    'original_strength': ball.original_strength,
-                    'active': True,
-                    'big_ball': False,
-                    'small_ball': False,
-                    'fast_ball': False,
-                    'slow_ball': False,
-                    'super_ball': False,
-                }
-                for angle in [left_angle, right_angle]:
-                    self.sprite_manager.create_ball(
-                        ball_image=ball.image,
-                        midbottom=ball.original_rect.midbottom,
-                        angle_radians=angle,
-                        **ball_kwargs
-                    )
-
-                # Change sizes of balls if powerups are active.
-                if 'big-ball' in self.active_powerups:
-                    self.activate_big_ball(start_timer=False)
-                if 'small-ball' in self.active_powerups:
-                    self.activate_small_ball(start_timer=False)
+        ball_limit = self.sprite_manager.get_ball_limit()
+        left_angle = math.radians(-135)
+        right_angle = math.radians(-45)
+
+        for ball, angle in itertools.product(balls_in_game, [left_angle, right_angle]):
+            if len(self.sprite_manager.ball_sprites_group) >= ball_limit:
+                game_logger.info('Limit of %s balls reached', ball_limit)
+                break
+            ball_kwargs = {
+                'original_image': ball.original_image,
+                'speed': ball.speed,
+                'original_speed': ball.original_speed,
+                'original_width': ball.original_width,
+                'original_height': ball.original_height,
+                'strength': ball.strength,
+                'original_strength': ball.original_strength,
+                'active': True,
+                'big_ball': False,
+                'small_ball': False,
+                'fast_ball': False,
+                'slow_ball': False,
+                'super_ball': False,
+            }
+            self.sprite_manager.create_ball(
+                ball_image=ball.image,
+                midbottom=ball.original_rect.midbottom,
+                angle_radians=angle,
+                **ball_kwargs
+            )
+
+        # Change sizes of balls if powerups are active.
+        if 'big-ball' in self.active_powerups:
+            self.activate_big_ball(start_timer=False)
+        if 'small-ball' in self.active_powerups:
+            self.activate_small_ball(start_timer=False)
 
     def activate_super_ball(self, start_timer=True):
         """
         Increase the strength of all balls in game by a factor of 2 to the original strength
 
         Note:
-            All affected balls are + 125 red.
+            All affected balls are + SUPER_BALL_TINT.
 
         Args:
             start_timer (bool): if true, start timer. Defaults to True.
@@ -248,9 +266,10 @@ class PowerUpManager:
         game_logger.info('Activating super-ball powerup')
         for ball in self.sprite_manager.ball_sprites_group.sprites():
             ball.change_strength(int(ball.original_strength * 2))
-            ball.image.fill((125, 0, 0), special_flags=pygame.BLEND_RGB_ADD)  # pylint: disable=E1101
-            if start_timer:
-                self.ball_strength_timer.start(settings.BALL_STRENGTH_DURATION)
+        self.update_ball_images(self.get_ball_scale(), tinted=True)
+
+        if start_timer:
+            self.ball_strength_timer.start(settings.BALL_STRENGTH_DURATION)
 
     def activate_big_paddle(self, start_timer=True):
         """
@@ -303,11 +322,10 @@ class PowerUpManager:
         Deactivate powerups related to the size of balls in the game and restores their size.
         """
         game_logger.info('Deactivating ball size powerup')
-        for ball in self.sprite_manager.ball_sprites_group.sprites():
-            ball.restore_size()
         for power in ['big-ball', 'small-ball']:
             if power in self.active_powerups:
                 self.active_powerups.remove(power)
+        self.update_ball_images(1, 'super-ball' in self.active_powerups)
 
     def deactivate_ball_speed(self):
         """
@@ -330,37 +348,30 @@ class PowerUpManager:
         game_logger.info('Deactivating ball strength powerup')
         for ball in self.sprite_manager.ball_sprites_group.sprites():
             ball.restore_strength()
-            ball.restore_image()
-            if 'big-ball' in self.active_powerups:
-                self.activate_big_ball(start_timer=False)
-            if 'small-ball' in self.active_powerups:
-                self.activate_small_ball(start_timer=False)
         if 'super-ball' in self.active_powerups:
             self.active_powerups.remove('super-ball')
+        self.update_ball_images(self.get_ball_scale(), tinted=False)
 
-    def update(self, time_in_pause: float = 0):
+    def update(self):
         """
         Update timers according to the duration of powerups, deactivate powerups if needed.
-
-        Args:
-            time_in_pause (float): time spent in pause to correct timers. Defaults to 0.
         """
         if self.paddle_size_timer.active:
-            self.paddle_size_timer.update(time_in_pause)
+            self.paddle_size_timer.update()
             if not self.paddle_size_timer.active:
                 self.deactivate_paddle_size()
 
         if self.ball_size_timer.active:
-            self.ball_size_timer.update(time_in_pause)
+            self.ball_size_timer.update()
             if not self.ball_size_timer.active:
                 self.deactivate_ball_size()
 
         if self.ball_speed_timer.active:
-            self.ball_speed_timer.update(time_in_pause)
+            self.ball_speed_timer.update()
             if not self.ball_speed_timer.active:
                 self.deactivate_ball_speed()
 
         if self.ball_strength_timer.active:
-            self.ball_strength_timer.update(time_in_pause)
+            self.ball_strength_timer.update()
             if not self.ball_strength_timer.active:
                 self.deactivate_ball_strength()
@@ -1,22 +1,27 @@
 """
 Module describing all sprite objects in the game.
 """
+# pylint: disable=C0302
 
 from __future__ import annotations
 
 import math
-import time
 
 from typing import TYPE_CHECKING
 
 import pygame
 
 from breakout_game.config import settings
-from breakout_game.utils import path_utils
+from breakout_game.utils.text_cache import text_cache
+from breakout_game.utils.surface_factory import surface_factory
+from breakout_game.utils.mixer_wrapper import sound_bank
+from breakout_game.utils.profiler import profiler
 from breakout_game.sprites.powerup_manager import PowerUpManager
+from breakout_game.sprites.swept_collision import get_time_of_impact, get_frame_time_of_impact
 
 if TYPE_CHECKING:
     from sprite_manager import SpriteManager
+    from breakout_game.sprites.sprite_pool import SpritePool
 
 
 class _GameSprite(pygame.sprite.Sprite):
@@ -28,21 +33,25 @@ class _GameSprite(pygame.sprite.Sprite):
     Attributes:
         sprite_manager (SpriteManager): Instance of sprites.SpriteManager class
         sprite_groups (list[pygame.sprite.AbstractGroup]): Any collection of any group types in pygame.sprite.Group
-        image (pygame.Surface): An image of the sprite. Must be an instance of pygame.Surface
+        image (pygame.Surface): An image of the sprite in the native format of the display. Converted by the
+            surface factory if needed.
         rect (pygame.Rect): An instance of the pygame.Rect class
         position (pygame.math.Vector2): Position of sprite on the screen.
             Defaults to pygame.math.Vector2(rect.topleft)
         direction (pygame.math.Vector2): Direction in which sprites moves along x and y-axis.
             Defaults to pygame.math.Vector2((0, 0)
         speed (int, float): Speed of movement. Defaults to 0
-        original_image (pygame.Surface): A copy of the original image provided during construction.
-            Defaults to image.copy(). Used primarily for powerup handling.
+        original_image (pygame.Surface): The original image provided during construction. Shared, must not be
+            modified in place. Used primarily for powerup handling as the base of variants in the surface cache.
         original_rect (pygame.Rect): A copy of the original rectangle provided during construction.
             Defaults to rect.copy(). Used primarily for powerup handling.
         original_width (int): The width of the original rectangle.
             Defaults to rect.width. Used primarily for powerup handling.
         original_height (int): The height of the original rectangle.
             Defaults to rect.width. Used primarily for powerup handling.
+        previous_position (pygame.math.Vector2): Position of sprite before the last physics step.
+            Defaults to a copy of position. Used to interpolate the position between physics steps when drawing.
+        pool (None, SpritePool): The pool the sprite returns to when it is killed. Defaults to None.
 
     Args:
         sprite_manager (SpriteManager): Instance of the sprites.SpriteManager class.
@@ -50,7 +59,7 @@ class _GameSprite(pygame.sprite.Sprite):
         image (pygame.Surface): An image of the sprite. Must be an instance of pygame.Surface.
         rect (pygame.Rect): An instance of the pygame.Rect class.
 
-    version: 1
+    version: 4
     """
     def __init__(
             self,
@@ -60,6 +69,7 @@ class _GameSprite(pygame.sprite.Sprite):
             rect: pygame.Rect
     ):
         pygame.sprite.Sprite.__init__(self)
+        image = surface_factory.native(image)
         for group in sprite_groups:
             self.add(group)
 
@@ -71,12 +81,58 @@ class _GameSprite(pygame.sprite.Sprite):
         self.position = pygame.math.Vector2(self.rect.topleft)  # pylint: disable=I1101
         self.direction = pygame.math.Vector2((0, 0))  # pylint: disable=I1101
         self.speed = 0
+        self.previous_position = self.position.copy()
 
-        self.original_image = self.image.copy()
+        self.original_image = image
         self.original_rect = self.rect.copy()
         self.original_width = self.rect.width
         self.original_height = self.rect.height
 
+        self.pool: [None, SpritePool] = None
+
+    def reset(
+            self,
+            sprite_groups: list[pygame.sprite.AbstractGroup],
+            image: pygame.Surface,
+            rect: pygame.Rect
+    ):
+        """
+        Reinitialize the sprite taken from a pool as if it was constructed with the provided arguments.
+
+        Vectors are updated in place, so no objects are allocated.
+
+        Args:
+            sprite_groups (list[pygame.sprite.AbstractGroup]): Any collection of any group types in
+                pygame.sprite.Group.
+            image (pygame.Surface): An image of the sprite.
+            rect (pygame.Rect): An instance of the pygame.Rect class.
+        """
+        image = surface_factory.native(image)
+        for group in sprite_groups:
+            self.add(group)
+        self.sprite_groups = sprite_groups
+        self.image = image
+        self.rect = rect
+
+        self.position.update(self.rect.topleft)
+        self.direction.update(0, 0)
+        self.speed = 0
+        self.previous_position.update(self.position)
+
+        self.original_image = image
+        self.original_rect.update(self.rect)
+        self.original_width = self.rect.width
+        self.original_height = self.rect.height
+
+    def kill(self):
+        """
+        Remove the sprite from all groups. The sprite returns to its pool, if any.
+        """
+        was_alive = self.alive()
+        pygame.sprite.Sprite.kill(self)
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
+
     def update(self, *args, **kwargs):
         """
         Updates the sprite based on the game logic.
@@ -95,6 +151,25 @@ class _GameSprite(pygame.sprite.Sprite):
         self.rect.x = round(self.position.x)
         self.rect.y = round(self.position.y)
 
+    def store_previous_position(self):
+        """
+        Store the current position as the position before the next physics step.
+        """
+        self.previous_position.update(self.position)
+
+    def get_interpolated_position(self, alpha: float) -> tuple[int, int]:
+        """
+        Get the position between the previous and the current physics step to draw the sprite at.
+
+        Args:
+            alpha (float): Fraction of the physics step passed since the current position, in range [0, 1].
+
+        Returns:
+            tuple[int, int]: The top left position to draw the sprite at.
+        """
+        interpolated_position = self.previous_position.lerp(self.position, alpha)
+        return round(interpolated_position.x), round(interpolated_position.y)
+
     def update_position_from_rect(self):
         """
         Update position attribute for rectangle attribute.
@@ -105,20 +180,24 @@ class _GameSprite(pygame.sprite.Sprite):
     def change_size(
             self,
             new_width: int,
-            new_height: int
+            new_height: int,
+            tint: [None, tuple[int, int, int]] = None
     ):
         """
         Change size of the sprite based on the new width and height provided.
 
-        The new image is created from the original one. Does not handle active powerups.
+        The new image is the variant of the original one from the surface cache, made by the surface factory.
+        Does not handle active powerups.
 
         Args:
             new_width (int): New width.
             new_height (int): New height.
+            tint (None, tuple[int, int, int]): RGB color added to the image. Defaults to None.
+                If None, the color of the original image is kept.
         :return:
         """
         rect_center = self.rect.center
-        self.image = pygame.transform.scale(self.original_image, (new_width, new_height))
+        self.image = surface_factory.get_variant(self.original_image, (new_width, new_height), tint)
         self.rect = self.image.get_rect(center=rect_center)
         self.rect.height = new_height
         self.update_position_from_rect()
@@ -132,7 +211,8 @@ class _GameSprite(pygame.sprite.Sprite):
         """
         Change image of the sprite based on the image, new width and height provided.
 
-        The new image is created from the provided one. Does not handle active powerups.
+        The new image is the variant of the provided one from the surface cache, made by the surface factory, so it
+        is converted to the native format if needed. Does not handle active powerups.
 
         Args:
             new_image (pygame.Surface): New image of type pygame.Surface.
@@ -140,16 +220,17 @@ class _GameSprite(pygame.sprite.Sprite):
             new_height (int): New height.
         """
         rect_center = self.rect.center
-        self.image = pygame.transform.scale(new_image, (new_width, new_height))
+        self.image = surface_factory.get_variant(new_image, (new_width, new_height))
         self.rect = self.image.get_rect(center=rect_center)
         self.update_position_from_rect()
 
     def restore_size(self):
         """
-        Restore size of the sprite based on the original width and original height. Scales the current image.
+        Restore size of the sprite based on the original width and original height. The image is scaled from the
+        original one, so no resampling loss accumulates.
         """
         rect_center = self.rect.center
-        self.image = pygame.transform.scale(self.image, (self.original_width, self.original_height))
+        self.image = surface_factory.get_variant(self.original_image, (self.original_width, self.original_height))
         self.rect = self.image.get_rect(center=rect_center)
         self.update_position_from_rect()
 
@@ -158,7 +239,7 @@ class _GameSprite(pygame.sprite.Sprite):
         Restore image of the sprite based on the original one.
         """
         rect_center = self.rect.center
-        self.image = self.original_image.copy()
+        self.image = self.original_image
         self.rect = self.image.get_rect(center=rect_center)
         self.update_position_from_rect()
 
@@ -187,7 +268,6 @@ class Player(_GameSprite):
 
     Attributes:
         health (int): The health of the player.
-        lost_hp_sound (pygame.mixer.Sound): The sound of the player loosing a health point.
     """
     def __init__(
             self,
@@ -200,9 +280,6 @@ class Player(_GameSprite):
         self.health: int = settings.MAX_PLAYER_HEALTH
         self.speed = settings.DEFAULT_PADDLE_SPEED
 
-        lost_hp_sound_path = path_utils.get_asset_path('sounds/lost_hp.mp3')
-        self.lost_hp_sound: pygame.mixer.Sound = pygame.mixer.Sound(lost_hp_sound_path)
-
     def check_screen_constraint(self):
         """
         Check if the paddle hits the screen boundaries and adjust position accordingly.
@@ -224,8 +301,7 @@ class Player(_GameSprite):
             heart_sprites = self.sprite_manager.heart_sprites_group.sprites()
             heart_sprites[-1].kill()
             self.sprite_manager.score_sprites_group.sprites()[0].subtract_score(200)
-            self.lost_hp_sound.stop()
-            self.lost_hp_sound.play()
+            sound_bank.play('lost-hp')
 
     def add_health(self):
         """
@@ -270,13 +346,16 @@ class Score(_GameSprite):
         score (int): The score to draw on the scoreboard.
         font (pygame.font.Font): The font to use for the score.
         color (pygame.Color): The color to use for the score.
+        rendered_score (None, int): The score shown on the image. Defaults to None.
 
     Args:
         font (pygame.font.Font): The font to use for the score.
         color (pygame.Color): The color to use for the score.
 
-    version: 1
+    version: 2
     """
+    PREFIX = 'Score: '
+
     def __init__(
             self,
             sprite_manager: SpriteManager,
@@ -290,6 +369,7 @@ class Score(_GameSprite):
         self.score: int = 0
         self.font: pygame.font.Font = font
         self.color: pygame.Color = color
+        self.rendered_score: [None, int] = None
 
     def add_score(self, points: int):
         """
@@ -314,13 +394,17 @@ class Score(_GameSprite):
 
     def update(self, *args, **kwargs):
         """
-        Update the score based on the new score and realign the text.
-        Returns:
-
+        Update the score based on the new score and realign the text. Nothing is done if the score did not change.
+        Digits are composed from cached glyphs.
         """
+        if self.score == self.rendered_score:
+            return
         old_rect_center = self.rect.center
-        self.image = self.font.render(f'Score: {self.score}', True, self.color)
+        self.image = surface_factory.native(
+            text_cache.render_field(self.font, self.PREFIX, str(self.score), self.color)
+        )
         self.rect = self.image.get_rect(center=old_rect_center)
+        self.rendered_score = self.score
 
 
 class PowerUp(_GameSprite):
@@ -330,7 +414,6 @@ class PowerUp(_GameSprite):
     Attributes:
         power (str): The name of the powerup.
         powerup_manager (PowerUpManager): The PowerUpManager instance which handles the behaviour of powerups.
-        powerup_sound (pygame.mixer.Sound): The sound to play when player catches the powerup.
 
     Args:
         power (str): The name of the powerup.
@@ -354,9 +437,27 @@ class PowerUp(_GameSprite):
         self.power: str = power
         self.powerup_manager: PowerUpManager = powerup_manager
 
-        powerup_sound_path = path_utils.get_asset_path('sounds/get powerup.mp3')
-        self.powerup_sound: pygame.mixer.Sound = pygame.mixer.Sound(powerup_sound_path)
-        self.powerup_sound.set_volume(0.3)
+    def reset(  # pylint: disable=W0221
+            self,
+            sprite_groups: list[pygame.sprite.AbstractGroup],
+            image: pygame.Surface,
+            rect: pygame.Rect,
+            power: str = ''
+    ):
+        """
+        Reinitialize the powerup taken from a pool.
+
+        Args:
+            sprite_groups (list[pygame.sprite.AbstractGroup]): Any collection of any group types in
+                pygame.sprite.Group.
+            image (pygame.Surface): An image of the sprite.
+            rect (pygame.Rect): An instance of the pygame.Rect class.
+            power (str): The name of the powerup.
+        """
+        super().reset(sprite_groups=sprite_groups, image=image, rect=rect)
+        self.direction.update(0, 1)
+        self.speed = settings.DEFAULT_POWERUP_SPEED
+        self.power = power
 
     def activate(self):
         """
@@ -376,8 +477,7 @@ class PowerUp(_GameSprite):
                     if conflicting_power == self.power:
                         powerup_timer.kill()
             self.sprite_manager.create_powerup_timer_info(self.power, settings.POWERS[self.power]['time'])
-        self.powerup_sound.stop()
-        self.powerup_sound.play()
+        sound_bank.play('get-powerup')
 
     def update(self, delta_time: (int, float)):  # pylint: disable=W0221
         """
@@ -397,77 +497,7 @@ class PowerUp(_GameSprite):
         self.movement(delta_time)
 
 
-class Block(_GameSprite):
-    """
-    Block sprite.
-
-    Attributes:
-        health (int): Health of the block.
-        hit_sound (pygame.mixer.Sound): Sound played when block is hit.
-        break_sound (pygame.mixer.Sound): Sound played when block is broken.
-
-    Args:
-        health (int): Health of the block.
-    """
-    def __init__(
-            self,
-            sprite_manager: SpriteManager,
-            sprite_groups: list[pygame.sprite.AbstractGroup],
-            image: pygame.Surface,
-            rect: pygame.Rect,
-            health: int,
-    ):
-        super().__init__(sprite_manager=sprite_manager, sprite_groups=sprite_groups, image=image, rect=rect)
-        self.health = health
-        self.update_image()
-
-        hit_sound_path = path_utils.get_asset_path('sounds/hit blocks.mp3')
-        self.hit_sound = pygame.mixer.Sound(hit_sound_path)
-        self.hit_sound.set_volume(0.25)
-
-        break_sound_path = path_utils.get_asset_path('sounds/break blocks.mp3')
-        self.break_sound = pygame.mixer.Sound(break_sound_path)
-        self.break_sound.set_volume(0.75)
-
-    def get_damage(self, amount: int):
-        """
-        Get damage based on the amount of damage specified
-
-        Args:
-            amount (int): The amount of damage.
-        """
-        self.health -= amount
-        if self.health <= 0:
-            self.sprite_manager.score_sprites_group.sprites()[0].add_score(
-                30 * (self.sprite_manager.level_difficulty + 1)
-            )
-            self.break_sound.stop()
-            self.break_sound.play()
-            self.kill()
-            self.sprite_manager.drop_powerup(self)
-        else:
-            self.sprite_manager.score_sprites_group.sprites()[0].add_score(
-                10 * (self.sprite_manager.level_difficulty + 1)
-            )
-            self.hit_sound.stop()
-            self.hit_sound.play()
-
-    def update_image(self):
-        """
-        Update the image of the block based on health.
-        """
-        if self.health in settings.COLOR_LEGEND:
-            new_image = pygame.image.load(settings.COLOR_LEGEND[self.health])
-            self.change_image(new_image, settings.BLOCK_WIDTH, settings.BLOCK_HEIGHT)
-
-    def update(self, *args, **kwargs):
-        """
-        Update the sprite.
-        """
-        self.update_image()
-
-
-class Ball(_GameSprite):
+class Ball(_GameSprite):  # pylint: disable=R0904
     """
     Ball sprite. Handles collision detection and bouncing.
 
@@ -477,8 +507,8 @@ class Ball(_GameSprite):
         strength (int): Strength of the ball. Used to detect how much damage is dealt to blocks.
             Defaults to 1
         original_strength (int): Original strength of the ball. Used for powerups.
-        time_delay_counter (int, float): Time to delay when ball is lost before activating it again.
-        hit_paddle_sound (pygame.mixer.Sound): Sound to play when ball hits the paddle.
+        time_delay_counter (int, float): Game clock time when the ball was lost. The ball is activated again
+            0.5 seconds later. Defaults to -math.inf.
         active (bool): Whether the ball is active or not.
             Defaults to False
 
@@ -503,10 +533,34 @@ class Ball(_GameSprite):
         self.strength = 1
         self.original_strength = 1
 
-        self.time_delay_counter = 0
+        self.time_delay_counter = -math.inf
 
-        hit_paddle_sound_path = path_utils.get_asset_path('sounds/hit paddle.mp3')
-        self.hit_paddle_sound = pygame.mixer.Sound(hit_paddle_sound_path)
+        self.active = False
+
+    def reset(  # pylint: disable=W0221
+            self,
+            sprite_groups: list[pygame.sprite.AbstractGroup],
+            image: pygame.Surface,
+            rect: pygame.Rect,
+            speed: int
+    ):
+        """
+        Reinitialize the ball taken from a pool.
+
+        Args:
+            sprite_groups (list[pygame.sprite.AbstractGroup]): Any collection of any group types in
+                pygame.sprite.Group.
+            image (pygame.Surface): An image of the sprite.
+            rect (pygame.Rect): An instance of the pygame.Rect class.
+            speed (int): Speed of the ball.
+        """
+        super().reset(sprite_groups=sprite_groups, image=image, rect=rect)
+        self.direction.update(0, -1)
+        self.speed = speed
+        self.original_speed = speed
+        self.strength = 1
+        self.original_strength = 1
+        self.time_delay_counter = -math.inf
         self.active = False
 
     def get_angle_of_direction(self):
@@ -522,7 +576,7 @@ class Ball(_GameSprite):
         Args:
             angle (int, float): Angle in radians
         """
-        self.direction = pygame.math.Vector2((math.cos(angle), math.sin(angle)))  # pylint: disable=I1101
+        self.direction.update(math.cos(angle), math.sin(angle))
 
     def change_speed(self, new_speed: int):
         """
@@ -558,7 +612,7 @@ class Ball(_GameSprite):
         """
         Loose the ball, make it inactive and make player loose health.
         """
-        self.time_delay_counter = time.time()
+        self.time_delay_counter = self.sprite_manager.clock.now()
         if len(self.sprite_manager.ball_sprites_group.sprites()) == 1:
             self.sprite_manager.player_sprites_group.sprites()[0].loose_health()
             self.active = False
@@ -679,7 +733,7 @@ class Ball(_GameSprite):
             colliding_players (list[Player]): List of player sprites
         """
         player_direction_x = colliding_players[0].direction.x
-        paddle_path_per_frame = abs(round(player_direction_x * colliding_players[0].speed / settings.FPS))
+        paddle_path_per_frame = abs(round(player_direction_x * colliding_players[0].speed / settings.PHYSICS_TICK_RATE))
         if player_direction_x > 0:
             self.rect.x += paddle_path_per_frame * 3
         else:
@@ -742,7 +796,7 @@ class Ball(_GameSprite):
         """
         General method to handle collisions between blocks and paddles.
         """
-        colliding_blocks = pygame.sprite.spritecollide(self, self.sprite_manager.block_sprites_group, False)
+        colliding_blocks = self.sprite_manager.block_field.collide(self.rect)
         colliding_players = pygame.sprite.spritecollide(self, self.sprite_manager.player_sprites_group, False)
         colliding_sprites = colliding_blocks + colliding_players
         if len(colliding_sprites) > 0:
@@ -750,22 +804,104 @@ class Ball(_GameSprite):
             self.handle_bounce(overlapping_rect=overlap_rect, colliding_players=colliding_players)
 
             if len(colliding_players) == 0:
-
-                for sprite in colliding_sprites:
-                    if getattr(sprite, 'health', None):
-                        for _ in range(self.strength):
-                            sprite.get_damage(1)
+                self.damage_blocks(colliding_sprites)
             else:
-                self.hit_paddle_sound.stop()
-                self.hit_paddle_sound.play()
+                sound_bank.play('hit-paddle')
             self.position.x = self.rect.x
             self.position.y = self.rect.y
 
+    def damage_blocks(self, colliding_sprites: list):
+        """
+        Deal damage to the colliding blocks according to the strength of the ball.
+
+        Args:
+            colliding_sprites (list): List of colliding sprites. Sprites without health are skipped.
+        """
+        for sprite in colliding_sprites:
+            if getattr(sprite, 'health', None):
+                for _ in range(self.strength):
+                    sprite.get_damage(1)
+
+    def handle_swept_paddle_hit(self, player: Player):
+        """
+        Handle the hit of the paddle in the 'swept' mode, after the direction was reflected. If the ball bounces
+        off the top of the paddle, the angle is adjusted according to the contact point.
+
+        Args:
+            player (Player): The paddle hit by the ball.
+        """
+        if self.direction.y < 0:
+            contact_left = max(self.position.x, player.rect.left)
+            contact_right = min(self.position.x + self.rect.width, player.rect.right)
+            contact_rect = pygame.Rect(contact_left, player.rect.top, contact_right - contact_left, 1)
+            self.paddle_adjust_angle(contact_rect)
+            self.direction = self.direction.normalize()
+        sound_bank.play('hit-paddle')
+
+    def swept_movement(self, delta_time: (int, float)):
+        """
+        Move the ball using swept collision detection. The ball is moved to the earliest impact along its path,
+        bounces and continues with the rest of the step. Up to MAX_BOUNCES_PER_FRAME bounces are resolved.
+
+        Note:
+            All blocks hit at the same time of impact get damage, the same as overlapping blocks in the
+            'discrete' mode.
+
+        Args:
+            delta_time (int, float): Time passed since last frame.
+        """
+        player = self.sprite_manager.player_sprites_group.sprites()[0]
+        size = self.rect.size
+        remaining_distance = self.speed * delta_time
+
+        for _ in range(settings.MAX_BOUNCES_PER_FRAME):
+            if remaining_distance <= 0 or self.direction.magnitude() == 0:
+                break
+            displacement = self.direction * remaining_distance
+
+            # Only blocks in the bounding box of the whole path can be hit
+            path_rect = self.rect.union(self.rect.move(round(displacement.x), round(displacement.y))).inflate(2, 2)
+            impacts = [
+                (impact, sprite)
+                for sprite in self.sprite_manager.block_field.collide(path_rect) + [player]
+                if (impact := get_time_of_impact(self.position, size, displacement, sprite.rect)) is not None
+            ]
+            frame_impact = get_frame_time_of_impact(self.position, size, displacement)
+            if frame_impact is not None:
+                impacts.append((frame_impact, None))
+
+            if len(impacts) == 0:
+                self.position += displacement
+                break
+
+            time_of_impact = min(impact[0] for impact, _ in impacts)
+            hits = [(impact, sprite) for impact, sprite in impacts if impact[0] == time_of_impact]
+            self.position += displacement * time_of_impact
+            remaining_distance *= 1 - time_of_impact
+
+            if any(impact[1] for impact, _ in hits):
+                self.direction.x *= -1
+            if any(impact[2] for impact, _ in hits):
+                self.direction.y *= -1
+
+            hit_sprites = [sprite for _, sprite in hits if sprite is not None]
+            if player in hit_sprites:
+                hit_sprites.remove(player)
+                self.handle_swept_paddle_hit(player)
+            self.damage_blocks(hit_sprites)
+
+        self.rect.x = round(self.position.x)
+        self.rect.y = round(self.position.y)
+
     # pylint: disable=W0221
     def update(self, delta_time: (int, float), keys_pressed: pygame.key.ScancodeWrapper):
         """
         Update the status of the ball. Handle movement, collisions and activation.
 
+        Note:
+            In the 'swept' collision mode overlapping objects are resolved first, e.g. after the ball has grown
+            by a powerup, then the ball is moved with swept collision detection.
+
         Args:
             delta_time (int, float):
             keys_pressed (pygame.key.ScancodeWrapper):
@@ -775,12 +911,19 @@ class Ball(_GameSprite):
             if self.direction.magnitude() != 0:
                 self.direction = self.direction.normalize()
 
-            self.movement(delta_time)
-            self.frame_collision()
-            self.handle_collisions()
+            if settings.BALL_COLLISION_MODE == 'swept':
+                with profiler.section('ball.handle_collisions'):
+                    self.handle_collisions()
+                self.swept_movement(delta_time)
+                self.frame_collision()
+            else:
+                self.movement(delta_time)
+                self.frame_collision()
+                with profiler.section('ball.handle_collisions'):
+                    self.handle_collisions()
 
         else:
-            if time.time() - self.time_delay_counter > 0.5:
+            if self.sprite_manager.clock.now() - self.time_delay_counter > 0.5:
                 self.rect.midbottom = self.sprite_manager.player_sprites_group.sprites()[0].rect.midtop
                 self.position = pygame.math.Vector2(self.rect.topleft)  # pylint: disable=I1101
 
@@ -818,6 +961,7 @@ class PowerUpTimerInfo(_GameSprite):
         color (pygame.Color): The color to use for the text.
         power_name (str): The name of the powerup.
         powerup_time (int, float): The time in seconds for the powerup to be active.
+        rendered_time_left (None, str): The time left shown on the image. Defaults to None.
     Args:
         font (pygame.font.Font): The font to use for the text.
         color (pygame.Color): The color to use for the text.
@@ -840,23 +984,50 @@ class PowerUpTimerInfo(_GameSprite):
         self.font = font
         self.color = color
         self.powerup_time = powerup_time
-        self.start_time = time.time()
+        self.start_time = self.sprite_manager.clock.now()
         self.power_name = power_name
+        self.rendered_time_left: [None, str] = None
 
-    # pylint: disable=W0221
-    def update(self, time_in_pause: (int, float) = 0):
+    def reset(  # pylint: disable=W0221
+            self,
+            sprite_groups: list[pygame.sprite.AbstractGroup],
+            image: pygame.Surface,
+            rect: pygame.Rect,
+            power_name: str = '',
+            powerup_time: (int, float) = 0
+    ):
         """
-        Update the text.
+        Reinitialize the powerup timer info taken from a pool. The font and the color are kept.
 
         Args:
-            time_in_pause (int, float): Time spent in pause. Defaults to 0.
+            sprite_groups (list[pygame.sprite.AbstractGroup]): Any collection of any group types in
+                pygame.sprite.Group.
+            image (pygame.Surface): An image of the sprite.
+            rect (pygame.Rect): An instance of the pygame.Rect class.
+            power_name (str): The name of the powerup.
+            powerup_time (int, float): The time in seconds for the powerup to be active.
+        """
+        super().reset(sprite_groups=sprite_groups, image=image, rect=rect)
+        self.powerup_time = powerup_time
+        self.start_time = self.sprite_manager.clock.now()
+        self.power_name = power_name
+        self.rendered_time_left = None
+
+    # pylint: disable=W0221
+    def update(self):
+        """
+        Update the text. The time is shown in tenths of a second, rounded up, so the text changes at most ten times
+        a second and the same strings are shown by every activation of the powerup, which hits the text cache.
+        The game clock does not run during the pause, so the pause is not counted.
         """
-        self.start_time += time_in_pause
-        time_left = self.powerup_time - (time.time() - self.start_time)
+        time_left = self.powerup_time - (self.sprite_manager.clock.now() - self.start_time)
         old_rect_center = self.rect.center
         if time_left > 0:
-            self.image = self.font.render(
-                f'{self.power_name.upper()} Time Left: {time_left:.2f}', True, self.color)
-            self.rect = self.image.get_rect(center=old_rect_center)
+            time_left_text = f'{math.ceil(time_left * 10) / 10:.1f}'
+            if time_left_text != self.rendered_time_left:
+                self.image = surface_factory.native(text_cache.render_field(
+                    self.font, f'{self.power_name.upper()} Time Left: ', time_left_text, self.color))
+                self.rect = self.image.get_rect(center=old_rect_center)
+                self.rendered_time_left = time_left_text
         else:
             self.kill()
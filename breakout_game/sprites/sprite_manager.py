@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import random
 import math
+import time
 
 from typing import TYPE_CHECKING
 
@@ -13,13 +14,23 @@ import pygame
 
 from breakout_game.config import settings
 from breakout_game.utils import path_utils
+from breakout_game.utils.asset_cache import asset_cache
+from breakout_game.utils.text_cache import text_cache
+from breakout_game.utils.surface_factory import surface_factory
+from breakout_game.utils.profiler import profiler
+from breakout_game.utils.mixer_wrapper import sound_bank
+from breakout_game.utils.game_clock import GameClock
 from breakout_game.sprites.powerup_manager import PowerUpManager
+from breakout_game.sprites.block_field import BlockField, Block
+from breakout_game.sprites.playfield_layer import PlayfieldLayer
+from breakout_game.sprites.sprite_pool import SpritePool
+from breakout_game.sprites.ball_system import BallSystem, create_ball_system
 
 if not TYPE_CHECKING:
-    from breakout_game.sprites.sprite import Player, Score, Heart, PowerUp, Ball, Block, Scoreboard, PowerUpTimerInfo
+    from breakout_game.sprites.sprite import Player, Score, Heart, PowerUp, Ball, Scoreboard, PowerUpTimerInfo
 
 
-class SpriteManager:
+class SpriteManager:  # pylint: disable=R0902
     """
         Sprite manager class.
         Handles creation of sprites, updates them and draws on the provided surface.
@@ -28,7 +39,6 @@ class SpriteManager:
 
         Attributes:
             all_sprites_group (pygame.sprite.Group): Group containing all sprites objects.
-            block_sprites_group (pygame.sprite.Group): Group containing all block sprites.
             player_sprites_group (pygame.sprite.Group): Group containing all player sprites.
             ball_sprites_group (pygame.sprite.Group): Group containing all ball sprites.
             scoreboard_sprites_group (pygame.sprite.Group): Group containing all scoreboard sprites.
@@ -42,25 +52,45 @@ class SpriteManager:
                 Defaults to None.
             hearts (list, list[Heart]): List of Heart objects in the game.
                 Defaults to an empty list.
-            blocks (list, list[Block]): List of all block objects in the game.
-                Defaults to an empty list.
             player (None, Player): Player object.
                 Defaults to None.
-            balls (list, list[Ball]): List of all balls in the game.
+            balls (list, list[Ball]): List of all living balls in the game.
                 Defaults to an empty list.
-            power_ups (list, list[PowerUp]): List of all power ups in the game.
+            power_ups (list, list[PowerUp]): List of all living power ups in the game.
                 Defaults to an empty list.
-            power_up_infos (list, list[PowerUpTimerInfo]): List of all power up timers in the game.
+            power_up_infos (list, list[PowerUpTimerInfo]): List of all living power up timers in the game.
                 Defaults to an empty list
+            ball_pool (SpritePool): Pool of killed balls reused by create_ball.
+            power_up_pool (SpritePool): Pool of killed power ups reused by create_powerup.
+            power_up_info_pool (SpritePool): Pool of killed power up timers reused by create_powerup_timer_info.
+            block_images (dict[int, pygame.Surface]): Block images scaled to the block size, keyed by health.
+                Defaults to an empty dict. Built by create_block_images.
+            block_field (BlockField): Blocks of the level stored in arrays indexed by BLOCK_MAP row and column.
+                Also the broadphase for collisions with blocks.
+            playfield_layer (PlayfieldLayer): Cached layer of the background and living blocks. Used to draw
+                blocks once the background is set with set_background.
+            ball_system (None, BallSystem): Vectorized update of balls. None if balls are updated one by one,
+                see settings.BALL_PHYSICS.
+            ball_frame_budget (None, float): Share of time the update of balls may take, see get_ball_limit.
+                Defaults to None. If None, only settings.MAX_BALLS limits the number of balls, so the game is
+                deterministic.
+            ball_update_time (float): Smoothed update time of one ball in seconds, measured in update.
+                Defaults to 0.
+            clock (GameClock): The game clock driving all timers. Advanced in update.
+            seed (int): Seed of the random generator used to drop powerups.
+            random (random.Random): Random generator used to drop powerups.
             powerup_manager (PowerUpManager): PowerUpManager object, provides status of powerups.
             level_difficulty (None, int): difficulty of the game.
                 Defaults to None.
+
+        Args:
+            clock (None, GameClock): The game clock to use. Defaults to None. If None, a new clock is created.
+            seed (None, int): Seed of the random generator. Defaults to None. If None, a random seed is chosen.
         """
-    def __init__(self):
+    def __init__(self, clock: [None, GameClock] = None, seed: [None, int] = None):
         # Sprites groups
         (
             self.all_sprites_group,
-            self.block_sprites_group,
             self.player_sprites_group,
             self.ball_sprites_group,
             self.scoreboard_sprites_group,
@@ -68,16 +98,28 @@ class SpriteManager:
             self.power_up_sprites_group,
             self.score_sprites_group,
             self.power_up_timer_info_group
-        ) = (pygame.sprite.Group() for _ in range(9))
+        ) = (pygame.sprite.Group() for _ in range(8))
 
         self.scoreboard: (None, Scoreboard) = None
         self.score: (None, Score) = None
         self.hearts: (list, list[Heart]) = []
-        self.blocks: (list, list[Block]) = []
         self.player: (None, Player) = None
         self.balls: (list, list[Ball]) = []
         self.power_ups: (list, list[PowerUp]) = []
         self.power_up_infos: (list, list[PowerUpTimerInfo]) = []
+        self.ball_pool: SpritePool = SpritePool(self.balls)
+        self.power_up_pool: SpritePool = SpritePool(self.power_ups)
+        self.power_up_info_pool: SpritePool = SpritePool(self.power_up_infos)
+        self.block_images: dict[int, pygame.Surface] = {}
+        self.block_field: BlockField = BlockField(self)
+        self.playfield_layer: PlayfieldLayer = PlayfieldLayer(self.block_field)
+        self.ball_system: [None, BallSystem] = create_ball_system(self)
+        self.ball_frame_budget: [None, float] = None
+        self.ball_update_time: float = 0
+        self.clock: GameClock = clock if clock is not None else GameClock()
+        self.seed: int = seed if seed is not None else random.randrange(2 ** 32)
+        self.random: random.Random = random.Random(self.seed)
+        sound_bank.configure(settings.SOUND_EFFECTS, settings.SOUND_CHANNELS, settings.SOUND_PLAYS_PER_FRAME)
 
         self.powerup_manager: PowerUpManager = PowerUpManager(self)
         self.level_difficulty: (None, int) = None
@@ -87,9 +129,8 @@ class SpriteManager:
         Initialize the scoreboard object.
         """
         scoreboard_image_path = path_utils.get_asset_path('images/background/scoreboard.png')
-        scoreboard_image = pygame.image.load(scoreboard_image_path).convert_alpha()
-        scoreboard_image = pygame.transform.scale(
-            surface=scoreboard_image,
+        scoreboard_image = surface_factory.load_image(
+            scoreboard_image_path,
             size=(settings.SCOREBOARD_WIDTH, settings.WINDOW_HEIGHT)
         )
         scoreboard_rect = scoreboard_image.get_rect(topright=(settings.WINDOW_WIDTH, 0))
@@ -106,8 +147,8 @@ class SpriteManager:
         Initialize the score object.
         """
         score_color = pygame.Color('white')
-        score_font = pygame.font.Font(settings.GAME_FONT, size=settings.SCORE_FONT_SIZE)
-        score_image = score_font.render('Score: 0', True, score_color)
+        score_font = asset_cache.load_font(settings.GAME_FONT, size=settings.SCORE_FONT_SIZE)
+        score_image = surface_factory.native(text_cache.render_field(score_font, Score.PREFIX, '0', score_color))
         score_rect = score_image.get_rect(
             center=(settings.WINDOW_WIDTH - settings.SCOREBOARD_WIDTH // 2, settings.WINDOW_HEIGHT // 4))
         self.score = Score(
@@ -127,11 +168,7 @@ class SpriteManager:
             midtop (tuple): The middle top position of a heart sprite on the screen. Must be a tuple of (x, y)
         """
         heart_image_path = path_utils.get_asset_path('images/hearts/heart_s.png')
-        heart_image = pygame.image.load(heart_image_path).convert_alpha()
-        heart_image = pygame.transform.scale(
-            surface=heart_image,
-            size=(settings.HEART_WIDTH, settings.HEART_HEIGHT)
-        )
+        heart_image = surface_factory.load_image(heart_image_path, size=(settings.HEART_WIDTH, settings.HEART_HEIGHT))
         heart_rect = heart_image.get_rect(midtop=midtop)
         heart = Heart(
             self,
@@ -141,36 +178,48 @@ class SpriteManager:
         )
         self.hearts.append(heart)
 
-    def create_block(self, health: int, x: int, y: int):
+    def create_block_images(self):
+        """
+        Build the block images for every health in the color legend from the texture atlas in the native format,
+        scaled to the block size of the current resolution.
+        """
+        self.block_images = {
+            health: surface_factory.load_image(image_path, size=(settings.BLOCK_WIDTH, settings.BLOCK_HEIGHT))
+            for health, image_path in settings.COLOR_LEGEND.items()
+        }
+
+    def get_block_images(self) -> dict[int, pygame.Surface]:
+        """
+        Get the block images keyed by health. Builds them if they were not built yet.
+
+        Returns:
+            dict[int, pygame.Surface]: Block images scaled to the block size.
         """
-        Initialize a block.
+        if not self.block_images:
+            self.create_block_images()
+        return self.block_images
+
+    def create_block(self, health: int, row: int, col: int) -> Block:
+        """
+        Initialize a block in the cell of the block field.
 
         Args:
-            health (int): The health of the block.
-            x (int): The x position of the block.
-            y (int): The y position of the block.
-        """
-        block_image = pygame.image.load(settings.COLOR_LEGEND[health])
-        block_image = pygame.transform.scale(
-            surface=block_image,
-            size=(settings.BLOCK_WIDTH, settings.BLOCK_HEIGHT)
-        )
-        block_rect = block_image.get_rect(topleft=(x, y))
-        block = Block(
-            self,
-            sprite_groups=[self.all_sprites_group, self.block_sprites_group],
-            image=block_image,
-            rect=block_rect,
-            health=health,
-        )
-        self.blocks.append(block)
+            health (int): The health of the block. Must have an image in the block image table.
+            row (int): The row of the block in BLOCK_MAP.
+            col (int): The column of the block in BLOCK_MAP.
+
+        Returns:
+            Block: View of the new block.
+        """
+        self.get_block_images()
+        return self.block_field.add(health, row, col)
 
     def create_player(self):
         """
         Initialize the player.
         """
-        player_image = pygame.Surface(
-            size=(settings.PADDLE_WIDTH // (self.level_difficulty + 1), settings.PADDLE_HEIGHT)
+        player_image = surface_factory.new_surface(
+            (settings.PADDLE_WIDTH // (self.level_difficulty + 1), settings.PADDLE_HEIGHT)
         )
         player_image.fill('white')
         player_rect = player_image.get_rect(midbottom=(settings.GAME_WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT - 20))
@@ -191,6 +240,7 @@ class SpriteManager:
     ):
         """
         Initialize the ball object. Can be used outside in case powerup multiply-balls is activated.
+        A killed ball is reused from the pool if there is any.
 
         Args:
             ball_image (None, pygame.Surface): image of a ball created.
@@ -204,26 +254,25 @@ class SpriteManager:
         """
         if not ball_image:
             ball_image_path = path_utils.get_asset_path('images/ball/ball.png')
-            ball_image = pygame.image.load(ball_image_path).convert_alpha()
-            ball_image = pygame.transform.scale(
-                ball_image,
-                (settings.WINDOW_WIDTH / 40, settings.WINDOW_WIDTH / 40)
+            ball_image = surface_factory.load_image(
+                ball_image_path,
+                size=(settings.WINDOW_WIDTH / 40, settings.WINDOW_WIDTH / 40)
             )
         if midbottom is None:
             midbottom = self.player.rect.midtop
-        new_ball = Ball(
-            sprite_manager=self,
-            sprite_groups=[self.all_sprites_group, self.ball_sprites_group],
-            image=ball_image,
-            rect=ball_image.get_rect(midbottom=midbottom),
-            speed=speed
-        )
+        sprite_groups = [self.all_sprites_group, self.ball_sprites_group]
+        rect = ball_image.get_rect(midbottom=midbottom)
+        new_ball = self.ball_pool.acquire()
+        if new_ball is None:
+            new_ball = Ball(sprite_manager=self, sprite_groups=sprite_groups, image=ball_image, rect=rect, speed=speed)
+        else:
+            new_ball.reset(sprite_groups=sprite_groups, image=ball_image, rect=rect, speed=speed)
         new_ball.set_direction_from_angle(angle_radians)
 
         for kwarg in kwargs_to_ball.items():
             setattr(new_ball, kwarg[0], kwarg[1])
 
-        self.balls.append(new_ball)
+        self.ball_pool.add(new_ball)
 
     def init_level(self, level_number: int = 0, level_difficulty: int = 0):
         """
@@ -236,6 +285,9 @@ class SpriteManager:
         """
         self.level_difficulty = level_difficulty
 
+        self.create_block_images()
+        self.block_field.reset(len(settings.BLOCK_MAP), len(settings.BLOCK_MAP[0]))
+        self.playfield_layer.invalidate_all()
         self.create_scoreboard()
         if self.score is None:
             self.create_score()
@@ -252,10 +304,7 @@ class SpriteManager:
         for row_index, row in enumerate(settings.BLOCK_MAP):
             for col_index, health in enumerate(row):
                 if health != ' ':
-                    health = int(health) * level_number + 1
-                    x = settings.GAP_SIZE / 2 + col_index * (settings.BLOCK_WIDTH + settings.GAP_SIZE)
-                    y = settings.GAP_SIZE / 2 + row_index * (settings.BLOCK_HEIGHT + settings.GAP_SIZE)
-                    self.create_block(health, x, y)
+                    self.create_block(int(health) * level_number + 1, row_index, col_index)
 
         if self.player is None:
             self.create_player()
@@ -264,26 +313,32 @@ class SpriteManager:
 
     def create_powerup(self, center: tuple, power: str):
         """
-        Create a powerup object.
+        Create a powerup object. A killed powerup is reused from the pool if there is any.
 
         Args:
             center (tuple): The center of the object. Must be a tuple of (x, y).
             power (str): The name of the powerup.
         """
-        power_up_image = pygame.image.load(settings.POWERS[power]['path'])
-        power_up = PowerUp(
-            sprite_manager=self,
-            sprite_groups=[self.all_sprites_group, self.power_up_sprites_group],
-            image=power_up_image,
-            rect=power_up_image.get_rect(center=center),
-            powerup_manager=self.powerup_manager,
-            power=power
-        )
-        self.power_ups.append(power_up)
+        power_up_image = surface_factory.load_image(settings.POWERS[power]['path'])
+        sprite_groups = [self.all_sprites_group, self.power_up_sprites_group]
+        rect = power_up_image.get_rect(center=center)
+        power_up = self.power_up_pool.acquire()
+        if power_up is None:
+            power_up = PowerUp(
+                sprite_manager=self,
+                sprite_groups=sprite_groups,
+                image=power_up_image,
+                rect=rect,
+                powerup_manager=self.powerup_manager,
+                power=power
+            )
+        else:
+            power_up.reset(sprite_groups=sprite_groups, image=power_up_image, rect=rect, power=power)
+        self.power_up_pool.add(power_up)
 
     def create_powerup_timer_info(self, power_name: str, powerup_time: (int, float)):
         """
-        Create powerup timer info object.
+        Create powerup timer info object. A killed timer info is reused from the pool if there is any.
 
         Args:
             power_name (str): The name of the powerup.
@@ -297,25 +352,44 @@ class SpriteManager:
             last_y = max(last_y, powerup_info_sprite.rect.y)
 
         color = pygame.Color('white')
-        font = pygame.font.Font(settings.GAME_FONT, size=settings.POWERUP_FONT_SIZE)
-        image = font.render(f'Time Left: {powerup_time}', True, color)
+        font = asset_cache.load_font(settings.GAME_FONT, size=settings.POWERUP_FONT_SIZE)
+        image = surface_factory.native(text_cache.render(font, f'Time Left: {powerup_time}', color))
         rect = image.get_rect(
             center=(
                 settings.GAME_WINDOW_WIDTH + settings.SCOREBOARD_WIDTH // 2,
                 last_y + settings.GAME_WINDOW_HEIGHT // 20
             )
         )
-        powerup_info = PowerUpTimerInfo(
-            sprite_manager=self,
-            sprite_groups=[self.all_sprites_group, self.power_up_timer_info_group],
-            image=image,
-            rect=rect,
-            font=font,
-            color=color,
-            power_name=power_name,
-            powerup_time=powerup_time
-        )
-        self.power_up_infos.append(powerup_info)
+        sprite_groups = [self.all_sprites_group, self.power_up_timer_info_group]
+        powerup_info = self.power_up_info_pool.acquire()
+        if powerup_info is None:
+            powerup_info = PowerUpTimerInfo(
+                sprite_manager=self,
+                sprite_groups=sprite_groups,
+                image=image,
+                rect=rect,
+                font=font,
+                color=color,
+                power_name=power_name,
+                powerup_time=powerup_time
+            )
+        else:
+            powerup_info.reset(
+                sprite_groups=sprite_groups,
+                image=image,
+                rect=rect,
+                power_name=power_name,
+                powerup_time=powerup_time
+            )
+        self.power_up_info_pool.add(powerup_info)
+
+    def clear_moving_sprites(self):
+        """
+        Kill all balls and powerups, e.g. when the level is finished. They return to their pools.
+        """
+        for group in (self.ball_sprites_group, self.power_up_sprites_group):
+            for sprite in group.sprites():
+                sprite.kill()
 
     def drop_powerup(self, block: Block):
         """
@@ -324,50 +398,149 @@ class SpriteManager:
         Args:
             block (Block): The block to drop powerup from.
         """
-        random_number = random.random()
+        random_number = self.random.random()
         potential_powers = []
         for power in settings.POWERS.keys():
             if random_number <= settings.POWERS[power]['probability']:
                 potential_powers.append(power)
         if len(potential_powers) > 0:
-            chosen_power = random.choice(potential_powers)
+            chosen_power = self.random.choice(potential_powers)
             self.create_powerup(block.rect.center, chosen_power)
 
-    def update(
-            self,
-            delta_time: float,
-            keys_pressed: pygame.key.ScancodeWrapper,
-            time_in_pause: float = 0
-    ):
+    def update(self, delta_time: float, keys_pressed: pygame.key.ScancodeWrapper):
         """
-        Update all objects during the game.
+        Update all objects during the game. Advances the game clock by delta_time.
+        Every group is timed by the profiler if it is enabled.
 
         Args:
             delta_time (float): Time passed since the last frame.
             keys_pressed (pygame.key.ScancodeWrapper): Keys pressed.
-            time_in_pause (float): Time passed in pause mode.
         """
-        self.powerup_manager.update(time_in_pause)
-        self.player.update(delta_time, keys_pressed)
-        self.block_sprites_group.update()
-        self.ball_sprites_group.update(delta_time, keys_pressed)
-        self.heart_sprites_group.update()
-        self.power_up_sprites_group.update(delta_time)
-        self.score_sprites_group.update()
-        self.power_up_timer_info_group.update(time_in_pause)
+        self.clock.advance(delta_time)
+        for group in self.get_interpolated_groups():
+            for sprite in group:
+                sprite.store_previous_position()
+
+        with profiler.section('update.powerup_manager'):
+            self.powerup_manager.update()
+        with profiler.section('update.player'):
+            self.player.update(delta_time, keys_pressed)
+        with profiler.section('update.balls'):
+            ball_count = len(self.ball_sprites_group)
+            start_time = time.perf_counter()
+            if self.ball_system is not None:
+                self.ball_system.update(delta_time, keys_pressed)
+            else:
+                self.ball_sprites_group.update(delta_time, keys_pressed)
+            if ball_count > 0:
+                ball_update_time = (time.perf_counter() - start_time) / ball_count
+                self.ball_update_time += 0.1 * (ball_update_time - self.ball_update_time)
+        with profiler.section('update.hearts'):
+            self.heart_sprites_group.update()
+        with profiler.section('update.powerups'):
+            self.power_up_sprites_group.update(delta_time)
+        with profiler.section('update.score'):
+            self.score_sprites_group.update()
+        with profiler.section('update.powerup_timers'):
+            self.power_up_timer_info_group.update()
+
+    def get_ball_limit(self) -> int:
+        """
+        Get the maximum number of balls. If the frame budget is set, balls must fit into the share of time according
+        to the measured update time per ball, but the balls in game are always allowed.
+
+        Returns:
+            int: The maximum number of balls.
+        """
+        ball_limit = settings.MAX_BALLS
+        if self.ball_frame_budget is not None and self.ball_update_time > 0:
+            budget_limit = int(self.ball_frame_budget * settings.PHYSICS_TIME_STEP / self.ball_update_time)
+            ball_limit = min(ball_limit, max(budget_limit, len(self.ball_sprites_group)))
+        return ball_limit
+
+    def get_interpolated_groups(self) -> tuple[pygame.sprite.Group, ...]:
+        """
+        Get the groups of moving sprites, which are drawn at positions interpolated between physics steps.
+
+        Returns:
+            tuple[pygame.sprite.Group, ...]: Groups of moving sprites.
+        """
+        return self.player_sprites_group, self.ball_sprites_group, self.power_up_sprites_group
+
+    def set_background(self, background: pygame.Surface):
+        """
+        Set the background of the game. Blocks are then drawn on the cached playfield layer with the background
+        instead of one by one.
 
-    def draw_all(self, display_surface: pygame.Surface):
+        Args:
+            background (pygame.Surface): The background. Must be opaque.
+        """
+        self.playfield_layer.set_background(background)
+
+    def get_playfield_surface(self) -> [None, pygame.Surface]:
+        """
+        Get the playfield layer with the background and all living blocks, patched where blocks changed.
+
+        Returns:
+            None, pygame.Surface: The layer. None if the background is not set.
+        """
+        if self.playfield_layer.background is None:
+            return None
+        return self.playfield_layer.get_surface()
+
+    def get_draw_list(self, alpha: float = 1.0) -> list[tuple[pygame.sprite.Sprite, pygame.Surface, pygame.Rect]]:
+        """
+        Get all objects in their drawing order with the image and the rectangle to draw them with.
+        Blocks are left out if the background is set, they are drawn on the playfield layer. In the debug mode of
+        the surface factory, images which are not in the native format are counted.
+
+        Args:
+            alpha (float): Fraction of the physics step passed since the last update, in range [0, 1].
+                Moving sprites are placed between their previous and current positions. Defaults to 1.
+
+        Returns:
+            list[tuple[pygame.sprite.Sprite, pygame.Surface, pygame.Rect]]: Sprites, their images and copies of
+                the rectangles to draw at.
+        """
+        interpolated_groups = self.get_interpolated_groups()
+        draw_list = []
+        for group in (
+                self.player_sprites_group,
+                self.ball_sprites_group,
+                self.block_field,
+                self.scoreboard_sprites_group,
+                self.heart_sprites_group,
+                self.power_up_sprites_group,
+                self.score_sprites_group,
+                self.power_up_timer_info_group
+        ):
+            if group is self.block_field:
+                if self.playfield_layer.background is None:
+                    draw_list.extend((block, block.image, block.rect) for block in self.block_field)
+                continue
+            if group in interpolated_groups:
+                for sprite in group:
+                    rect = sprite.image.get_rect(topleft=sprite.get_interpolated_position(alpha))
+                    draw_list.append((sprite, sprite.image, rect))
+            else:
+                for sprite in group:
+                    draw_list.append((sprite, sprite.image, sprite.rect.copy()))
+        if surface_factory.debug:
+            surface_factory.check_blits(image for _, image, _ in draw_list)
+        return draw_list
+
+    def draw_all(self, display_surface: pygame.Surface, alpha: float = 1.0):
         """
-        Draw all objects on the display
+        Draw all objects on the display. If the background is set, the playfield layer with the background and
+        blocks is drawn first.
 
         Args:
             display_surface (pygame.Surface): The surface to draw objects.
+            alpha (float): Fraction of the physics step passed since the last update, in range [0, 1].
+                Moving sprites are drawn between their previous and current positions. Defaults to 1.
         """
-        self.player_sprites_group.draw(surface=display_surface)
-        self.ball_sprites_group.draw(surface=display_surface)
-        self.block_sprites_group.draw(surface=display_surface)
-        self.scoreboard_sprites_group.draw(surface=display_surface)
-        self.heart_sprites_group.draw(surface=display_surface)
-        self.power_up_sprites_group.draw(surface=display_surface)
-        self.score_sprites_group.draw(surface=display_surface)
-        self.power_up_timer_info_group.draw(surface=display_surface)
+        playfield_surface = self.get_playfield_surface()
+        if playfield_surface is not None:
+            display_surface.blit(playfield_surface, (0, 0))
+            self.playfield_layer.pop_changed_rects()
+        display_surface.blits([(image, rect) for _, image, rect in self.get_draw_list(alpha)], doreturn=False)
@@ -0,0 +1,78 @@
+"""
+Module describing the pool of reusable sprites.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from breakout_game.sprites.sprite import _GameSprite
+
+
+class SpritePool:
+    """
+    Pool of sprites of one type which are created and killed often during the game, e.g. balls of the
+    multiply-balls powerup. Killed sprites are kept and reinitialized with their reset method instead of
+    constructing new ones, so spawning does not copy images or allocate vectors.
+
+    Sprites are registered with add, then kill returns them to the pool. The pool also keeps the list of living
+    sprites of the sprite manager up to date.
+
+    Note:
+        A sprite taken from the pool is the same object as the killed one, so references to killed sprites must
+        not be kept after the next spawn.
+
+    Attributes:
+        sprites (list[_GameSprite]): Living sprites of the pool's type. Shared with the sprite manager.
+        free (list[_GameSprite]): Killed sprites ready to be reused.
+        max_size (int): Maximum number of killed sprites kept. Defaults to 64.
+        created (int): Number of spawns which required a new sprite. Defaults to 0.
+        reused (int): Number of spawns served from the pool. Defaults to 0.
+
+    Args:
+        sprites (list[_GameSprite]): Living sprites of the pool's type.
+        max_size (int): Maximum number of killed sprites kept. Defaults to 64.
+
+    version: 1
+    """
+    def __init__(self, sprites: list[_GameSprite], max_size: int = 64):
+        self.sprites: list[_GameSprite] = sprites
+        self.free: list[_GameSprite] = []
+        self.max_size: int = max_size
+        self.created: int = 0
+        self.reused: int = 0
+
+    def acquire(self) -> [None, _GameSprite]:
+        """
+        Take a killed sprite from the pool. The caller must reinitialize it with its reset method.
+
+        Returns:
+            None, _GameSprite: The sprite, or None if the pool is empty and a new sprite has to be created.
+        """
+        if len(self.free) == 0:
+            self.created += 1
+            return None
+        self.reused += 1
+        return self.free.pop()
+
+    def add(self, sprite: _GameSprite):
+        """
+        Register the new or reinitialized sprite as living. The sprite returns to the pool when it is killed.
+
+        Args:
+            sprite (_GameSprite): The sprite.
+        """
+        sprite.pool = self
+        self.sprites.append(sprite)
+
+    def release(self, sprite: _GameSprite):
+        """
+        Return the killed sprite to the pool. Called by the sprite's kill method.
+
+        Args:
+            sprite (_GameSprite): The killed sprite.
+        """
+        if sprite in self.sprites:
+            self.sprites.remove(sprite)
+        if len(self.free) < self.max_size:
+            self.free.append(sprite)
@@ -0,0 +1,98 @@
+"""
+Swept AABB collision detection used by balls in the 'swept' collision mode.
+
+The time of impact is returned as a fraction of the displacement in range [0, 1] together with the sides hit:
+whether the ball hits a vertical side (left/right) and whether it hits a horizontal side (top/bottom).
+Both sides are hit in case of a corner hit.
+"""
+from __future__ import annotations
+
+import math
+
+import pygame
+
+from breakout_game.config import settings
+
+
+def get_time_of_impact(
+        position: pygame.math.Vector2,
+        size: tuple[int, int],
+        displacement: pygame.math.Vector2,
+        target_rect: pygame.Rect
+) -> [None, tuple[float, bool, bool]]:
+    """
+    Get the time of impact of a rectangle moving along the displacement with the static target rectangle.
+
+    The target is expanded by the size of the moving rectangle and intersected with the path of its top left corner.
+
+    Args:
+        position (pygame.math.Vector2): Top left corner of the moving rectangle.
+        size (tuple[int, int]): Width and height of the moving rectangle.
+        displacement (pygame.math.Vector2): Movement during the step.
+        target_rect (pygame.Rect): The rectangle to test against.
+
+    Returns:
+        None, tuple[float, bool, bool]: None if there is no impact during the step, else the time of impact and
+            the sides hit.
+    """
+    entry_times = []
+    exit_times = []
+    axes = (
+        (position.x, size[0], displacement.x, target_rect.left, target_rect.right),
+        (position.y, size[1], displacement.y, target_rect.top, target_rect.bottom)
+    )
+    for start, length, distance, target_start, target_end in axes:
+        if distance > 0:
+            entry_times.append((target_start - length - start) / distance)
+            exit_times.append((target_end - start) / distance)
+        elif distance < 0:
+            entry_times.append((target_end - start) / distance)
+            exit_times.append((target_start - length - start) / distance)
+        elif target_start - length < start < target_end:
+            entry_times.append(-math.inf)
+            exit_times.append(math.inf)
+        else:
+            return None
+
+    entry_time = max(entry_times)
+    exit_time = min(exit_times)
+    if entry_time > exit_time or entry_time < 0 or entry_time > 1:
+        return None
+    return entry_time, entry_times[0] == entry_time, entry_times[1] == entry_time
+
+
+def get_frame_time_of_impact(
+        position: pygame.math.Vector2,
+        size: tuple[int, int],
+        displacement: pygame.math.Vector2
+) -> [None, tuple[float, bool, bool]]:
+    """
+    Get the time of impact of a moving rectangle with the left, right and top sides of the game window.
+    The bottom side is open, the ball is lost there.
+
+    Args:
+        position (pygame.math.Vector2): Top left corner of the moving rectangle.
+        size (tuple[int, int]): Width and height of the moving rectangle.
+        displacement (pygame.math.Vector2): Movement during the step.
+
+    Returns:
+        None, tuple[float, bool, bool]: None if there is no impact during the step, else the time of impact and
+            the sides hit.
+    """
+    impacts = []
+    if displacement.x < 0:
+        impacts.append(((0 - position.x) / displacement.x, True, False))
+    elif displacement.x > 0:
+        impacts.append(((settings.GAME_WINDOW_WIDTH - size[0] - position.x) / displacement.x, True, False))
+    if displacement.y < 0:
+        impacts.append(((0 - position.y) / displacement.y, False, True))
+
+    impacts = [impact for impact in impacts if 0 <= impact[0] <= 1]
+    if len(impacts) == 0:
+        return None
+    time_of_impact = min(impact[0] for impact in impacts)
+    return (
+        time_of_impact,
+        any(impact[1] for impact in impacts if impact[0] == time_of_impact),
+        any(impact[2] for impact in impacts if impact[0] == time_of_impact)
+    )
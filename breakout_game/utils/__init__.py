@@ -1,4 +1,7 @@
 """
 Utils package.
 """
-from breakout_game.utils import path_utils, mixer_wrapper
+from breakout_game.utils import (
+    path_utils, mixer_wrapper, asset_cache, game_clock, text_cache, profiler, frame_pacer, surface_cache,
+    derived_cache, texture_atlas, surface_factory
+)
@@ -0,0 +1,208 @@
+"""
+Process-wide cache for images, sounds and fonts loaded from the assets folder.
+"""
+from __future__ import annotations
+
+import logging
+
+from pathlib import Path
+
+import pygame
+
+game_logger = logging.getLogger('')
+
+
+class NullSound:
+    """
+    Sound which does nothing. Used instead of pygame.mixer.Sound when the game runs headless.
+
+    Args:
+        volume (float): Volume of the sound. Defaults to 1.
+    """
+    def __init__(self, volume: float = 1.0):
+        self.volume = volume
+
+    def play(self, *args, **kwargs):
+        """
+        Do nothing.
+        """
+
+    def stop(self):
+        """
+        Do nothing.
+        """
+
+    def set_volume(self, volume: float):
+        """
+        Store the volume.
+
+        Args:
+            volume (float): Volume of the sound.
+        """
+        self.volume = volume
+
+    def get_volume(self) -> float:
+        """
+        Get the volume.
+
+        Returns:
+            float: Volume of the sound.
+        """
+        return self.volume
+
+
+class AssetCache:
+    """
+    Cache of decoded assets shared by all game objects.
+
+    Surfaces and sounds returned by the cache are shared. Callers must not modify them in place, they should
+    copy the surface first if it has to be changed (e.g. filled or blended).
+
+    Attributes:
+        hits (int): Number of requests served from the cache. Defaults to 0.
+        misses (int): Number of requests which required loading an asset from disk. Defaults to 0.
+        headless (bool): If true, images are not converted to the display format and sounds are NullSound
+            objects, so no display and no mixer are needed. Defaults to False. Use set_headless to change it.
+
+    version: 1
+    """
+    CONVERT_MODES = ('alpha', 'opaque', None)
+
+    def __init__(self):
+        self._images: dict[tuple, pygame.Surface] = {}
+        self._sounds: dict[tuple, pygame.mixer.Sound] = {}
+        self._fonts: dict[tuple, pygame.font.Font] = {}
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.headless: bool = False
+
+    def set_headless(self, headless: bool):
+        """
+        Switch the headless mode. The cache is purged, so assets loaded in another mode are not returned.
+
+        Args:
+            headless (bool): If true, no display and no mixer are used to load assets.
+        """
+        if headless != self.headless:
+            self.purge()
+            self.headless = headless
+
+    def load_image(
+            self,
+            path: [str, Path],
+            size: [None, tuple] = None,
+            convert_mode: [None, str] = 'alpha'
+    ) -> pygame.Surface:
+        """
+        Load an image, convert it to the display format and scale it.
+
+        Args:
+            path (str, Path): Absolute path of the image.
+            size (None, tuple): Size to scale the image to. Must be a tuple of (width, height).
+                Defaults to None. If None, the image is not scaled.
+            convert_mode (None, str): 'alpha' to use convert_alpha, 'opaque' to use convert, None to keep the
+                format of the file. Defaults to 'alpha'.
+
+        Returns:
+            pygame.Surface: Shared surface of the image.
+        """
+        if convert_mode not in self.CONVERT_MODES:
+            raise ValueError(f'Unknown convert mode {convert_mode}.')
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+
+        key = (str(path), size, convert_mode)
+        image = self._images.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        if size is not None:
+            image = pygame.transform.scale(self.load_image(path, convert_mode=convert_mode), size)
+        else:
+            image = pygame.image.load(path)
+            if convert_mode == 'alpha' and not self.headless:
+                image = image.convert_alpha()
+            elif convert_mode == 'opaque' and not self.headless:
+                image = image.convert()
+        self._images[key] = image
+        return image
+
+    def load_sound(self, path: [str, Path], volume: [None, float] = None) -> pygame.mixer.Sound:
+        """
+        Load a sound and set its volume.
+
+        Args:
+            path (str, Path): Absolute path of the sound.
+            volume (None, float): Volume of the sound in range [0, 1]. Defaults to None.
+                If None, the volume is not changed.
+
+        Returns:
+            pygame.mixer.Sound, NullSound: Shared sound object. NullSound in the headless mode.
+        """
+        key = (str(path), volume)
+        sound = self._sounds.get(key)
+        if sound is not None:
+            self.hits += 1
+            return sound
+
+        self.misses += 1
+        sound = NullSound() if self.headless else pygame.mixer.Sound(path)
+        if volume is not None:
+            sound.set_volume(volume)
+        self._sounds[key] = sound
+        return sound
+
+    def load_font(self, path: [str, Path], size: int) -> pygame.font.Font:
+        """
+        Load a font of the given size.
+
+        Args:
+            path (str, Path): Absolute path of the font.
+            size (int): Size of the font.
+
+        Returns:
+            pygame.font.Font: Shared font object.
+        """
+        key = (str(path), size)
+        font = self._fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+
+        self.misses += 1
+        font = pygame.font.Font(path, size)
+        self._fonts[key] = font
+        return font
+
+    def purge(self):
+        """
+        Drop all cached assets. Objects which still reference the assets keep them alive.
+
+        Note:
+            Called on level transitions, so assets of the previous level are not kept in memory.
+        """
+        game_logger.debug('Purging asset cache: %s', self.stats())
+        self._images.clear()
+        self._sounds.clear()
+        self._fonts.clear()
+
+    def stats(self) -> dict:
+        """
+        Get the cache counters.
+
+        Returns:
+            dict: Number of hits, misses and cached images, sounds and fonts.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'images': len(self._images),
+            'sounds': len(self._sounds),
+            'fonts': len(self._fonts)
+        }
+
+
+asset_cache = AssetCache()
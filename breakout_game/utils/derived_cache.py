@@ -0,0 +1,158 @@
+"""
+On-disk cache of surfaces derived from assets, e.g. backgrounds scaled to the window and darkened.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import threading
+
+from pathlib import Path
+from typing import Callable
+
+import pygame
+
+game_logger = logging.getLogger('')
+
+_MAGIC = b'BRKD'
+# Magic, width, height
+_HEADER = struct.Struct('<4sII')
+
+
+class DerivedCache:
+    """
+    Cache of derived surfaces stored as raw RGB pixels in the cache directory.
+
+    An entry is keyed by the SHA-1 hash of the source file, the resolution the surface was made for and the name of
+    the transform, so a changed asset, another resolution or another transform never hits a stale entry. Entries are
+    memory-mapped and wrapped into a surface without decoding. Files are written to a temporary name and then
+    renamed, so concurrent readers never see partial files.
+
+    Surfaces loaded from the cache are in the 24-bit RGB format and backed by the memory map. Returned surfaces may be
+    shared, so they must not be modified in place.
+
+    Attributes:
+        cache_dir (None, Path): Directory of the cache files. Defaults to None. If None, the cache is disabled and
+            every surface is built.
+        hits (int): Number of surfaces loaded from the cache. Defaults to 0.
+        misses (int): Number of surfaces which had to be built. Defaults to 0.
+
+    version: 1
+    """
+    def __init__(self, cache_dir: [None, str, Path] = None):
+        self.cache_dir: [None, Path] = Path(cache_dir) if cache_dir is not None else None
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get_entry_path(self, source_path: [str, Path], resolution: tuple[int, int], transform: str) -> Path:
+        """
+        Get the path of the cache file of the derived surface.
+
+        Args:
+            source_path (str, Path): Path of the source asset.
+            resolution (tuple[int, int]): The resolution the surface is made for.
+            transform (str): Name of the transform applied to the source, e.g. 'cover-darken'.
+
+        Returns:
+            Path: Path of the cache file.
+        """
+        source_path = Path(source_path)
+        digest = hashlib.sha1(source_path.read_bytes()).hexdigest()[:16]
+        width, height = resolution
+        return self.cache_dir / f'{source_path.stem}-{transform}-{width}x{height}-{digest}.rgb'
+
+    def get_surface(
+            self,
+            source_path: [str, Path],
+            resolution: tuple[int, int],
+            transform: str,
+            build: Callable[[], pygame.Surface]
+    ) -> pygame.Surface:
+        """
+        Get the derived surface from the cache or build and store it.
+
+        Args:
+            source_path (str, Path): Path of the source asset.
+            resolution (tuple[int, int]): The resolution the surface is made for.
+            transform (str): Name of the transform applied to the source.
+            build (Callable[[], pygame.Surface]): Builds the derived surface from the source. Called on a miss.
+
+        Returns:
+            pygame.Surface: The derived surface, mapped from the cache file or as built. Not converted to the display
+                format.
+        """
+        if self.cache_dir is None:
+            self.misses += 1
+            return build()
+
+        entry_path = self.get_entry_path(source_path, resolution, transform)
+        surface = self.load(entry_path)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = build()
+        self.store(entry_path, surface)
+        return surface
+
+    @staticmethod
+    def load(entry_path: Path) -> [None, pygame.Surface]:
+        """
+        Map the cache file into a surface.
+
+        Args:
+            entry_path (Path): Path of the cache file.
+
+        Returns:
+            None, pygame.Surface: The surface. None if the file does not exist or is not a valid entry.
+        """
+        try:
+            with open(entry_path, 'rb') as entry_file:
+                pixels = mmap.mmap(entry_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if len(pixels) < _HEADER.size:
+            return None
+        magic, width, height = _HEADER.unpack_from(pixels)
+        if magic != _MAGIC or len(pixels) != _HEADER.size + width * height * 3:
+            game_logger.warning('Invalid derived cache entry %s', entry_path)
+            return None
+        return pygame.image.frombuffer(memoryview(pixels)[_HEADER.size:], (width, height), 'RGB')
+
+    @staticmethod
+    def store(entry_path: Path, surface: pygame.Surface):
+        """
+        Write the surface to the cache file. Failures are logged, the game runs on without the entry.
+
+        Args:
+            entry_path (Path): Path of the cache file.
+            surface (pygame.Surface): The derived surface.
+        """
+        temporary_path = entry_path.with_name(f'{entry_path.name}.{os.getpid()}-{threading.get_ident()}.tmp')
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temporary_path, 'wb') as entry_file:
+                entry_file.write(_HEADER.pack(_MAGIC, *surface.get_size()))
+                entry_file.write(pygame.image.tobytes(surface, 'RGB'))
+            os.replace(temporary_path, entry_path)
+        except OSError:
+            game_logger.warning('Could not write derived cache entry %s', entry_path, exc_info=True)
+            return
+        game_logger.debug('Derived cache entry %s written', entry_path)
+
+    def stats(self) -> dict:
+        """
+        Get the cache counters.
+
+        Returns:
+            dict: Number of hits and misses.
+        """
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+derived_cache = DerivedCache()
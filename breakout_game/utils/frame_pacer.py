@@ -0,0 +1,113 @@
+"""
+Frame pacer limiting the frame rate of the game loop without keeping the CPU busy.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import time
+
+from collections import deque
+
+import pygame
+
+game_logger = logging.getLogger('')
+
+
+class FramePacer:
+    """
+    Frame limiter which sleeps for most of the frame and spins only for the last spin_time, so frames are as
+    precise as with pygame.time.Clock.tick_busy_loop, but the CPU is idle most of the time.
+
+    Durations of the last frames are kept to report the achieved frame rate and jitter. The window is cleared
+    when the target frame rate changes, e.g. when the game switches to the idle rate of a static menu.
+
+    Attributes:
+        spin_time (float): Time in seconds before the end of the frame spent spinning instead of sleeping.
+            Covers the inaccuracy of time.sleep. Defaults to 0.002.
+        poll_time (float): Time in seconds between checks for new events when waking on events.
+            Defaults to 0.005.
+        window (int): Number of the last frames kept for the statistics. Defaults to 120.
+        target_fps (None, int, float): Frame rate of the last tick. Defaults to None.
+        frame_times (deque[float]): Durations of the last frames in seconds.
+        last_tick (float): time.perf_counter value at the end of the last tick.
+
+    Args:
+        spin_time (float): Time in seconds spent spinning at the end of the frame. Defaults to 0.002.
+        poll_time (float): Time in seconds between checks for new events. Defaults to 0.005.
+        window (int): Number of the last frames kept for the statistics. Defaults to 120.
+
+    version: 1
+    """
+    def __init__(self, spin_time: float = 0.002, poll_time: float = 0.005, window: int = 120):
+        self.spin_time: float = spin_time
+        self.poll_time: float = poll_time
+        self.window: int = window
+        self.target_fps: [None, int, float] = None
+        self.frame_times: deque[float] = deque(maxlen=window)
+        self.last_tick: float = time.perf_counter()
+
+    def tick(self, fps: [int, float], wake_on_event: bool = False) -> float:
+        """
+        Wait until the end of the frame.
+
+        Args:
+            fps (int, float): The target frame rate.
+            wake_on_event (bool): Whether the frame ends early when an event arrives. Defaults to False.
+                Used with low frame rates, so the input is not delayed.
+
+        Returns:
+            float: Time in seconds passed since the previous tick.
+        """
+        if fps != self.target_fps:
+            if len(self.frame_times) > 0:
+                game_logger.debug('Frame rate %s changed to %s: %s', self.target_fps, fps, self.format_stats())
+            self.target_fps = fps
+            self.frame_times.clear()
+
+        end_time = self.last_tick + 1 / fps
+        now = time.perf_counter()
+        if wake_on_event:
+            while now < end_time and not pygame.event.peek():
+                time.sleep(min(self.poll_time, end_time - now))
+                now = time.perf_counter()
+        else:
+            if end_time - now > self.spin_time:
+                time.sleep(end_time - now - self.spin_time)
+            while now < end_time:
+                now = time.perf_counter()
+
+        frame_time = now - self.last_tick
+        self.last_tick = now
+        self.frame_times.append(frame_time)
+        return frame_time
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Get the statistics of the last frames.
+
+        Returns:
+            dict[str, float]: Target and achieved frame rate, mean frame time and jitter, the standard deviation
+                of frame times, in milliseconds. Zeros if no frame was measured.
+        """
+        count = len(self.frame_times)
+        if count == 0:
+            return {'target_fps': self.target_fps or 0, 'fps': 0.0, 'frame_time_ms': 0.0, 'jitter_ms': 0.0}
+        mean = sum(self.frame_times) / count
+        variance = sum((frame_time - mean) ** 2 for frame_time in self.frame_times) / count
+        return {
+            'target_fps': self.target_fps,
+            'fps': 1 / mean if mean > 0 else 0.0,
+            'frame_time_ms': mean * 1000,
+            'jitter_ms': math.sqrt(variance) * 1000
+        }
+
+    def format_stats(self) -> str:
+        """
+        Get the statistics of the last frames as text.
+
+        Returns:
+            str: The achieved frame rate and jitter, e.g. 'FPS 59.9/60 JITTER 0.05 MS'.
+        """
+        stats = self.get_stats()
+        return f'FPS {stats["fps"]:.1f}/{stats["target_fps"]} JITTER {stats["jitter_ms"]:.2f} MS'
@@ -0,0 +1,40 @@
+"""
+Game clock driving all timers in the game.
+"""
+
+
+class GameClock:
+    """
+    Simulated time of the game in seconds.
+
+    The clock is advanced only by the game loop together with the physics, so the time spent in menus and
+    pause is not counted, and the game can be simulated faster than real time.
+
+    Attributes:
+        time (float): Current time of the clock. Defaults to 0.
+
+    Args:
+        start_time (float): The time to start from. Defaults to 0.
+
+    version: 1
+    """
+    def __init__(self, start_time: float = 0.0):
+        self.time: float = start_time
+
+    def now(self) -> float:
+        """
+        Get the current time of the clock.
+
+        Returns:
+            float: Time in seconds.
+        """
+        return self.time
+
+    def advance(self, delta_time: float):
+        """
+        Advance the clock.
+
+        Args:
+            delta_time (float): Time in seconds to advance the clock by.
+        """
+        self.time += delta_time
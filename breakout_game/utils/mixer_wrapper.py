@@ -0,0 +1,212 @@
+"""
+Wrapper of the pygame mixer playing sound effects through a bank of reserved channels.
+"""
+from __future__ import annotations
+
+import logging
+
+from pathlib import Path
+
+import pygame
+
+from breakout_game.utils.asset_cache import asset_cache
+
+game_logger = logging.getLogger('')
+
+
+class NullChannel:
+    """
+    Mixer channel which does nothing. Used instead of pygame.mixer.Channel when the game runs headless or the mixer
+    is not initialized.
+    """
+    def play(self, *args, **kwargs):
+        """
+        Do nothing.
+        """
+
+    def stop(self):
+        """
+        Do nothing.
+        """
+
+    def get_busy(self) -> bool:
+        """
+        Never busy.
+
+        Returns:
+            bool: False.
+        """
+        return False
+
+
+class _Voice:
+    """
+    Reserved channel of the sound bank and the effect started on it.
+    """
+    __slots__ = ('channel', 'name', 'started')
+
+    def __init__(self, channel: [pygame.mixer.Channel, NullChannel]):
+        self.channel = channel
+        self.name: [None, str] = None
+        self.started: int = -1
+
+
+class SoundBank:
+    """
+    Bank of sound effects shared by all game objects.
+
+    Every effect is decoded once through the asset cache. Requests are collected during the frame and started by
+    flush once per frame, so an effect requested many times in a frame, e.g. by a multi-ball chain hitting 30 blocks,
+    costs one mixer call. At most plays_per_frame effects are started per frame, the rest is dropped.
+
+    Effects play on channels reserved with pygame.mixer.set_reserved, so they do not compete with other sounds.
+    An effect which is still playing is restarted on its channel, else a free channel is used. If all channels
+    are busy, the voice started first is stolen.
+
+    In the headless mode of the asset cache, or without an initialized mixer, the channels are NullChannel objects.
+
+    Attributes:
+        effects (dict[str, tuple[Path, None, float]]): Path and volume of every effect by name. Defaults to {}.
+        channel_count (int): Number of reserved channels. Defaults to 4.
+        plays_per_frame (int): Maximum number of effects started per frame. Defaults to 4.
+        pending (dict[str, None]): Effects requested since the last flush in the order of the first request.
+        requested (int): Number of requests. Defaults to 0.
+        played (int): Number of effects started. Defaults to 0.
+        dropped (int): Number of effects dropped by the limit per frame. Defaults to 0.
+
+    Note:
+        The bank is configured from settings by every sprite manager. Configuring it again with the same settings does
+        nothing, so restarts, simulations and tests keep the loaded sounds and the reserved channels.
+
+    version: 1
+    """
+    def __init__(self):
+        self.effects: dict[str, tuple[Path, [None, float]]] = {}
+        self.channel_count: int = 4
+        self.plays_per_frame: int = 4
+        self.pending: dict[str, None] = {}
+
+        self.requested: int = 0
+        self.played: int = 0
+        self.dropped: int = 0
+
+        self._sounds: dict[tuple[str, bool], [pygame.mixer.Sound]] = {}
+        self._voices: list[_Voice] = []
+        self._voices_headless: [None, bool] = None
+
+    def configure(self, effects: dict[str, tuple[Path, [None, float]]], channel_count: int, plays_per_frame: int):
+        """
+        Set the effects and the limits. Does nothing if they are unchanged. Loaded sounds are dropped if the effects
+        change, channels are reserved again if their number changes.
+
+        Args:
+            effects (dict[str, tuple[Path, None, float]]): Path and volume of every effect by name.
+            channel_count (int): Number of reserved channels.
+            plays_per_frame (int): Maximum number of effects started per frame.
+        """
+        if (effects, channel_count, plays_per_frame) == (self.effects, self.channel_count, self.plays_per_frame):
+            return
+        if effects != self.effects:
+            self.effects = dict(effects)
+            self._sounds.clear()
+        if channel_count != self.channel_count:
+            self.channel_count = channel_count
+            self._voices_headless = None
+        self.plays_per_frame = plays_per_frame
+
+    def play(self, name: str):
+        """
+        Request the effect. It is started by the next flush.
+
+        Args:
+            name (str): Name of the effect, a key of effects.
+        """
+        if name not in self.effects:
+            raise KeyError(f'Unknown sound effect {name}.')
+        self.requested += 1
+        self.pending[name] = None
+
+    def get_sound(self, name: str) -> pygame.mixer.Sound:
+        """
+        Get the decoded effect. The effect is loaded once per headless mode of the asset cache and kept when the asset
+        cache is purged.
+
+        Args:
+            name (str): Name of the effect.
+
+        Returns:
+            pygame.mixer.Sound, NullSound: The shared sound.
+        """
+        key = (name, asset_cache.headless)
+        sound = self._sounds.get(key)
+        if sound is None:
+            path, volume = self.effects[name]
+            sound = asset_cache.load_sound(path, volume=volume)
+            self._sounds[key] = sound
+        return sound
+
+    def get_voices(self) -> list[_Voice]:
+        """
+        Get the reserved channels. They are reserved on the first use and again when the headless mode changes.
+
+        Returns:
+            list[_Voice]: The voices.
+        """
+        headless = asset_cache.headless or not pygame.mixer.get_init()
+        if headless != self._voices_headless:
+            if headless:
+                self._voices = [_Voice(NullChannel()) for _ in range(self.channel_count)]
+            else:
+                pygame.mixer.set_reserved(self.channel_count)
+                self._voices = [_Voice(pygame.mixer.Channel(index)) for index in range(self.channel_count)]
+                game_logger.debug('Reserved %s mixer channels for sound effects', self.channel_count)
+            self._voices_headless = headless
+        return self._voices
+
+    def get_voice(self, name: str) -> _Voice:
+        """
+        Choose the voice for the effect: the voice playing the same effect, a free voice or the voice started first.
+
+        Args:
+            name (str): Name of the effect.
+
+        Returns:
+            _Voice: The voice.
+        """
+        voices = self.get_voices()
+        for voice in voices:
+            if voice.name == name:
+                return voice
+        for voice in voices:
+            if not voice.channel.get_busy():
+                return voice
+        return min(voices, key=lambda voice: voice.started)
+
+    def flush(self):
+        """
+        Start the effects requested since the last flush. Called once per frame.
+        """
+        if len(self.pending) == 0:
+            return
+        for index, name in enumerate(self.pending):
+            if index >= self.plays_per_frame:
+                self.dropped += len(self.pending) - index
+                break
+            voice = self.get_voice(name)
+            voice.channel.play(self.get_sound(name))
+            voice.name = name
+            voice.started = self.played
+            self.played += 1
+        self.pending.clear()
+
+    def stats(self) -> dict:
+        """
+        Get the counters of the bank.
+
+        Returns:
+            dict: Number of requested, played and dropped effects.
+        """
+        return {'requested': self.requested, 'played': self.played, 'dropped': self.dropped}
+
+
+sound_bank = SoundBank()
@@ -0,0 +1,210 @@
+"""
+Opt-in frame profiler. Sections of the game loop are timed with perf_counter_ns and kept in rolling windows.
+"""
+from __future__ import annotations
+
+import bisect
+import csv
+import json
+import logging
+import time
+
+from collections import deque
+from pathlib import Path
+from typing import Callable
+
+import pygame
+
+game_logger = logging.getLogger('')
+
+
+class _Section:
+    """
+    Context manager timing a section of code.
+    """
+    __slots__ = ('owner', 'name', 'start')
+
+    def __init__(self, owner: Profiler, name: str):
+        self.owner = owner
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info):
+        self.owner.record(self.name, time.perf_counter_ns() - self.start)
+
+
+class _NullSection:
+    """
+    Context manager doing nothing. Used when the profiler is disabled.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NULL_SECTION = _NullSection()
+
+
+class Profiler:
+    """
+    Profiler of the game loop.
+
+    Sections are timed with `with profiler.section(name):`. When the profiler is disabled, section returns a shared
+    context manager which does nothing, so the instrumentation costs only a method call.
+
+    Attributes:
+        enabled (bool): Whether sections are timed. Defaults to False.
+        window (int): Number of the last samples kept per section. Defaults to 600.
+        samples (dict[str, deque[int]]): The last samples of every section in nanoseconds.
+        overlay_visible (bool): Whether the overlay is drawn. Defaults to False.
+        dump_path (None, str, Path): File to dump the statistics to on exit. Defaults to None.
+            The format is CSV if the suffix is .csv, else JSON.
+
+    Args:
+        window (int): Number of the last samples kept per section. Defaults to 600.
+
+    version: 2
+    """
+    # Upper edges of histogram bins in microseconds. The last bin collects all longer samples.
+    HISTOGRAM_EDGES_US = (50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000, 33000)
+    # The overlay text is rendered again after this time in seconds, so it is readable and cheap.
+    OVERLAY_REFRESH_TIME = 0.25
+
+    def __init__(self, window: int = 600):
+        self.enabled: bool = False
+        self.window: int = window
+        self.samples: dict[str, deque[int]] = {}
+        self.overlay_visible: bool = False
+        self.dump_path: [None, str, Path] = None
+
+        self._overlay: [None, pygame.Surface] = None
+        self._overlay_time: float = 0
+
+    def section(self, name: str) -> [_Section, _NullSection]:
+        """
+        Get the context manager timing the section.
+
+        Args:
+            name (str): Name of the section, e.g. 'update.balls'.
+
+        Returns:
+            _Section, _NullSection: The context manager.
+        """
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def record(self, name: str, duration_ns: int):
+        """
+        Add the sample of the section.
+
+        Args:
+            name (str): Name of the section.
+            duration_ns (int): Duration in nanoseconds.
+        """
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append(duration_ns)
+
+    def toggle_overlay(self):
+        """
+        Show or hide the overlay. The profiler is enabled when the overlay is shown. When it is hidden, the
+        profiler stays enabled only if the statistics are dumped on exit.
+        """
+        self.overlay_visible = not self.overlay_visible
+        self.enabled = self.overlay_visible or self.dump_path is not None
+        self._overlay = None
+        game_logger.info('Profiler overlay %s', 'shown' if self.overlay_visible else 'hidden')
+
+    def get_stats(self) -> dict[str, dict]:
+        """
+        Get the statistics of every section over the rolling window.
+
+        Returns:
+            dict[str, dict]: Number of samples, mean, p50, p90, p99 and max in milliseconds and the histogram
+                counts of every section.
+        """
+        stats = {}
+        for name, samples in sorted(self.samples.items()):
+            if len(samples) == 0:
+                continue
+            ordered = sorted(samples)
+            histogram = [0] * (len(self.HISTOGRAM_EDGES_US) + 1)
+            for sample in ordered:
+                histogram[bisect.bisect_left(self.HISTOGRAM_EDGES_US, sample / 1000)] += 1
+            stats[name] = {
+                'count': len(ordered),
+                'mean_ms': sum(ordered) / len(ordered) / 1e6,
+                'p50_ms': ordered[int((len(ordered) - 1) * 0.5)] / 1e6,
+                'p90_ms': ordered[int((len(ordered) - 1) * 0.9)] / 1e6,
+                'p99_ms': ordered[int((len(ordered) - 1) * 0.99)] / 1e6,
+                'max_ms': ordered[-1] / 1e6,
+                'histogram': histogram
+            }
+        return stats
+
+    def dump(self, path: [None, str, Path] = None):
+        """
+        Dump the statistics to a CSV or JSON file.
+
+        Args:
+            path (None, str, Path): The file. Defaults to None. If None, dump_path is used.
+        """
+        path = Path(path or self.dump_path)
+        stats = self.get_stats()
+        if path.suffix == '.csv':
+            with open(path, 'w', encoding='utf-8', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(['section', 'count', 'mean_ms', 'p50_ms', 'p90_ms', 'p99_ms', 'max_ms'] +
+                                [f'le_{edge}us' for edge in self.HISTOGRAM_EDGES_US] + ['overflow'])
+                for name, section_stats in stats.items():
+                    writer.writerow([name] + [section_stats[key] for key in (
+                        'count', 'mean_ms', 'p50_ms', 'p90_ms', 'p99_ms', 'max_ms'
+                    )] + section_stats['histogram'])
+        else:
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump({'histogram_edges_us': self.HISTOGRAM_EDGES_US, 'sections': stats}, file, indent=2)
+        game_logger.info('Profile of %s sections saved to %s', len(stats), path)
+
+    def get_overlay(self, font: pygame.font.Font, width: int,
+                    get_header_lines: [None, Callable[[], list[str]]] = None) -> pygame.Surface:
+        """
+        Get the overlay with p50 and p99 timings of all sections. The overlay is rendered again only after
+        OVERLAY_REFRESH_TIME.
+
+        Args:
+            font (pygame.font.Font): The font of the text.
+            width (int): Width of the overlay.
+            get_header_lines (None, Callable[[], list[str]]): Function returning extra lines shown above the
+                sections, e.g. the frame rate. Defaults to None. Called only when the overlay is rendered again.
+
+        Returns:
+            pygame.Surface: The opaque overlay.
+        """
+        now = time.perf_counter()
+        if self._overlay is not None and now - self._overlay_time < self.OVERLAY_REFRESH_TIME:
+            return self._overlay
+
+        lines = get_header_lines() if get_header_lines is not None else []
+        lines.append('SECTION P50/P99 MS')
+        for name, section_stats in self.get_stats().items():
+            lines.append(f'{name} {section_stats["p50_ms"]:.2f}/{section_stats["p99_ms"]:.2f}')
+        line_height = font.get_linesize()
+        self._overlay = pygame.Surface((width, line_height * len(lines) + line_height // 2))
+        self._overlay.fill((20, 20, 20))
+        for index, line in enumerate(lines):
+            position = (line_height // 4, line_height // 4 + index * line_height)
+            self._overlay.blit(font.render(line, True, (0, 255, 0)), position)
+        self._overlay_time = now
+        return self._overlay
+
+
+profiler = Profiler()
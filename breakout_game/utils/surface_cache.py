@@ -0,0 +1,94 @@
+"""
+Process-wide cache of transformed variants of surfaces, e.g. balls and paddles resized by powerups.
+"""
+from __future__ import annotations
+
+import logging
+
+import pygame
+
+game_logger = logging.getLogger('')
+
+
+class SurfaceCache:
+    """
+    Cache of scaled and tinted variants of base surfaces.
+
+    A variant is always made from the base surface, never from another variant, so applying and restoring
+    powerups does not accumulate resampling loss. Sprites with the same base share the variant, e.g. all balls of
+    multiply-balls share one big red ball.
+
+    Variants are keyed by the identity of the base surface. The base is kept with its variants, so its id is not
+    reused while the variants are cached. Bases and variants are shared and must not be modified in place.
+
+    Attributes:
+        hits (int): Number of variants served from the cache. Defaults to 0.
+        misses (int): Number of variants which had to be made. Defaults to 0.
+
+    version: 1
+    """
+    def __init__(self):
+        self._variants: dict[tuple, tuple[pygame.Surface, pygame.Surface]] = {}
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get_variant(
+            self,
+            base: pygame.Surface,
+            size: [None, tuple[int, int]] = None,
+            tint: [None, tuple[int, int, int]] = None
+    ) -> pygame.Surface:
+        """
+        Get the base surface scaled to the size and with the color added.
+
+        Args:
+            base (pygame.Surface): The base surface, e.g. the original image of a sprite.
+            size (None, tuple[int, int]): Size of the variant. Defaults to None. If None, the size of the base.
+            tint (None, tuple[int, int, int]): RGB color added to the variant with BLEND_RGB_ADD. Defaults to None.
+                If None, the color is not changed.
+
+        Returns:
+            pygame.Surface: Shared variant. The base itself if neither the size nor the color change.
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+            if size == base.get_size():
+                size = None
+        if size is None and tint is None:
+            return base
+
+        key = (id(base), size, tint)
+        variant = self._variants.get(key)
+        if variant is not None:
+            self.hits += 1
+            return variant[1]
+
+        self.misses += 1
+        image = pygame.transform.scale(base, size) if size is not None else base.copy()
+        if tint is not None:
+            image.fill(tint, special_flags=pygame.BLEND_RGB_ADD)  # pylint: disable=E1101
+        self._variants[key] = (base, image)
+        return image
+
+    def purge(self):
+        """
+        Drop all cached variants. Sprites which still use the variants keep them alive.
+
+        Note:
+            Called on level transitions together with the asset cache.
+        """
+        game_logger.debug('Purging surface cache: %s', self.stats())
+        self._variants.clear()
+
+    def stats(self) -> dict:
+        """
+        Get the cache counters.
+
+        Returns:
+            dict: Number of hits, misses and cached variants.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'variants': len(self._variants)}
+
+
+surface_cache = SurfaceCache()
@@ -0,0 +1,209 @@
+"""
+Factory of sprite surfaces guaranteeing the pixel format of the display.
+"""
+from __future__ import annotations
+
+import logging
+
+from pathlib import Path
+from typing import Iterable
+
+import pygame
+
+from breakout_game.utils.asset_cache import asset_cache
+from breakout_game.utils.surface_cache import surface_cache
+from breakout_game.utils.texture_atlas import texture_atlas
+
+game_logger = logging.getLogger('')
+
+
+def get_format(surface: pygame.Surface) -> tuple[int, tuple[int, int, int, int]]:
+    """
+    Get the pixel format of the surface.
+
+    Args:
+        surface (pygame.Surface): The surface.
+
+    Returns:
+        tuple[int, tuple[int, int, int, int]]: Bits per pixel and the RGBA masks.
+    """
+    return surface.get_bitsize(), surface.get_masks()
+
+
+class SurfaceFactory:
+    """
+    Factory of all sprite images.
+
+    Surfaces blitted in a format other than the format of the display are converted pixel by pixel on every blit.
+    Images made by the factory are in the native format: the format of the display for opaque images and the format
+    of convert_alpha for images with per-pixel alpha. Variants made from native images by the surface cache keep
+    the format. Without a display, or in the headless mode of the asset cache, nothing is converted.
+
+    In the debug mode the images of sprites drawn every frame are checked and blits from non-native surfaces are
+    counted. Every new non-native format is logged once.
+
+    Attributes:
+        debug (bool): Whether blits from non-native surfaces are counted. Defaults to False.
+        conversions (int): Number of surfaces converted by the factory. Defaults to 0.
+        non_native_blits (int): Number of blits from non-native surfaces counted in the debug mode. Defaults to 0.
+
+    version: 1
+    """
+    def __init__(self):
+        self.debug: bool = False
+        self.conversions: int = 0
+        self.non_native_blits: int = 0
+
+        self._display: [None, pygame.Surface] = None
+        self._native_formats: [None, tuple[tuple, tuple]] = None
+        self._converted: dict[int, tuple[pygame.Surface, pygame.Surface]] = {}
+        self._reported_formats: set[tuple] = set()
+
+    def get_native_formats(self) -> [None, tuple[tuple, tuple]]:
+        """
+        Get the native formats of the current display.
+
+        Returns:
+            None, tuple[tuple, tuple]: The opaque and the per-pixel alpha format. None if there is no display or the
+                asset cache is headless.
+        """
+        display = pygame.display.get_surface()
+        if display is None or asset_cache.headless:
+            return None
+        if display is not self._display:
+            alpha_surface = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()  # pylint: disable=E1101
+            self._native_formats = (get_format(display), get_format(alpha_surface))
+            self._display = display
+        return self._native_formats
+
+    def is_native(self, surface: pygame.Surface) -> bool:
+        """
+        Check whether the surface is in the native format.
+
+        Args:
+            surface (pygame.Surface): The surface.
+
+        Returns:
+            bool: True if the surface is blitted without format conversion, or if there is nothing to convert to.
+        """
+        native_formats = self.get_native_formats()
+        if native_formats is None:
+            return True
+        has_alpha = surface.get_flags() & pygame.SRCALPHA  # pylint: disable=E1101
+        return get_format(surface) == native_formats[1 if has_alpha else 0]
+
+    def _convert(self, surface: pygame.Surface) -> pygame.Surface:
+        self.conversions += 1
+        if surface.get_flags() & pygame.SRCALPHA:  # pylint: disable=E1101
+            return surface.convert_alpha()
+        return surface.convert()
+
+    def native(self, surface: pygame.Surface) -> pygame.Surface:
+        """
+        Get the surface in the native format.
+
+        Args:
+            surface (pygame.Surface): The surface. Left untouched.
+
+        Returns:
+            pygame.Surface: The surface itself if it is native, else its shared converted copy.
+        """
+        if self.is_native(surface):
+            return surface
+        converted = self._converted.get(id(surface))
+        if converted is None:
+            converted = (surface, self._convert(surface))
+            self._converted[id(surface)] = converted
+        return converted[1]
+
+    def new_surface(self, size: tuple[int, int], alpha: bool = False) -> pygame.Surface:
+        """
+        Create a new surface in the native format.
+
+        Args:
+            size (tuple[int, int]): Size of the surface.
+            alpha (bool): Whether the surface has per-pixel alpha. Defaults to False.
+
+        Returns:
+            pygame.Surface: The new surface, owned by the caller.
+        """
+        surface = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)  # pylint: disable=E1101
+        return surface if self.is_native(surface) else self._convert(surface)
+
+    def load_image(self, path: [str, Path], size: [None, tuple] = None) -> pygame.Surface:
+        """
+        Load the image from the texture atlas, or from its file if it is not in the atlas.
+
+        Args:
+            path (str, Path): Absolute path of the image in assets/images.
+            size (None, tuple): Size to scale the image to. Must be a tuple of (width, height).
+                Defaults to None. If None, the image is not scaled.
+
+        Returns:
+            pygame.Surface: Shared image in the native format.
+        """
+        return self.native(texture_atlas.get_image(path, size=size))
+
+    def get_variant(
+            self,
+            base: pygame.Surface,
+            size: [None, tuple[int, int]] = None,
+            tint: [None, tuple[int, int, int]] = None
+    ) -> pygame.Surface:
+        """
+        Get the scaled and tinted variant of the base from the surface cache.
+
+        Args:
+            base (pygame.Surface): The base surface.
+            size (None, tuple[int, int]): Size of the variant. Defaults to None. If None, the size of the base.
+            tint (None, tuple[int, int, int]): RGB color added to the variant. Defaults to None.
+
+        Returns:
+            pygame.Surface: Shared variant in the native format.
+        """
+        return surface_cache.get_variant(self.native(base), size, tint)
+
+    def check_blits(self, surfaces: Iterable[pygame.Surface]):
+        """
+        Count the surfaces which are not native in the debug mode. Does nothing if the debug mode is off.
+
+        Args:
+            surfaces (Iterable[pygame.Surface]): Surfaces blitted in the frame.
+        """
+        if not self.debug:
+            return
+        for surface in surfaces:
+            if self.is_native(surface):
+                continue
+            self.non_native_blits += 1
+            surface_format = get_format(surface)
+            if surface_format not in self._reported_formats:
+                self._reported_formats.add(surface_format)
+                game_logger.warning('Blit from a non-native surface of size %s and format %s',
+                                    surface.get_size(), surface_format)
+
+    def purge(self):
+        """
+        Drop the converted copies. Sprites which still use them keep them alive.
+
+        Note:
+            Called on level transitions together with the other caches.
+        """
+        game_logger.debug('Purging surface factory: %s', self.stats())
+        self._converted.clear()
+
+    def stats(self) -> dict:
+        """
+        Get the factory counters.
+
+        Returns:
+            dict: Number of conversions, cached converted copies and non-native blits.
+        """
+        return {
+            'conversions': self.conversions,
+            'converted': len(self._converted),
+            'non_native_blits': self.non_native_blits
+        }
+
+
+surface_factory = SurfaceFactory()
@@ -0,0 +1,148 @@
+"""
+Cache of rendered text. Whole strings are memoized with LRU eviction and changing fields (e.g. numbers) are composed
+from pre-rendered glyphs.
+"""
+from __future__ import annotations
+
+import logging
+
+from collections import OrderedDict
+
+import pygame
+
+game_logger = logging.getLogger('')
+
+
+class TextCache:
+    """
+    Cache of rendered text shared by all game objects.
+
+    Surfaces returned by the cache are shared, so the same text returns the same surface object. Callers must not
+    modify them in place.
+
+    Note:
+        Fields are composed from glyphs placed in cells of the glyph advance. The game font is monospace, so the
+        result is the same as font.render except for kerning, digits always stay in their cells.
+
+    Attributes:
+        max_size (int): Maximum number of strings kept. The least recently used string is evicted first.
+            Defaults to 256.
+        hits (int): Number of requests served from the cache. Defaults to 0.
+        misses (int): Number of requests which required rendering or composing. Defaults to 0.
+
+    Args:
+        max_size (int): Maximum number of strings kept. Defaults to 256.
+
+    version: 1
+    """
+    def __init__(self, max_size: int = 256):
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._strings: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self._glyphs: dict[tuple, pygame.Surface] = {}
+
+    def _get(self, key: tuple) -> [None, pygame.Surface]:
+        surface = self._strings.get(key)
+        if surface is not None:
+            self._strings.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+        return surface
+
+    def _put(self, key: tuple, surface: pygame.Surface):
+        self._strings[key] = surface
+        if len(self._strings) > self.max_size:
+            self._strings.popitem(last=False)
+
+    def render(self, font: pygame.font.Font, text: str, color: [tuple, pygame.Color],
+               antialias: bool = True) -> pygame.Surface:
+        """
+        Render the whole string.
+
+        Args:
+            font (pygame.font.Font): The font to use.
+            text (str): The text to render.
+            color (tuple, pygame.Color): The color of the text.
+            antialias (bool): Whether the text is antialiased. Defaults to True.
+
+        Returns:
+            pygame.Surface: Shared surface of the text.
+        """
+        key = ('text', font, text, tuple(color), antialias)
+        surface = self._get(key)
+        if surface is None:
+            surface = font.render(text, antialias, color)
+            self._put(key, surface)
+        return surface
+
+    def get_glyph(self, font: pygame.font.Font, char: str, color: [tuple, pygame.Color]) -> pygame.Surface:
+        """
+        Get the pre-rendered antialiased glyph. Glyphs are never evicted, there are only a few of them per font.
+
+        Args:
+            font (pygame.font.Font): The font to use.
+            char (str): The character.
+            color (tuple, pygame.Color): The color of the glyph.
+
+        Returns:
+            pygame.Surface: Shared surface of the glyph.
+        """
+        key = (font, char, tuple(color))
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            glyph = font.render(char, True, color)
+            self._glyphs[key] = glyph
+        return glyph
+
+    def render_field(self, font: pygame.font.Font, prefix: str, field: str,
+                     color: [tuple, pygame.Color]) -> pygame.Surface:
+        """
+        Render the static prefix followed by the changing field. The prefix is rendered once, the field is composed
+        from pre-rendered glyphs, so a new value costs only blits.
+
+        Args:
+            font (pygame.font.Font): The font to use. Must be monospace.
+            prefix (str): Static text, e.g. 'Score: '.
+            field (str): Changing text, e.g. the score.
+            color (tuple, pygame.Color): The color of the text.
+
+        Returns:
+            pygame.Surface: Shared surface of the text.
+        """
+        key = ('field', font, prefix, field, tuple(color))
+        surface = self._get(key)
+        if surface is not None:
+            return surface
+
+        prefix_surface = self.render(font, prefix, color) if prefix else None
+        glyphs = [self.get_glyph(font, char, color) for char in field]
+        prefix_width = font.size(prefix)[0] if prefix else 0
+        advance = font.size(field[:1])[0] if field else 0
+        height = max([font.get_height()] + [glyph.get_height() for glyph in glyphs])
+
+        # Glyphs do not overlap, so they are copied onto the transparent surface with the maximum blend
+        # instead of alpha blending, which would darken antialiased edges.
+        surface = pygame.Surface((prefix_width + advance * len(field), height), pygame.SRCALPHA)  # pylint: disable=E1101
+        if prefix_surface is not None:
+            surface.blit(prefix_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)  # pylint: disable=E1101
+        surface.blits(
+            [(glyph, (prefix_width + index * advance, 0), None, pygame.BLEND_RGBA_MAX)  # pylint: disable=E1101
+             for index, glyph in enumerate(glyphs)],
+            doreturn=False
+        )
+        self._put(key, surface)
+        return surface
+
+    def clear(self):
+        """
+        Drop all cached strings and glyphs.
+        """
+        game_logger.debug('Clearing text cache: %s hits, %s misses', self.hits, self.misses)
+        self._strings.clear()
+        self._glyphs.clear()
+
+
+text_cache = TextCache()
@@ -0,0 +1,189 @@
+"""
+Texture atlas of small sprite images: blocks, powerups, hearts and the ball.
+
+The atlas is built from the images in assets with:
+
+    python start.py --build-atlas
+
+The build packs the images into one PNG and writes a JSON manifest with the region of every image and the hash
+of its source file. At runtime the atlas is read once, converted to the display format and the images are cut
+from it as subsurfaces.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+
+from pathlib import Path
+
+import pygame
+
+from breakout_game.utils import path_utils
+from breakout_game.utils.asset_cache import asset_cache
+from breakout_game.utils.surface_cache import surface_cache
+
+game_logger = logging.getLogger('')
+
+IMAGES_DIR = path_utils.base_path / 'assets' / 'images'
+ATLAS_IMAGE_PATH = IMAGES_DIR / 'atlas.png'
+ATLAS_MANIFEST_PATH = IMAGES_DIR / 'atlas.json'
+# Folders in assets/images packed into the atlas
+ATLAS_FOLDERS = ('ball', 'blocks', 'hearts', 'powerups')
+ATLAS_WIDTH = 256
+
+
+def get_atlas_sources() -> dict[str, Path]:
+    """
+    Get the images packed into the atlas.
+
+    Returns:
+        dict[str, Path]: Paths of the images keyed by their path relative to assets/images, e.g. 'blocks/1.png'.
+    """
+    return {
+        path.relative_to(IMAGES_DIR).as_posix(): path
+        for folder in ATLAS_FOLDERS
+        for path in sorted((IMAGES_DIR / folder).glob('*.png'))
+    }
+
+
+def pack_images(sizes: dict[str, tuple[int, int]], width: int = ATLAS_WIDTH) -> tuple[dict[str, tuple], int]:
+    """
+    Pack the images into rows of the atlas, the tallest images first.
+
+    Args:
+        sizes (dict[str, tuple[int, int]]): Size of every image by name.
+        width (int): Width of the atlas. Defaults to ATLAS_WIDTH. Must not be less than the widest image.
+
+    Returns:
+        tuple[dict[str, tuple], int]: Region (x, y, width, height) of every image by name and the height of the atlas.
+    """
+    regions = {}
+    x = y = row_height = 0
+    for name in sorted(sizes, key=lambda name: (-sizes[name][1], name)):
+        image_width, image_height = sizes[name]
+        if image_width > width:
+            raise ValueError(f'Image {name} is wider than the atlas.')
+        if x + image_width > width:
+            x, y, row_height = 0, y + row_height, 0
+        regions[name] = (x, y, image_width, image_height)
+        x += image_width
+        row_height = max(row_height, image_height)
+    return regions, y + row_height
+
+
+def build_atlas(
+        sources: [None, dict[str, Path]] = None,
+        image_path: Path = ATLAS_IMAGE_PATH,
+        manifest_path: Path = ATLAS_MANIFEST_PATH
+) -> dict:
+    """
+    Pack the images into the atlas and write the atlas image and the manifest.
+
+    Args:
+        sources (None, dict[str, Path]): Paths of the images by name. Defaults to None.
+            If None, get_atlas_sources is used.
+        image_path (Path): Path of the atlas image. Defaults to ATLAS_IMAGE_PATH.
+        manifest_path (Path): Path of the manifest. Defaults to ATLAS_MANIFEST_PATH.
+
+    Returns:
+        dict: The manifest.
+    """
+    sources = sources if sources is not None else get_atlas_sources()
+    images = {name: pygame.image.load(path) for name, path in sources.items()}
+    regions, height = pack_images({name: image.get_size() for name, image in images.items()})
+
+    atlas = pygame.Surface((ATLAS_WIDTH, height), pygame.SRCALPHA)  # pylint: disable=E1101
+    for name, image in images.items():
+        # The atlas is fully transparent, so taking the maximum copies the pixels without blending
+        atlas.blit(image, regions[name][:2], special_flags=pygame.BLEND_RGBA_MAX)  # pylint: disable=E1101
+    pygame.image.save(atlas, image_path)
+
+    manifest = {
+        'image': image_path.name,
+        'size': [ATLAS_WIDTH, height],
+        'regions': {name: list(region) for name, region in regions.items()},
+        'sources': {name: hashlib.sha1(path.read_bytes()).hexdigest() for name, path in sources.items()}
+    }
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+    return manifest
+
+
+class TextureAtlas:
+    """
+    Runtime loader of the atlas.
+
+    The atlas image is read on the first use and converted to the display format, the images are subsurfaces of it,
+    so all of them are blitted without format conversion. Scaled images are shared through the surface cache.
+    Images missing in the manifest, or all images if the atlas was not built, are loaded from their own files.
+
+    The atlas is kept for the whole process. It is read again only if the headless mode of the asset cache changes.
+
+    Attributes:
+        image_path (Path): Path of the atlas image.
+        manifest_path (Path): Path of the manifest.
+        regions (None, dict[str, tuple]): Region of every image by name. None until the atlas is loaded.
+        sheet (None, pygame.Surface): The atlas image. None until the atlas is loaded or if it was not built.
+
+    Args:
+        image_path (Path): Path of the atlas image. Defaults to ATLAS_IMAGE_PATH.
+        manifest_path (Path): Path of the manifest. Defaults to ATLAS_MANIFEST_PATH.
+
+    version: 1
+    """
+    def __init__(self, image_path: Path = ATLAS_IMAGE_PATH, manifest_path: Path = ATLAS_MANIFEST_PATH):
+        self.image_path: Path = image_path
+        self.manifest_path: Path = manifest_path
+        self.regions: [None, dict[str, tuple]] = None
+        self.sheet: [None, pygame.Surface] = None
+
+        self._headless: [None, bool] = None
+        self._images: dict[str, pygame.Surface] = {}
+
+    def load(self):
+        """
+        Read the atlas image and the manifest and convert the image to the display format, unless the asset cache
+        is headless.
+        """
+        self._headless = asset_cache.headless
+        self._images.clear()
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding='utf-8'))
+            sheet = pygame.image.load(self.image_path)
+        except (OSError, ValueError, pygame.error):  # pylint: disable=E1101
+            game_logger.warning('Texture atlas %s could not be loaded, images are loaded from their files',
+                                self.image_path)
+            self.regions, self.sheet = {}, None
+            return
+        self.regions = {name: tuple(region) for name, region in manifest['regions'].items()}
+        self.sheet = sheet if self._headless else sheet.convert_alpha()
+        game_logger.debug('Texture atlas %s with %s images loaded', self.image_path, len(self.regions))
+
+    def get_image(self, path: [str, Path], size: [None, tuple] = None) -> pygame.Surface:
+        """
+        Get the image from the atlas.
+
+        Args:
+            path (str, Path): Absolute path of the source image in assets/images.
+            size (None, tuple): Size to scale the image to. Must be a tuple of (width, height).
+                Defaults to None. If None, the image is not scaled.
+
+        Returns:
+            pygame.Surface: Shared image. Must not be modified in place.
+        """
+        if self.regions is None or self._headless != asset_cache.headless:
+            self.load()
+        path = Path(path)
+        name = path.relative_to(IMAGES_DIR).as_posix() if path.is_relative_to(IMAGES_DIR) else None
+        region = self.regions.get(name)
+        if region is None:
+            return asset_cache.load_image(path, size=size)
+
+        image = self._images.get(name)
+        if image is None:
+            image = self.sheet.subsurface(region)
+            self._images[name] = image
+        return surface_cache.get_variant(image, size) if size is not None else image
+
+
+texture_atlas = TextureAtlas()
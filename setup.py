@@ -20,7 +20,7 @@ setup(
         'breakout_game': [
             'assets/fonts/*',
             'assets/images/background/*', 'assets/images/ball/*', 'assets/images/blocks/*', 'assets/images/hearts/*',
-            'assets/images/powerups/*',
+            'assets/images/powerups/*', 'assets/images/atlas.*',
             'assets/sounds/*'
         ]
     },
@@ -0,0 +1,58 @@
+import pytest
+import pygame
+
+from unittest.mock import Mock
+from breakout_game.config import settings
+from breakout_game.utils import path_utils
+from breakout_game.utils.asset_cache import AssetCache
+
+
+@pytest.fixture(autouse=True)
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+
+
+@pytest.fixture
+def cache():
+    pygame.init()
+    pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    return AssetCache()
+
+
+def test_load_image_shared(cache):
+    first = cache.load_image(settings.COLOR_LEGEND[1])
+    second = cache.load_image(settings.COLOR_LEGEND[1])
+    assert first is second
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_load_image_scaled(cache):
+    image = cache.load_image(settings.COLOR_LEGEND[1], size=(10.5, 20))
+    assert image.get_size() == (10, 20)
+    assert image is not cache.load_image(settings.COLOR_LEGEND[1])
+
+
+def test_load_image_convert_mode_in_key(cache):
+    assert cache.load_image(settings.COLOR_LEGEND[1], convert_mode=None) is not \
+           cache.load_image(settings.COLOR_LEGEND[1], convert_mode='opaque')
+
+
+def test_load_image_wrong_convert_mode(cache):
+    with pytest.raises(ValueError):
+        cache.load_image(settings.COLOR_LEGEND[1], convert_mode='wrong')
+
+
+def test_load_sound_and_font(cache):
+    sound_path = path_utils.get_asset_path('sounds/hit blocks.mp3')
+    assert cache.load_sound(sound_path, volume=0.25) is cache.load_sound(sound_path, volume=0.25)
+    assert cache.load_font(settings.GAME_FONT, 10) is cache.load_font(settings.GAME_FONT, 10)
+    assert cache.stats()['sounds'] == 1
+    assert cache.stats()['fonts'] == 1
+
+
+def test_purge(cache):
+    image = cache.load_image(settings.COLOR_LEGEND[1])
+    cache.purge()
+    assert cache.stats()['images'] == 0
+    assert cache.load_image(settings.COLOR_LEGEND[1]) is not image
@@ -0,0 +1,107 @@
+import math
+
+import pytest
+import pygame
+
+from unittest.mock import Mock
+from breakout_game.config import settings
+from breakout_game.simulation import InputState
+from breakout_game.sprites import SpriteManager, ball_system
+from breakout_game.sprites.ball_system import BallSystem
+from benchmarks.scenarios import build_scenario, get_autopilot_inputs
+
+
+@pytest.fixture(autouse=True)
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.init()
+    pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+
+
+@pytest.fixture
+def vectorized(mocker):
+    mocker.patch.object(settings, 'BALL_PHYSICS', 'vectorized')
+
+
+def get_ball_states(sprite_manager):
+    return [
+        (ball.rect.topleft, tuple(ball.position), tuple(ball.direction), ball.active)
+        for ball in sprite_manager.ball_sprites_group
+    ]
+
+
+def test_create_ball_system(mocker):
+    assert SpriteManager().ball_system is None
+    mocker.patch.object(settings, 'BALL_PHYSICS', 'vectorized')
+    assert isinstance(SpriteManager().ball_system, BallSystem)
+    mocker.patch.object(ball_system, 'numpy', None)
+    assert SpriteManager().ball_system is None
+
+
+@pytest.mark.parametrize('collision_mode', ['discrete', 'swept'])
+@pytest.mark.parametrize('scenario, steps', [('multi-ball', 300), ('stress', 60)])
+def test_same_as_sprites(mocker, collision_mode, scenario, steps):
+    mocker.patch.object(settings, 'BALL_COLLISION_MODE', collision_mode)
+    results = []
+    for physics in ('sprites', 'vectorized'):
+        mocker.patch.object(settings, 'BALL_PHYSICS', physics)
+        sprite_manager = build_scenario(scenario)
+        for _ in range(steps):
+            sprite_manager.update(settings.PHYSICS_TIME_STEP, get_autopilot_inputs(sprite_manager))
+        results.append((
+            get_ball_states(sprite_manager),
+            sprite_manager.score_sprites_group.sprites()[0].score,
+            [block.health for block in sprite_manager.block_field]
+        ))
+    assert results[0] == results[1]
+
+
+def test_free_ball_moved_in_batch(vectorized, mocker):
+    sprite_manager = SpriteManager(seed=0)
+    sprite_manager.init_level(level_number=1)
+    ball = sprite_manager.balls[0]
+    ball.rect.center = (settings.GAME_WINDOW_WIDTH // 2, settings.GAME_WINDOW_HEIGHT // 2)
+    ball.update_position_from_rect()
+    ball.direction = pygame.math.Vector2(3, 4)
+    ball.active = True
+    update = mocker.spy(ball, 'update')
+
+    sprite_manager.update(1 / 60, InputState())
+
+    update.assert_not_called()
+    assert sprite_manager.ball_system.free_count == 1
+    assert ball.direction == pygame.math.Vector2(0.6, 0.8)
+    assert ball.rect.topleft == (round(ball.position.x), round(ball.position.y))
+
+
+def test_wall_bounce_in_batch(vectorized, mocker):
+    sprite_manager = SpriteManager(seed=0)
+    sprite_manager.init_level(level_number=1)
+    ball = sprite_manager.balls[0]
+    ball.rect.midleft = (1, settings.GAME_WINDOW_HEIGHT // 2)
+    ball.update_position_from_rect()
+    ball.set_direction_from_angle(math.pi)
+    ball.active = True
+    update = mocker.spy(ball, 'update')
+
+    sprite_manager.update(1 / 60, InputState())
+
+    update.assert_not_called()
+    assert ball.rect.left == 0
+    assert ball.position.x == 0
+    assert ball.direction.x > 0
+
+
+def test_inactive_ball_updated_by_sprite(vectorized, mocker):
+    sprite_manager = SpriteManager(seed=0)
+    sprite_manager.init_level(level_number=1)
+    update = mocker.spy(sprite_manager.balls[0], 'update')
+
+    sprite_manager.update(1 / 60, InputState())
+
+    update.assert_called_once()
+    assert sprite_manager.ball_system.free_count == 0
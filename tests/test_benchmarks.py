@@ -0,0 +1,83 @@
+import subprocess
+
+import pytest
+import pygame
+
+from unittest.mock import Mock
+from breakout_game.config import settings
+from benchmarks.run_benchmarks import percentile, summarize, compare, run_resolution
+from benchmarks.scenarios import build_scenario, SCENARIOS, STRESS_BALLS
+
+
+@pytest.fixture(autouse=True)
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.init()
+    pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+
+
+def test_percentile():
+    samples = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert percentile(samples, 0) == 1.0
+    assert percentile(samples, 0.5) == 3.0
+    assert percentile(samples, 0.9) == pytest.approx(4.6)
+    assert percentile(samples, 1) == 5.0
+
+
+def test_summarize():
+    result = summarize([1000, 3000, 2000])
+    assert result['samples'] == 3
+    assert result['min_us'] == 1.0
+    assert result['p50_us'] == 2.0
+    assert result['max_us'] == 3.0
+
+
+def test_compare_flags_regressions():
+    baseline = {'results': {'a': {'p50_us': 10.0}, 'b': {'p50_us': 10.0}}}
+    report = {'results': {'a': {'p50_us': 11.0}, 'b': {'p50_us': 20.0}, 'c': {'p50_us': 1.0}}}
+    comparison = {item['name']: item for item in compare(report, baseline, threshold=0.15)}
+    assert not comparison['a']['regression']
+    assert comparison['b']['regression']
+    assert 'c' not in comparison
+
+
+@pytest.mark.parametrize('scenario', SCENARIOS)
+def test_build_scenario(scenario):
+    sprite_manager = build_scenario(scenario)
+    assert all(ball.active for ball in sprite_manager.balls)
+    if scenario in ('multi-ball', 'all-powerups'):
+        assert len(sprite_manager.ball_sprites_group) >= 20
+    if scenario == 'stress':
+        assert len(sprite_manager.ball_sprites_group) > STRESS_BALLS
+    if scenario == 'all-powerups':
+        assert len(sprite_manager.powerup_manager.active_powerups) > 0
+        assert len(sprite_manager.power_up_sprites_group) == len(settings.POWERS)
+
+
+def test_unknown_scenario():
+    with pytest.raises(ValueError):
+        build_scenario('unknown')
+
+
+def test_run_resolution_reports_worker_stderr(mocker):
+    completed = subprocess.CompletedProcess([], 1, stdout='', stderr='Traceback: menu.mp3 not found')
+    mocker.patch.object(subprocess, 'run', return_value=completed)
+    with pytest.raises(RuntimeError, match='menu.mp3 not found'):
+        run_resolution('1366x768', steps=1, warmup=0)
+
+
+def test_run_resolution_without_output(mocker):
+    completed = subprocess.CompletedProcess([], 0, stdout='', stderr='worker warning')
+    mocker.patch.object(subprocess, 'run', return_value=completed)
+    with pytest.raises(RuntimeError, match='printed no results'):
+        run_resolution('1366x768', steps=1, warmup=0)
+
+
+def test_run_resolution_reads_last_line(mocker):
+    completed = subprocess.CompletedProcess([], 0, stdout='log line\n{"a": {"p50_us": 1.0}}\n', stderr='')
+    mocker.patch.object(subprocess, 'run', return_value=completed)
+    assert run_resolution('1366x768', steps=1, warmup=0) == {'a': {'p50_us': 1.0}}
@@ -0,0 +1,92 @@
+import random
+import sys
+
+import pytest
+import pygame
+
+from unittest.mock import Mock
+from breakout_game.config import settings
+from breakout_game.sprites import SpriteManager
+from breakout_game.sprites.block_field import Block
+
+
+@pytest.fixture(autouse=True)
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+
+
+@pytest.fixture
+def manager():
+    pygame.init()
+    pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    sprite_manager = SpriteManager(seed=0)
+    sprite_manager.init_level(level_number=1)
+    return sprite_manager
+
+
+def test_blocks_created_from_block_map(manager):
+    expected = [
+        (row_index, col_index, int(health) + 1)
+        for row_index, row in enumerate(settings.BLOCK_MAP)
+        for col_index, health in enumerate(row) if health != ' '
+    ]
+    blocks = list(manager.block_field)
+    assert len(manager.block_field) == len(blocks) == len(expected)
+    for block, (row_index, col_index, health) in zip(blocks, expected):
+        assert block.index == row_index * manager.block_field.cols + col_index
+        assert block.health == health
+        assert block.image is manager.block_images[health]
+        expected_rect = manager.block_images[health].get_rect(topleft=(
+            settings.GAP_SIZE / 2 + col_index * (settings.BLOCK_WIDTH + settings.GAP_SIZE),
+            settings.GAP_SIZE / 2 + row_index * (settings.BLOCK_HEIGHT + settings.GAP_SIZE)
+        ))
+        assert block.rect == expected_rect
+
+
+def test_collide_same_as_colliderect(manager):
+    rng = random.Random(0)
+    ball_size = settings.WINDOW_WIDTH // 40
+    blocks = list(manager.block_field)
+    for _ in range(500):
+        rect = pygame.Rect(
+            rng.randint(-ball_size, settings.GAME_WINDOW_WIDTH),
+            rng.randint(-ball_size, settings.GAME_WINDOW_HEIGHT),
+            rng.randint(1, ball_size * 2),
+            rng.randint(1, ball_size * 2)
+        )
+        assert manager.block_field.collide(rect) == [block for block in blocks if rect.colliderect(block.rect)]
+
+
+def test_get_damage(manager):
+    block = next(iter(manager.block_field))
+    health = block.health
+    block.get_damage(1)
+    assert block.health == health - 1
+    assert manager.score.score == 10
+    assert block.image is manager.block_images[health - 1]
+
+    blocks_count = len(manager.block_field)
+    block.get_damage(block.health)
+    assert not block.alive()
+    assert manager.score.score == 40
+    assert len(manager.block_field) == blocks_count - 1
+    assert block not in manager.block_field.collide(block.rect)
+
+
+def test_views_compare_by_cell(manager):
+    block = next(iter(manager.block_field))
+    assert block == Block(manager.block_field, block.index)
+    assert {block: 1}[Block(manager.block_field, block.index)] == 1
+    assert block != Block(manager.block_field, block.index + 1)
+
+
+def test_block_outside_of_field(manager):
+    with pytest.raises(IndexError):
+        manager.create_block(1, manager.block_field.rows, 0)
+
+
+def test_memory_per_block(manager):
+    field = manager.block_field
+    field_size = sum(sys.getsizeof(data) for data in (field.health, field.image_health, field.left, field.top,
+                                                       field.alive))
+    assert field_size / (field.rows * field.cols) < 32
@@ -0,0 +1,61 @@
+import pytest
+import pygame
+
+from unittest.mock import Mock
+from breakout_game.utils import path_utils
+from breakout_game.utils.derived_cache import DerivedCache
+
+
+@pytest.fixture(autouse=True)
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+
+
+@pytest.fixture
+def source_path():
+    return path_utils.get_asset_path('images/background/level-0.jpg')
+
+
+def build():
+    surface = pygame.Surface((6, 4))
+    surface.fill((10, 20, 30))
+    surface.set_at((5, 3), (200, 100, 50))
+    return surface
+
+
+def test_disabled_cache_builds(source_path):
+    cache = DerivedCache()
+    builder = Mock(side_effect=build)
+    cache.get_surface(source_path, (6, 4), 'test', builder)
+    cache.get_surface(source_path, (6, 4), 'test', builder)
+    assert builder.call_count == 2
+
+
+def test_entry_mapped_on_next_run(tmp_path, source_path):
+    built = DerivedCache(tmp_path).get_surface(source_path, (6, 4), 'test', build)
+    cache = DerivedCache(tmp_path)
+    surface = cache.get_surface(source_path, (6, 4), 'test', Mock(side_effect=AssertionError))
+    assert cache.stats() == {'hits': 1, 'misses': 0}
+    assert surface.get_size() == (6, 4)
+    assert pygame.image.tobytes(surface, 'RGB') == pygame.image.tobytes(built, 'RGB')
+
+
+def test_entry_keyed_by_resolution_and_transform(tmp_path, source_path):
+    cache = DerivedCache(tmp_path)
+    paths = {
+        cache.get_entry_path(source_path, (6, 4), 'test'),
+        cache.get_entry_path(source_path, (12, 8), 'test'),
+        cache.get_entry_path(source_path, (6, 4), 'other'),
+        cache.get_entry_path(path_utils.get_asset_path('images/background/level-1.jpg'), (6, 4), 'test')
+    }
+    assert len(paths) == 4
+
+
+def test_invalid_entry_rebuilt(tmp_path, source_path):
+    cache = DerivedCache(tmp_path)
+    entry_path = cache.get_entry_path(source_path, (6, 4), 'test')
+    entry_path.write_bytes(b'BRKD')
+    cache.get_surface(source_path, (6, 4), 'test', build)
+    assert cache.misses == 1
+    assert cache.get_surface(source_path, (6, 4), 'test', build).get_at((5, 3))[:3] == (200, 100, 50)
+    assert cache.hits == 1
@@ -0,0 +1,46 @@
+import time
+
+import pygame
+import pytest
+
+from breakout_game.utils.frame_pacer import FramePacer
+
+
+def test_tick_limits_frame_rate():
+    pacer = FramePacer()
+    pacer.tick(100)
+    start = pacer.last_tick
+    for _ in range(10):
+        frame_time = pacer.tick(100)
+        assert frame_time > 0.01 - 1e-9
+    assert pacer.last_tick - start >= 0.1 - 1e-9
+
+
+def test_stats():
+    pacer = FramePacer()
+    assert pacer.get_stats()['fps'] == 0
+    pacer.frame_times.extend([0.01, 0.03])
+    pacer.target_fps = 50
+    stats = pacer.get_stats()
+    assert stats['fps'] == pytest.approx(50)
+    assert stats['frame_time_ms'] == pytest.approx(20)
+    assert stats['jitter_ms'] == pytest.approx(10)
+    assert pacer.format_stats() == 'FPS 50.0/50 JITTER 10.00 MS'
+
+
+def test_stats_cleared_when_frame_rate_changes():
+    pacer = FramePacer()
+    pacer.tick(1000)
+    pacer.tick(1000)
+    pacer.tick(500)
+    assert len(pacer.frame_times) == 1
+    assert pacer.target_fps == 500
+
+
+def test_wake_on_event():
+    pygame.display.init()
+    pygame.event.clear()
+    pacer = FramePacer()
+    pygame.event.post(pygame.event.Event(pygame.USEREVENT))  # pylint: disable=E1101
+    assert pacer.tick(1, wake_on_event=True) < 0.5
+    assert len(pygame.event.get()) > 0
@@ -1,8 +1,14 @@
+import random
+
 import pygame
 import pytest
 
 from unittest.mock import Mock
 from breakout_game.main import Game
+from breakout_game.config import settings
+from breakout_game.replay import Replay, play_headless
+from breakout_game.simulation import InputState
+from breakout_game.utils.asset_cache import asset_cache
 
 
 @pytest.fixture(autouse=True)
@@ -14,7 +20,7 @@ def test_restart_game():
     game = Game()
     game.restart_game()
     assert game.game_active is False
-    assert game.start_pause_time == 0
+    assert game.accumulator == 0
 
 
 def test_set_level_background():
@@ -27,3 +33,76 @@ def test_get_last_blit_main_menu():
     game = Game()
     result = game.get_last_blit_main_menu()
     assert isinstance(result, list)
+
+
+def test_update_idle():
+    game = Game()
+    menu_objects_to_blit = game.get_last_blit_main_menu()
+    game.update_idle(menu_objects_to_blit)
+    assert game.idle is False
+
+    game.menu_static_since -= settings.IDLE_DELAY
+    game.update_idle(game.get_last_blit_main_menu())
+    assert game.idle is True
+
+    game.main_menu.selected_option = 0
+    game.main_menu.update_objects_to_blit()
+    game.update_idle(game.get_last_blit_main_menu())
+    assert game.idle is False
+
+
+def test_no_idle_during_game():
+    game = Game()
+    game.menu_static_since -= settings.IDLE_DELAY
+    game.update_idle([])
+    assert game.idle is False
+
+
+def test_init_game_stage_takes_preloaded_assets():
+    game = Game()
+    game.preload_level()
+    game.level_preloader._thread.join()
+    background = game.level_preloader._assets.background
+    game.init_game_stage()
+    assert game.background.get_size() == background.get_size()
+    assert game.level_preloader.level is None
+    assert game.game_active is True
+
+
+def test_recorded_game_replays_headless(tmp_path, mocker):
+    rng = random.Random(3)
+    keys = [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE]
+    path = tmp_path / 'session.replay'
+    game = Game(record_path=path)
+    game.main_menu.active = False
+    game.init_game_stage()
+    get_pressed = mocker.patch.object(pygame.key, 'get_pressed')
+    paused_frames = 0
+    for frame in range(900):
+        pressed = [rng.choice(keys)]
+        if frame in (200, 201, 500):
+            pressed.append(pygame.K_ESCAPE)
+        get_pressed.return_value = InputState(pressed)
+        game.check_events()
+        if game.pause_menu.active:
+            paused_frames += 1
+            game.get_last_blit_pause_menu()
+            continue
+        game.run_physics(settings.PHYSICS_TIME_STEP * rng.choice([0.5, 1, 1.7]))
+        if not game.game_active:
+            break
+    assert paused_frames > 0
+    sprite_manager = game.sprite_manager
+    game.save_recording()
+
+    replay = Replay.load(path)
+    assert len(replay) > 0
+    simulation = play_headless(replay)
+    assert asset_cache.headless is False
+    replayed = simulation.sprite_manager
+    assert simulation.level == game.level
+    assert replayed.score.score == sprite_manager.score.score
+    assert replayed.player.rect == sprite_manager.player.rect
+    assert replayed.block_field.alive == sprite_manager.block_field.alive
+    assert replayed.block_field.health == sprite_manager.block_field.health
+    assert [ball.rect for ball in replayed.balls] == [ball.rect for ball in sprite_manager.balls]
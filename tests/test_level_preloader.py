@@ -0,0 +1,53 @@
+import pytest
+import pygame
+
+from unittest.mock import Mock
+from breakout_game.config import settings
+from breakout_game.level_preloader import LevelPreloader, load_level_assets
+
+
+@pytest.fixture(autouse=True)
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+
+
+def test_load_level_assets():
+    progress = []
+    assets = load_level_assets(4, progress.append)
+    assert assets.level == 4
+    assert assets.background.get_width() >= settings.WINDOW_WIDTH
+    assert assets.background.get_height() >= settings.WINDOW_HEIGHT
+    assert len(assets.music) > 0
+    assert progress[-1] == 1
+
+
+def test_preloaded_assets_handed_over_once():
+    preloader = LevelPreloader()
+    preloader.start(2)
+    preloader._thread.join()
+    assert preloader.progress == 1
+    assets = preloader._assets
+    assert preloader.take(2) is assets
+    assert preloader.take(2) is not assets
+
+
+def test_synchronous_fallback():
+    preloader = LevelPreloader()
+    preloader.start(0)
+    assert preloader.take(4).level == 4
+    assert preloader.level is None
+
+
+def test_failed_preload():
+    preloader = LevelPreloader()
+    preloader.start(settings.LAST_LEVEL + 1)
+    preloader._thread.join()
+    assert preloader.level is None
+    assert preloader.failed_level == settings.LAST_LEVEL + 1
+    thread = preloader._thread
+    for _ in range(60):
+        preloader.start(settings.LAST_LEVEL + 1)
+    assert preloader._thread is thread
+    with pytest.raises(OSError):
+        preloader.take(settings.LAST_LEVEL + 1)
+    assert preloader.failed_level is None
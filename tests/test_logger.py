@@ -0,0 +1,49 @@
+import logging
+import logging.handlers
+import queue
+
+from breakout_game.config import settings
+from breakout_game.log import logger
+
+
+def create_listener(path):
+    file_handler = logger._FileHandler(path)
+    file_handler.setFormatter(logging.Formatter('{message}', style='{'))
+    log_queue = queue.SimpleQueue()
+    listener = logger._BatchQueueListener(log_queue, file_handler)
+    test_logger = logging.getLogger('test_logger')
+    test_logger.propagate = False
+    test_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    test_logger.setLevel(logging.DEBUG)
+    return listener, test_logger, file_handler
+
+
+def test_records_written_in_background(tmp_path):
+    path = tmp_path / 'game.log'
+    listener, test_logger, file_handler = create_listener(path)
+    listener.start()
+    for i in range(100):
+        test_logger.info('record %s', i)
+    listener.stop()
+    file_handler.close()
+    assert path.read_text(encoding='utf-8').splitlines() == [f'record {i}' for i in range(100)]
+
+
+def test_log_file_rotated(tmp_path, mocker):
+    mocker.patch.object(settings, 'LOG_MAX_BYTES', 100)
+    path = tmp_path / 'game.log'
+    listener, test_logger, file_handler = create_listener(path)
+    listener.start()
+    for i in range(20):
+        test_logger.info('record %s', i)
+    listener.stop()
+    file_handler.close()
+    assert (tmp_path / 'game.log.1').exists()
+    assert len(path.read_bytes()) <= 100
+
+
+def test_root_logger_does_not_block():
+    handlers = logging.getLogger('').handlers
+    assert any(isinstance(handler, logging.handlers.QueueHandler) for handler in handlers)
+    assert logger._file_handler not in handlers
+    assert logger._stream_handler not in handlers
@@ -0,0 +1,36 @@
+import pygame
+import pytest
+
+from unittest.mock import Mock
+from breakout_game.config import settings
+from breakout_game.screens import MainMenu
+
+
+@pytest.fixture(autouse=True)
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+
+
+@pytest.fixture
+def menu():
+    pygame.init()
+    pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    return MainMenu()
+
+
+def test_objects_to_blit_do_not_grow(menu):
+    keys = pygame.key.get_pressed()
+    objects_to_blit = menu.objects_to_blit
+    for _ in range(100):
+        menu.update(keys)
+    assert len(menu.objects_to_blit) == len(menu.options)
+    assert menu.objects_to_blit is objects_to_blit
+
+
+def test_objects_to_blit_composed_on_selection_change(menu):
+    menu.last_pressed = 0
+    menu.update({pygame.K_UP: True, pygame.K_DOWN: False, pygame.K_RETURN: False})
+    assert menu.selected_option == 0
+    assert len(menu.objects_to_blit) == len(menu.options)
+    assert menu.objects_to_blit[0][0] is menu.option_surfaces[0][1]
+    assert menu.objects_to_blit[1][0] is menu.option_surfaces[1][0]
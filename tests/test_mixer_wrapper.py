@@ -0,0 +1,95 @@
+import pytest
+import pygame
+
+from unittest.mock import Mock
+from breakout_game.config import settings
+from breakout_game.utils.mixer_wrapper import SoundBank
+
+
+@pytest.fixture(autouse=True)
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+
+
+class FakeChannel:
+    def __init__(self):
+        self.sounds = []
+        self.busy = False
+
+    def play(self, sound):
+        self.sounds.append(sound)
+        self.busy = True
+
+    def stop(self):
+        self.busy = False
+
+    def get_busy(self):
+        return self.busy
+
+
+@pytest.fixture
+def bank():
+    sound_bank = SoundBank()
+    sound_bank.configure(settings.SOUND_EFFECTS, 2, 2)
+    channels = [FakeChannel(), FakeChannel()]
+    pygame.mixer.Channel.side_effect = channels
+    sound_bank.get_voices()
+    pygame.mixer.set_reserved.assert_called_once_with(2)
+    return sound_bank, channels
+
+
+def test_configure_unchanged_keeps_state(bank):
+    sound_bank, _ = bank
+    sound = sound_bank.get_sound('hit-block')
+    voices = sound_bank.get_voices()
+    sound_bank.configure(settings.SOUND_EFFECTS, 2, 2)
+    assert sound_bank.get_sound('hit-block') is sound
+    assert sound_bank.get_voices() is voices
+    pygame.mixer.set_reserved.assert_called_once_with(2)
+
+
+def test_unknown_effect(bank):
+    sound_bank, _ = bank
+    with pytest.raises(KeyError):
+        sound_bank.play('some random sound')
+
+
+def test_requests_collapsed_per_frame(bank):
+    sound_bank, channels = bank
+    for _ in range(30):
+        sound_bank.play('break-block')
+    sound_bank.flush()
+    assert len(channels[0].sounds) == 1
+    assert channels[1].sounds == []
+    assert sound_bank.stats() == {'requested': 30, 'played': 1, 'dropped': 0}
+    sound_bank.flush()
+    assert sound_bank.played == 1
+
+
+def test_plays_per_frame_limit(bank):
+    sound_bank, _ = bank
+    for name in ('hit-block', 'break-block', 'hit-paddle'):
+        sound_bank.play(name)
+    sound_bank.flush()
+    assert sound_bank.stats() == {'requested': 3, 'played': 2, 'dropped': 1}
+    assert sound_bank.pending == {}
+
+
+def test_voice_reuse_and_stealing(bank):
+    sound_bank, channels = bank
+    sound_bank.play('hit-block')
+    sound_bank.play('break-block')
+    sound_bank.flush()
+    sound_bank.play('hit-block')
+    sound_bank.flush()
+    assert (len(channels[0].sounds), len(channels[1].sounds)) == (2, 1)
+
+    sound_bank.play('hit-paddle')
+    sound_bank.flush()
+    assert [voice.name for voice in sound_bank.get_voices()] == ['hit-block', 'hit-paddle']
+
+    channels[0].stop()
+    sound_bank.play('get-powerup')
+    sound_bank.flush()
+    assert [voice.name for voice in sound_bank.get_voices()] == ['get-powerup', 'hit-paddle']
+    assert len(channels[0].sounds) == 3
@@ -0,0 +1,81 @@
+import pytest
+import pygame
+
+from unittest.mock import Mock
+from breakout_game.config import settings
+from breakout_game.sprites import SpriteManager
+from breakout_game.screens.renderer import DirtyRectRenderer
+
+
+@pytest.fixture(autouse=True)
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+
+
+@pytest.fixture
+def background():
+    pygame.init()
+    pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    background = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    background.fill((40, 80, 120))
+    pygame.draw.line(background, (200, 10, 10), (0, 0), (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), 5)
+    return background
+
+
+@pytest.fixture
+def manager(background):
+    sprite_manager = SpriteManager(seed=0)
+    sprite_manager.init_level(level_number=1)
+    sprite_manager.set_background(background)
+    return sprite_manager
+
+
+def draw_blocks(manager, background):
+    surface = background.copy()
+    surface.blits(manager.block_field.get_blits())
+    return surface
+
+
+def to_bytes(surface):
+    return pygame.image.tobytes(surface, 'RGB')
+
+
+def test_layer_built_with_blocks(manager, background):
+    assert to_bytes(manager.get_playfield_surface()) == to_bytes(draw_blocks(manager, background))
+    assert manager.playfield_layer.pop_changed_rects() == [background.get_rect()]
+    assert all(sprite not in manager.block_field for sprite, _, _ in manager.get_draw_list())
+
+
+def test_layer_patched_on_block_damage(manager, background):
+    manager.get_playfield_surface()
+    manager.playfield_layer.pop_changed_rects()
+    blocks = list(manager.block_field)
+    blocks[0].get_damage(1)
+    blocks[1].get_damage(blocks[1].health)
+
+    assert to_bytes(manager.get_playfield_surface()) == to_bytes(draw_blocks(manager, background))
+    assert manager.playfield_layer.pop_changed_rects() == [blocks[0].rect, blocks[1].rect]
+    manager.get_playfield_surface()
+    assert manager.playfield_layer.pop_changed_rects() == []
+
+
+def test_dirty_renderer_with_layer(manager, background):
+    renderer = DirtyRectRenderer()
+    surface = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    for ball in manager.balls:
+        ball.active = True
+    keys = pygame.key.get_pressed()
+    for step in range(300):
+        manager.update(settings.PHYSICS_TIME_STEP, keys)
+        if step % 50 == 0:
+            block = list(manager.block_field)[step // 50]
+            block.get_damage(1)
+        renderer.draw(
+            surface,
+            manager.get_playfield_surface(),
+            manager.get_draw_list(),
+            manager.playfield_layer.pop_changed_rects()
+        )
+    expected = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    manager.draw_all(expected)
+    assert to_bytes(surface) == to_bytes(expected)
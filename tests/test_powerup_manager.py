@@ -4,6 +4,7 @@ import pygame
 from unittest.mock import Mock
 from breakout_game.sprites.powerup_manager import PowerUpManager
 from breakout_game.sprites import SpriteManager
+from breakout_game.config import settings
 
 
 @pytest.fixture(autouse=True)
@@ -51,3 +52,55 @@ def test_activate_fast_ball(manager, start_timer):
 def test_activate_slow_ball(manager, start_timer):
     manager.activate_fast_ball(start_timer)
     assert manager.ball_speed_timer.active is start_timer
+
+
+def test_timer_driven_by_game_clock(manager):
+    manager.activate_fast_ball()
+    manager.sprite_manager.clock.advance(settings.BALL_SPEED_DURATION - 1)
+    manager.update()
+    assert manager.ball_speed_timer.active is True
+    manager.sprite_manager.clock.advance(2)
+    manager.update()
+    assert manager.ball_speed_timer.active is False
+
+
+def test_multiply_balls_beyond_20(manager):
+    for _ in range(4):
+        manager.activate_powerup('multiply-balls')
+    assert len(manager.sprite_manager.ball_sprites_group) == 81
+
+
+def test_multiply_balls_limit(manager, mocker):
+    mocker.patch.object(settings, 'MAX_BALLS', 10)
+    for _ in range(3):
+        manager.activate_powerup('multiply-balls')
+    assert len(manager.sprite_manager.ball_sprites_group) == 10
+
+
+def test_ball_limit_from_frame_budget(manager):
+    sprite_manager = manager.sprite_manager
+    assert sprite_manager.get_ball_limit() == settings.MAX_BALLS
+    sprite_manager.ball_frame_budget = 0.5
+    sprite_manager.ball_update_time = settings.PHYSICS_TIME_STEP / 100
+    assert sprite_manager.get_ball_limit() == 50
+    sprite_manager.ball_update_time = settings.PHYSICS_TIME_STEP
+    assert sprite_manager.get_ball_limit() == len(sprite_manager.ball_sprites_group)
+
+
+def test_ball_modifiers_applied_once(manager):
+    for _ in range(3):
+        manager.activate_powerup('multiply-balls')
+    manager.activate_powerup('super-ball')
+    manager.activate_powerup('big-ball')
+    balls = manager.sprite_manager.ball_sprites_group.sprites()
+    expected = pygame.transform.scale(balls[0].original_image, (
+        round(balls[0].original_width * 1.5), round(balls[0].original_height * 1.5)
+    ))
+    expected.fill((125, 0, 0), special_flags=pygame.BLEND_RGB_ADD)
+    assert len({id(ball.image) for ball in balls}) == 1
+    assert all(ball.strength == 2 for ball in balls)
+    assert pygame.image.tobytes(balls[0].image, 'RGBA') == pygame.image.tobytes(expected, 'RGBA')
+
+    manager.deactivate_ball_strength()
+    expected = pygame.transform.scale(balls[0].original_image, expected.get_size())
+    assert pygame.image.tobytes(balls[-1].image, 'RGBA') == pygame.image.tobytes(expected, 'RGBA')
@@ -0,0 +1,76 @@
+import csv
+import json
+
+import pytest
+import pygame
+
+from unittest.mock import Mock
+from breakout_game.config import settings
+from breakout_game.sprites import SpriteManager
+from breakout_game.utils.profiler import Profiler, profiler
+
+
+@pytest.fixture(autouse=True)
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+
+
+def test_disabled_profiler_records_nothing():
+    test_profiler = Profiler()
+    with test_profiler.section('update'):
+        pass
+    assert test_profiler.samples == {}
+    assert test_profiler.section('update') is test_profiler.section('draw')
+
+
+def test_hiding_overlay_disables_profiler():
+    test_profiler = Profiler()
+    test_profiler.toggle_overlay()
+    assert test_profiler.enabled
+    test_profiler.toggle_overlay()
+    assert not test_profiler.enabled
+
+    test_profiler.dump_path = 'profile.json'
+    test_profiler.enabled = True
+    test_profiler.toggle_overlay()
+    test_profiler.toggle_overlay()
+    assert test_profiler.enabled
+
+
+def test_rolling_window_and_stats():
+    test_profiler = Profiler(window=10)
+    for duration_us in range(1, 21):
+        test_profiler.record('update', duration_us * 1000)
+    stats = test_profiler.get_stats()['update']
+    assert stats['count'] == 10
+    assert stats['max_ms'] == pytest.approx(0.020)
+    assert stats['p50_ms'] == pytest.approx(0.015)
+    assert stats['histogram'][0] == 10
+
+
+@pytest.mark.parametrize('suffix', ['.json', '.csv'])
+def test_dump(tmp_path, suffix):
+    test_profiler = Profiler()
+    test_profiler.enabled = True
+    with test_profiler.section('draw'):
+        pass
+    path = tmp_path / f'profile{suffix}'
+    test_profiler.dump(path)
+    if suffix == '.json':
+        assert 'draw' in json.loads(path.read_text(encoding='utf-8'))['sections']
+    else:
+        rows = list(csv.reader(path.open(encoding='utf-8')))
+        assert rows[1][0] == 'draw'
+
+
+def test_sprite_manager_sections(mocker):
+    pygame.init()
+    pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    mocker.patch.object(profiler, 'enabled', True)
+    mocker.patch.object(profiler, 'samples', {})
+    manager = SpriteManager()
+    manager.init_level()
+    for ball in manager.balls:
+        ball.active = True
+    manager.update(settings.PHYSICS_TIME_STEP, pygame.key.get_pressed())
+    assert {'update.balls', 'update.player', 'ball.handle_collisions'} <= set(profiler.samples)
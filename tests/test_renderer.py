@@ -0,0 +1,72 @@
+import pytest
+import pygame
+
+from unittest.mock import Mock
+from breakout_game.config import settings
+from breakout_game.sprites import SpriteManager
+from breakout_game.screens.renderer import DirtyRectRenderer, merge_rects
+
+
+@pytest.fixture(autouse=True)
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+
+
+@pytest.fixture
+def display():
+    pygame.init()
+    return pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+
+
+@pytest.fixture
+def background():
+    background = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    background.fill((40, 80, 120))
+    pygame.draw.line(background, (200, 10, 10), (0, 0), (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), 5)
+    return background
+
+
+def draw_full(manager, background):
+    surface = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    surface.blit(background, (0, 0))
+    manager.draw_all(surface)
+    return surface
+
+
+def test_merge_rects():
+    rects = merge_rects([pygame.Rect(0, 0, 10, 10), pygame.Rect(5, 5, 10, 10), pygame.Rect(50, 50, 5, 5)])
+    assert rects == [pygame.Rect(0, 0, 15, 15), pygame.Rect(50, 50, 5, 5)]
+
+
+def test_dirty_frames_match_full_redraw(display, background):
+    manager = SpriteManager(seed=0)
+    manager.init_level()
+    for ball in manager.balls:
+        ball.active = True
+    renderer = DirtyRectRenderer()
+    surface = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+
+    assert renderer.draw(surface, background, manager.get_draw_list()) == [surface.get_rect()]
+    keys = pygame.key.get_pressed()
+    for _ in range(200):
+        manager.update(settings.PHYSICS_TIME_STEP, keys)
+        dirty_rects = renderer.draw(surface, background, manager.get_draw_list())
+        assert sum(rect.width * rect.height for rect in dirty_rects) < settings.NUM_PIXELS
+    expected = draw_full(manager, background)
+    assert pygame.image.tobytes(surface, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+
+
+def test_no_changes_no_dirty_rects(display, background):
+    manager = SpriteManager(seed=0)
+    manager.init_level()
+    renderer = DirtyRectRenderer()
+    surface = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    renderer.draw(surface, background, manager.get_draw_list())
+    assert renderer.draw(surface, background, manager.get_draw_list()) == []
+
+    block = next(iter(manager.block_field))
+    block.kill()
+    assert renderer.draw(surface, background, manager.get_draw_list()) == [block.rect]
+
+    renderer.invalidate()
+    assert renderer.draw(surface, background, manager.get_draw_list()) == [surface.get_rect()]
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+import pygame
+
+from breakout_game.replay import Replay, encode_keys, decode_keys, play_headless
+from breakout_game.simulation import Simulation, InputState
+from breakout_game.utils.asset_cache import asset_cache
+
+
+def test_encode_decode_keys():
+    keys = InputState([pygame.K_LEFT, pygame.K_SPACE, pygame.K_ESCAPE, pygame.K_a])
+    decoded = decode_keys(encode_keys(keys))
+    assert decoded.keys == {pygame.K_LEFT, pygame.K_SPACE}
+
+
+def test_save_load(tmp_path):
+    replay = Replay(seed=42, level_difficulty=2, level=1)
+    for mask in [0] * 70000 + [1, 1, 4, 0]:
+        replay.masks.append(mask)
+    path = tmp_path / 'session.replay'
+    replay.save(path)
+    loaded = Replay.load(path)
+    assert (loaded.seed, loaded.level_difficulty, loaded.level, loaded.tick_rate) == (42, 2, 1, replay.tick_rate)
+    assert loaded.masks == replay.masks
+    # Run-length encoded: much smaller than one byte per step
+    assert path.stat().st_size < 100
+
+
+def test_load_wrong_file(tmp_path):
+    path = tmp_path / 'wrong.replay'
+    path.write_bytes(b'x' * 64)
+    with pytest.raises(ValueError):
+        Replay.load(path)
+
+
+def test_play_headless_is_deterministic():
+    rng = random.Random(0)
+    keys = [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE]
+    replay = Replay(seed=7, level_difficulty=1)
+    with Simulation(level_difficulty=1, seed=7) as simulation:
+        for _ in range(3000):
+            inputs = InputState([rng.choice(keys)])
+            replay.record(inputs)
+            simulation.step(inputs, 1 / replay.tick_rate)
+
+    replayed = play_headless(replay)
+    assert asset_cache.headless is False
+    assert replayed.sprite_manager.score.score == simulation.sprite_manager.score.score
+    assert replayed.sprite_manager.player.rect == simulation.sprite_manager.player.rect
+    assert [ball.rect for ball in replayed.sprite_manager.balls] == \
+           [ball.rect for ball in simulation.sprite_manager.balls]
@@ -0,0 +1,80 @@
+import pytest
+import pygame
+
+from breakout_game.config import settings
+from breakout_game.simulation import Simulation, InputState
+from breakout_game.utils import path_utils
+from breakout_game.utils.asset_cache import asset_cache, NullSound
+from breakout_game.utils.mixer_wrapper import sound_bank, NullChannel
+
+
+@pytest.fixture
+def simulation():
+    with Simulation() as simulation:
+        yield simulation
+
+
+def test_close_restores_headless_mode():
+    simulation = Simulation()
+    assert asset_cache.headless is True
+    simulation.close()
+    assert asset_cache.headless is False
+    simulation.close()
+    assert asset_cache.headless is False
+
+
+def test_input_state():
+    inputs = InputState([pygame.K_SPACE])
+    assert inputs[pygame.K_SPACE]
+    assert not inputs[pygame.K_LEFT]
+
+
+@pytest.mark.parametrize('level', range(settings.LAST_LEVEL + 1))
+def test_level_background_exists(level):
+    assert path_utils.get_asset_path(f'images/background/level-{level}.jpg').is_file()
+
+
+def test_headless_assets(simulation):
+    assert isinstance(sound_bank.get_sound('lost-hp'), NullSound)
+    assert isinstance(sound_bank.get_sound('hit-paddle'), NullSound)
+    assert all(isinstance(voice.channel, NullChannel) for voice in sound_bank.get_voices())
+
+
+def test_step_launches_ball(simulation):
+    ball = simulation.sprite_manager.balls[0]
+    simulation.step([], 1 / 60)
+    assert ball.active is False
+    simulation.step([pygame.K_SPACE], 1 / 60)
+    assert ball.active is True
+    for _ in range(100):
+        simulation.step([pygame.K_LEFT], 1 / 60)
+    assert simulation.frame == 102
+    assert simulation.elapsed_time == pytest.approx(102 / 60)
+
+
+def test_next_level(simulation):
+    for block in simulation.sprite_manager.block_field:
+        block.kill()
+    simulation.step([], 1 / 60)
+    assert simulation.level == 1
+    assert simulation.level_finished is True
+    simulation.step([], 1 / 60)
+    assert simulation.level_finished is False
+    assert len(simulation.sprite_manager.block_field) > 0
+    assert simulation.game_over is False
+
+
+def test_game_over(simulation):
+    simulation.sprite_manager.player.health = 0
+    simulation.step([], 1 / 60)
+    assert simulation.game_over is True
+    simulation.step([], 1 / 60)
+    assert simulation.frame == 1
+
+
+def test_last_level(simulation):
+    simulation.level = settings.LAST_LEVEL
+    for block in simulation.sprite_manager.block_field:
+        block.kill()
+    simulation.step([], 1 / 60)
+    assert simulation.game_over is True
@@ -5,7 +5,8 @@ from breakout_game.config import settings
 
 from unittest.mock import Mock
 from breakout_game.sprites.sprite_manager import SpriteManager
-from breakout_game.sprites.sprite import Player, Score, Scoreboard, Ball, Block, Heart
+from breakout_game.sprites.sprite import Player, Score, Scoreboard, Ball, Heart
+from breakout_game.sprites.block_field import Block
 
 
 @pytest.fixture(autouse=True)
@@ -37,10 +38,10 @@ def test_level(manager):
     assert isinstance(manager.player, Player)
     assert isinstance(manager.balls[0], Ball)
     assert isinstance(manager.hearts[0], Heart)
-    assert isinstance(manager.blocks[0], Block)
+    assert isinstance(next(iter(manager.block_field)), Block)
 
     assert len(manager.balls) == 1
-    assert len(manager.blocks) == number_of_blocks
+    assert len(manager.block_field) == number_of_blocks
     assert len(manager.power_ups) == 0
     assert len(manager.power_up_infos) == 0
 
@@ -62,11 +63,13 @@ def test_create_heart(manager):
 
 
 def test_create_block(manager):
-    original_blocks = len(manager.blocks)
-    manager.create_block(3, 10, 10)
-    manager.create_block(1, 20, 20)
-    manager.create_block(5, 30, 30)
-    assert len(manager.blocks) == original_blocks + 3
+    manager.block_field.reset(3, 3)
+    manager.create_block(3, 0, 0)
+    manager.create_block(1, 1, 1)
+    block = manager.create_block(5, 2, 2)
+    assert len(manager.block_field) == 3
+    assert block.health == 5
+    assert block.rect.size == (settings.BLOCK_WIDTH, settings.BLOCK_HEIGHT)
 
 
 def test_create_player(manager):
@@ -94,3 +97,118 @@ def test_create_powerup_timer_info(manager):
     manager.create_powerup_timer_info("power", 5)
     assert len(manager.power_up_infos) == 1
 
+
+def test_powerup_timer_info_renders_tenths(manager):
+    manager.create_powerup_timer_info("power", 5)
+    powerup_info = manager.power_up_infos[0]
+    powerup_info.update()
+    assert powerup_info.rendered_time_left == '5.0'
+    image = powerup_info.image
+    manager.clock.advance(0.05)
+    powerup_info.update()
+    assert powerup_info.rendered_time_left == '5.0'
+    assert powerup_info.image is image
+    manager.clock.advance(0.06)
+    powerup_info.update()
+    assert powerup_info.rendered_time_left == '4.9'
+
+
+
+def test_create_block_images(manager):
+    block_images = manager.get_block_images()
+    assert set(block_images.keys()) == set(settings.COLOR_LEGEND.keys())
+    for image in block_images.values():
+        assert image.get_size() == (settings.BLOCK_WIDTH, settings.BLOCK_HEIGHT)
+
+
+def test_block_image_changes_on_damage(manager):
+    block = manager.create_block(3, 0, 0)
+    assert block.image is manager.block_images[3]
+    block.get_damage(1)
+    assert block.image is manager.block_images[2]
+
+
+@pytest.mark.parametrize("collision_mode, block_hit", [("discrete", False), ("swept", True)])
+def test_fast_ball_tunneling(manager, monkeypatch, collision_mode, block_hit):
+    monkeypatch.setattr(settings, "BALL_COLLISION_MODE", collision_mode)
+    block = manager.create_block(7, 5, 5)
+    manager.create_ball(midbottom=(block.rect.centerx, block.rect.bottom + 50), angle_radians=-math.pi / 2,
+                        speed=100000, active=True)
+    ball = manager.balls[-1]
+    ball.update(0.002, pygame.key.get_pressed())
+
+    assert (block.health < 7) is block_hit
+    if block_hit:
+        assert ball.direction.y > 0
+        assert ball.rect.top >= block.rect.bottom
+
+
+def test_swept_ball_bounces_off_frame(manager, monkeypatch):
+    monkeypatch.setattr(settings, "BALL_COLLISION_MODE", "swept")
+    manager.create_ball(midbottom=(settings.GAME_WINDOW_WIDTH - 100, settings.GAME_WINDOW_HEIGHT - 100),
+                        angle_radians=0, speed=1000, active=True)
+    ball = manager.balls[-1]
+    ball.update(0.5, pygame.key.get_pressed())
+    assert ball.direction.x < 0
+    assert ball.rect.right <= settings.GAME_WINDOW_WIDTH
+
+
+def test_update_advances_clock(manager):
+    manager.update(0.5, pygame.key.get_pressed())
+    assert manager.clock.now() == pytest.approx(0.5)
+
+
+def test_interpolated_position(manager):
+    ball = manager.balls[0]
+    ball.store_previous_position()
+    ball.position.x += 10
+    assert ball.get_interpolated_position(0.5)[0] == round(ball.previous_position.x + 5)
+    assert ball.get_interpolated_position(1) == (round(ball.position.x), round(ball.position.y))
+
+
+def test_killed_ball_is_reused(manager):
+    manager.create_ball(midbottom=(10, 100), angle_radians=0, speed=5, active=True)
+    ball = manager.balls[-1]
+    original_image = ball.original_image
+    ball.change_strength(2)
+    ball.kill()
+    ball.kill()
+    assert ball not in manager.balls
+    assert manager.ball_pool.free == [ball]
+
+    manager.create_ball(midbottom=(50, 200), angle_radians=math.pi / 2, speed=7)
+    assert manager.balls[-1] is ball
+    assert ball.alive()
+    assert ball.original_image is original_image
+    assert ball.rect.midbottom == (50, 200)
+    assert ball.position == pygame.math.Vector2(ball.rect.topleft)
+    assert ball.speed == ball.original_speed == 7
+    assert ball.strength == 1
+    assert ball.active is False
+    assert manager.ball_pool.free == []
+
+
+def test_killed_powerups_are_reused(manager):
+    manager.create_powerup((10, 10), "big-ball")
+    manager.create_powerup_timer_info("big-ball", 5)
+    power_up, powerup_info = manager.power_ups[0], manager.power_up_infos[0]
+    power_up.kill()
+    powerup_info.kill()
+    assert manager.power_ups == [] and manager.power_up_infos == []
+
+    manager.create_powerup((20, 20), "fast-ball")
+    manager.create_powerup_timer_info("fast-ball", 10)
+    assert manager.power_ups == [power_up]
+    assert power_up.power == "fast-ball"
+    assert power_up.rect.center == (20, 20)
+    assert manager.power_up_infos == [powerup_info]
+    assert powerup_info.power_name == "fast-ball"
+    assert powerup_info.powerup_time == 10
+
+
+def test_clear_moving_sprites(manager):
+    manager.create_powerup((10, 10), "big-ball")
+    manager.clear_moving_sprites()
+    assert len(manager.ball_sprites_group) == 0 and len(manager.power_up_sprites_group) == 0
+    assert manager.balls == [] and manager.power_ups == []
+    assert len(manager.ball_pool.free) == 1 and len(manager.power_up_pool.free) == 1
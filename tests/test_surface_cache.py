@@ -0,0 +1,63 @@
+import pytest
+import pygame
+
+from unittest.mock import Mock
+from breakout_game.config import settings
+from breakout_game.sprites import SpriteManager
+from breakout_game.utils.surface_cache import SurfaceCache
+
+
+@pytest.fixture(autouse=True)
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+
+
+@pytest.fixture
+def base():
+    surface = pygame.Surface((8, 8))
+    surface.fill((10, 20, 30))
+    return surface
+
+
+def test_variant_shared(base):
+    cache = SurfaceCache()
+    variant = cache.get_variant(base, (16, 16), (125, 0, 0))
+    assert variant.get_size() == (16, 16)
+    assert variant.get_at((0, 0))[:3] == (135, 20, 30)
+    assert cache.get_variant(base, (16, 16), (125, 0, 0)) is variant
+    assert cache.get_variant(base, (16, 16)) is not variant
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert base.get_at((0, 0))[:3] == (10, 20, 30)
+
+
+def test_base_returned_unchanged(base):
+    cache = SurfaceCache()
+    assert cache.get_variant(base) is base
+    assert cache.get_variant(base, (8, 8)) is base
+    assert cache.stats()['variants'] == 0
+
+
+def test_purge(base):
+    cache = SurfaceCache()
+    variant = cache.get_variant(base, (4, 4))
+    cache.purge()
+    assert cache.get_variant(base, (4, 4)) is not variant
+    assert cache.misses == 2
+
+
+def test_restore_size_from_original():
+    pygame.init()
+    pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    sprite_manager = SpriteManager()
+    sprite_manager.init_level()
+    for _ in range(2):
+        sprite_manager.powerup_manager.activate_powerup('multiply-balls')
+    sprite_manager.powerup_manager.activate_powerup('small-ball')
+    sprite_manager.powerup_manager.activate_powerup('big-paddle')
+    balls = sprite_manager.ball_sprites_group.sprites()
+    assert len({id(ball.image) for ball in balls}) == 1
+
+    sprite_manager.powerup_manager.deactivate_ball_size()
+    sprite_manager.powerup_manager.deactivate_paddle_size()
+    assert all(ball.image is ball.original_image for ball in balls)
+    assert sprite_manager.player.image is sprite_manager.player.original_image
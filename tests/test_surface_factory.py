@@ -0,0 +1,73 @@
+import pytest
+import pygame
+
+from unittest.mock import Mock
+from breakout_game.config import settings
+from breakout_game.sprites import SpriteManager
+from breakout_game.utils.asset_cache import asset_cache
+from breakout_game.utils.surface_factory import SurfaceFactory, surface_factory
+
+
+@pytest.fixture(autouse=True)
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.init()
+    pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+
+
+@pytest.fixture
+def foreign_image():
+    return pygame.image.load(settings.COLOR_LEGEND[1])
+
+
+def test_native_converts_once(foreign_image):
+    factory = SurfaceFactory()
+    assert factory.is_native(foreign_image) is False
+    converted = factory.native(foreign_image)
+    assert factory.is_native(converted)
+    assert factory.native(foreign_image) is converted
+    assert factory.native(converted) is converted
+    assert factory.stats()['conversions'] == 1
+
+
+def test_new_surface_native():
+    factory = SurfaceFactory()
+    assert factory.is_native(factory.new_surface((4, 4)))
+    assert factory.is_native(factory.new_surface((4, 4), alpha=True))
+
+
+def test_headless_not_converted(foreign_image):
+    factory = SurfaceFactory()
+    asset_cache.set_headless(True)
+    try:
+        assert factory.native(foreign_image) is foreign_image
+    finally:
+        asset_cache.set_headless(False)
+
+
+def test_check_blits_in_debug_mode(foreign_image):
+    factory = SurfaceFactory()
+    factory.check_blits([foreign_image])
+    assert factory.non_native_blits == 0
+    factory.debug = True
+    factory.check_blits([foreign_image, factory.native(foreign_image), foreign_image])
+    assert factory.non_native_blits == 2
+
+
+def test_sprite_images_native(foreign_image):
+    sprite_manager = SpriteManager()
+    sprite_manager.init_level()
+    sprite_manager.create_ball(ball_image=foreign_image)
+    sprite_manager.create_powerup((100, 100), 'big-ball')
+    surface_factory.debug = True
+    try:
+        non_native_blits = surface_factory.non_native_blits
+        sprite_manager.get_draw_list()
+        assert surface_factory.non_native_blits == non_native_blits
+    finally:
+        surface_factory.debug = False
+    assert all(surface_factory.is_native(image) for image in sprite_manager.get_block_images().values())
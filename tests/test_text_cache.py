@@ -0,0 +1,63 @@
+import pytest
+import pygame
+
+from unittest.mock import Mock
+from breakout_game.config import settings
+from breakout_game.sprites import SpriteManager
+from breakout_game.utils.text_cache import TextCache
+
+
+@pytest.fixture(autouse=True)
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+
+
+@pytest.fixture
+def font():
+    pygame.init()
+    return pygame.font.Font(settings.GAME_FONT, settings.SCORE_FONT_SIZE)
+
+
+def test_render_memoized(font):
+    cache = TextCache()
+    surface = cache.render(font, 'Score', (255, 255, 255))
+    assert cache.render(font, 'Score', (255, 255, 255)) is surface
+    assert cache.render(font, 'Score', (255, 0, 0)) is not surface
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_lru_eviction(font):
+    cache = TextCache(max_size=2)
+    first = cache.render(font, 'A', (255, 255, 255))
+    cache.render(font, 'B', (255, 255, 255))
+    assert cache.render(font, 'A', (255, 255, 255)) is first
+    cache.render(font, 'C', (255, 255, 255))
+    assert cache.render(font, 'A', (255, 255, 255)) is first
+    assert cache.misses == 3
+    cache.render(font, 'B', (255, 255, 255))
+    assert cache.misses == 4
+
+
+def test_render_field_matches_font_render(font):
+    cache = TextCache()
+    # No kerning pairs in the text, so the composition is the same as the whole string
+    text = cache.render_field(font, 'Score: ', '1230', (255, 255, 255))
+    expected = font.render('Score: 1230', True, (255, 255, 255))
+    assert text.get_size() == expected.get_size()
+    assert (pygame.image.tobytes(text, 'RGBA')[3::4] == pygame.image.tobytes(expected, 'RGBA')[3::4])
+    assert cache.render_field(font, 'Score: ', '1230', (255, 255, 255)) is text
+
+
+def test_score_rendered_only_on_change():
+    pygame.init()
+    pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    manager = SpriteManager()
+    manager.init_level()
+    manager.score.update()
+    image = manager.score.image
+    manager.score.update()
+    assert manager.score.image is image
+    manager.score.add_score(10)
+    manager.score.update()
+    assert manager.score.image is not image
+    assert manager.score.rendered_score == 10
@@ -0,0 +1,55 @@
+import hashlib
+import json
+import pytest
+import pygame
+
+from unittest.mock import Mock
+from breakout_game.config import settings
+from breakout_game.utils.texture_atlas import (
+    TextureAtlas, ATLAS_MANIFEST_PATH, build_atlas, get_atlas_sources, pack_images
+)
+
+
+@pytest.fixture(autouse=True)
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.init()
+    pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+
+
+def test_atlas_up_to_date():
+    manifest = json.loads(ATLAS_MANIFEST_PATH.read_text(encoding='utf-8'))
+    sources = get_atlas_sources()
+    assert manifest['sources'] == {name: hashlib.sha1(path.read_bytes()).hexdigest() for name, path in sources.items()}
+
+
+def test_pack_images_without_overlap():
+    sizes = {'a': (30, 20), 'b': (40, 10), 'c': (50, 25), 'd': (20, 20)}
+    regions, height = pack_images(sizes, width=64)
+    rects = [pygame.Rect(region) for region in regions.values()]
+    assert all(rect.right <= 64 and rect.bottom <= height for rect in rects)
+    assert not any(rect.colliderect(other) for i, rect in enumerate(rects) for other in rects[i + 1:])
+
+
+def test_build_and_slice(tmp_path):
+    sources = get_atlas_sources()
+    atlas = TextureAtlas(tmp_path / 'atlas.png', tmp_path / 'atlas.json')
+    build_atlas(sources, atlas.image_path, atlas.manifest_path)
+    path = settings.POWERS['big-ball']['path']
+    image = atlas.get_image(path)
+    assert image.get_parent() is atlas.sheet
+    assert image.get_bitsize() == pygame.display.get_surface().get_bitsize()
+    assert pygame.image.tobytes(image, 'RGBA') == pygame.image.tobytes(pygame.image.load(path), 'RGBA')
+    assert atlas.get_image(path) is image
+    assert atlas.get_image(path, size=(10, 10)).get_size() == (10, 10)
+
+
+def test_missing_atlas_falls_back_to_files(tmp_path):
+    atlas = TextureAtlas(tmp_path / 'atlas.png', tmp_path / 'atlas.json')
+    image = atlas.get_image(settings.COLOR_LEGEND[1], size=(settings.BLOCK_WIDTH, settings.BLOCK_HEIGHT))
+    assert atlas.sheet is None
+    assert image.get_size() == (settings.BLOCK_WIDTH, settings.BLOCK_HEIGHT)